@@ -5,13 +5,12 @@ requirements of "Calendrical Calculations" by Reingold and Dershowitz.
 """
 
 from typing import Callable
-from decimal import Decimal, getcontext
+from decimal import Decimal, getcontext, localcontext
+from functools import lru_cache
 import math
-import mpmath 
 
 ctx = getcontext()
 ctx.prec = 30  # set desired precision
-mpmath.mp.dps = 30  # Set precision to match your Decimal context
 
 # High-precision PI (truncate/extend to your needed precision)
 PI = Decimal('3.14159265358979323846264338327950288419716939937510')
@@ -52,17 +51,121 @@ def sqrt(x: Decimal) -> Decimal:
             return better_guess
         guess = better_guess# Add these utility functions
         
+# Trigonometry ###################################################################################################
+# Computed natively in Decimal at the precision of the current context: the argument is reduced
+# by a multiple of pi/2 to |r| <= pi/4 and the Taylor series of sin or cos is evaluated for r
+# with coefficients cached per precision.
+_TRIG_GUARD_DIGITS = 5
+
+@lru_cache(maxsize=None)
+def _half_pi(prec: int) -> Decimal:
+    """pi/2 to prec digits (cached per precision)"""
+    with localcontext() as lctx:
+        lctx.prec = prec + 2
+        lasts, t, s, n, na, d, da = 0, Decimal(3), 3, 1, 0, 0, 24
+        while s != lasts:
+            lasts = s
+            n, na = n + na, na + 8
+            d, da = d + da, da + 32
+            t = (t * n) / d
+            s += t
+        lctx.prec = prec
+        return +(s / 2)
+
+@lru_cache(maxsize=None)
+def _taylor_coefficients(prec: int) -> tuple[tuple[Decimal, ...], tuple[Decimal, ...]]:
+    """(-1)**k/(2k+1)! and (-1)**k/(2k)! in descending k, enough terms for |r| <= pi/4 at prec digits"""
+    with localcontext() as lctx:
+        lctx.prec = prec
+        limit = Decimal(10) ** -(prec + 1)
+        sin_c, cos_c = [], []
+        factorial, n = 1, 0
+        while True:
+            c = Decimal((-1) ** (n // 2)) / factorial
+            (cos_c if n % 2 == 0 else sin_c).append(c)
+            if n % 2 == 1 and abs(c) * Decimal("0.7854") ** n < limit:
+                break
+            n += 1
+            factorial *= n
+        return tuple(reversed(sin_c)), tuple(reversed(cos_c))
+
+def _sin_series(r: Decimal) -> Decimal:
+    """Taylor series of sin(r), |r| <= pi/4, by Horner's method in r**2"""
+    r2 = r * r
+    coefficients = _taylor_coefficients(getcontext().prec)[0]
+    total = coefficients[0]
+    for c in coefficients[1:]:
+        total = total * r2 + c
+    return total * r
+
+def _cos_series(r: Decimal) -> Decimal:
+    """Taylor series of cos(r), |r| <= pi/4, by Horner's method in r**2"""
+    r2 = r * r
+    coefficients = _taylor_coefficients(getcontext().prec)[1]
+    total = coefficients[0]
+    for c in coefficients[1:]:
+        total = total * r2 + c
+    return total
+
+def _reduce_quadrant(x: Decimal) -> tuple[Decimal, int]:
+    """
+    Return (r, q) with x = r + k * pi/2, |r| <= pi/4 and q = k mod 4, r to the context precision.
+    Must be called inside a local context, whose precision is temporarily raised.
+    """
+    lctx = getcontext()
+    prec = lctx.prec
+    # Extra digits absorb the integer part of k and any cancellation when x is close to k * pi/2
+    integer_digits = max(x.adjusted(), 0)
+    extra = integer_digits
+    while True:
+        lctx.prec = prec + extra
+        half_pi = _half_pi(lctx.prec)
+        k = (x / half_pi).to_integral_value()
+        r = x - k * half_pi
+        lctx.prec = prec
+        if k == 0:
+            return x, 0
+        lost = -r.adjusted() if r else 0
+        if lost <= 0 or extra >= integer_digits + lost or lost > prec:
+            return r, int(k % 4)
+        extra = integer_digits + lost
+
+def _sin_cos_quadrant(x: Decimal, q_offset: int) -> Decimal:
+    """sin(x + q_offset * pi/2) at the precision of the current context"""
+    with localcontext() as lctx:
+        prec = lctx.prec
+        lctx.prec = prec + _TRIG_GUARD_DIGITS
+        r, q = _reduce_quadrant(decimal_(x))
+        q = (q + q_offset) % 4
+        if q == 0:
+            result = _sin_series(r)
+        elif q == 1:
+            result = _cos_series(r)
+        elif q == 2:
+            result = -_sin_series(r)
+        else:
+            result = -_cos_series(r)
+        lctx.prec = prec
+        return +result
+
 def sin(x: Decimal) -> Decimal:
     """Calculate sine of x (in radians) with high precision"""
-    return Decimal(str(mpmath.sin(mpmath.mpf(str(x)))))
+    return _sin_cos_quadrant(x, 0)
 
 def cos(x: Decimal) -> Decimal:
     """Calculate cosine of x (in radians) with high precision"""
-    return Decimal(str(mpmath.cos(mpmath.mpf(str(x)))))
+    return _sin_cos_quadrant(x, 1)
 
 def tan(x: Decimal) -> Decimal:
     """Calculate tangent of x (in radians) with high precision"""
-    return Decimal(str(mpmath.tan(mpmath.mpf(str(x)))))
+    with localcontext() as lctx:
+        prec = lctx.prec
+        lctx.prec = prec + _TRIG_GUARD_DIGITS
+        r, q = _reduce_quadrant(decimal_(x))
+        sin_r, cos_r = _sin_series(r), _cos_series(r)
+        result = sin_r / cos_r if q % 2 == 0 else -cos_r / sin_r
+        lctx.prec = prec
+        return +result
 
 def sign(x: Decimal) -> int:
     """Return the sign of x: -1 for negative, 0 for zero, 1 for positive"""
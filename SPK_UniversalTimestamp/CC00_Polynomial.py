@@ -0,0 +1,70 @@
+"""
+Polynomials with coefficients parsed once and evaluated by Horner's method.
+
+The astronomical series of "Calendrical Calculations" by Reingold and Dershowitz
+are polynomials in Julian centuries (or years).  Writing them as Polynomial
+constants moves the Decimal literal parsing to import time and replaces the
+c**2 ... c**n powers with n multiplications.  The same coefficients can be
+evaluated in Decimal, float or over NumPy arrays.
+"""
+from decimal import Decimal
+from typing import Sequence
+
+from .CC00_Decimal_library import decimal_
+
+
+# "Calendrical Calculations" poly(x, a) = a0 + a1*x + ... + an*x**n
+def poly(x, coefficients: Sequence):
+    """Evaluate a polynomial, coefficients in ascending order, by Horner's method"""
+    result = coefficients[-1]
+    for coefficient in coefficients[-2::-1]:
+        result = result * x + coefficient
+    return result
+
+
+class Polynomial:
+    """
+    Polynomial a0 + a1*x + ... + an*x**n.
+    Coefficients are given in ascending order as Decimal, int, float or str.
+    """
+    coefficients: tuple[Decimal, ...]
+    float_coefficients: tuple[float, ...]
+    # IMMUTABLE ##################################################################################################
+    __slots__ = ("coefficients", "float_coefficients")
+
+    def __setattr__(self, name, value):
+        """Prevent modification of attributes after initialization"""
+        if hasattr(self, name):
+            raise AttributeError(f"Cannot modify attribute '{name}' of Polynomial")
+        super().__setattr__(name, value)
+        return
+
+    # CONSTRUCTOR ################################################################################################
+    def __init__(self, *coefficients: Decimal | int | float | str):
+        if len(coefficients) == 0:
+            raise ValueError("Polynomial requires at least one coefficient")
+        self.coefficients = tuple(decimal_(c) for c in coefficients)
+        self.float_coefficients = tuple(float(c) for c in self.coefficients)
+        return
+
+    # EVALUATION #################################################################################################
+    def __call__(self, x: Decimal | int) -> Decimal:
+        """Evaluate in Decimal"""
+        return poly(x, self.coefficients)
+
+    def evaluate_float(self, x: float) -> float:
+        """Evaluate in float, x may also be a NumPy array"""
+        return poly(x, self.float_coefficients)
+
+    def evaluate_array(self, x):
+        """Evaluate element-wise over an array-like, returning a float64 NumPy array"""
+        import numpy as np
+        return poly(np.asarray(x, dtype=np.float64), self.float_coefficients)
+
+    @property
+    def degree(self) -> int:
+        return len(self.coefficients) - 1
+
+    # FORMATTING #################################################################################################
+    def __repr__(self) -> str:
+        return f"Polynomial({', '.join(repr(str(c)) for c in self.coefficients)})"
@@ -0,0 +1,202 @@
+"""
+NumPy vectorized companions to CC14_Time_and_Astronomy.
+
+The functions here accept array-likes of R.D. moments and evaluate the same
+"Calendrical Calculations" formulas in float64.  They are intended for dense
+sampling grids (plots, analyses) where the Decimal precision of the scalar
+functions is not required.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from .CC14_Time_and_Astronomy import (
+    _ephemeris_correction_table,
+    _j2000,
+    mean_synodic_month,
+    nth_new_moon,
+    Table_14_1,
+    Table_14_3,
+    Table_14_4,
+    Table_14_5,
+    _SOLAR_LONGITUDE_MEAN,
+    _NUTATION_A,
+    _NUTATION_B,
+    _ABERRATION_ARGUMENT,
+    _NEW_MOON_APPROX,
+    _NEW_MOON_E,
+    _NEW_MOON_SOLAR_ANOMALY,
+    _NEW_MOON_LUNAR_ANOMALY,
+    _NEW_MOON_ARGUMENT,
+    _NEW_MOON_SIGMA,
+    _NEW_MOON_EXTRA_ARGUMENT,
+    _NEW_MOON_EXTRA,
+    _LUNAR_LONGITUDE_E,
+    _LUNAR_LONGITUDE_VENUS,
+    _LUNAR_LONGITUDE_JUPITER,
+    _MEAN_LUNAR_LONGITUDE,
+    _LUNAR_ELONGATION,
+    _SOLAR_ANOMALY,
+    _LUNAR_ANOMALY,
+    _MOON_NODE,
+    _EPH_C_OTHERWISE,
+    _SECONDS_PER_DAY,
+)
+
+_DEG2RAD = np.pi / 180
+_J2000 = float(_j2000())
+_MEAN_SYNODIC_MONTH = float(mean_synodic_month())
+
+
+# p 61 (2.21) vectorized
+def gregorian_year_from_rd_array(rd) -> np.ndarray:
+    """Gregorian year for each R.D. (fractional parts are floored)"""
+    d0 = np.floor(np.asarray(rd, dtype=np.float64)).astype(np.int64) - 1
+    n400, d1 = np.divmod(d0, 146097)
+    n100, d2 = np.divmod(d1, 36524)
+    n4, d3 = np.divmod(d2, 1461)
+    n1 = d3 // 365
+    year = 400 * n400 + 100 * n100 + 4 * n4 + n1
+    return np.where((n100 != 4) & (n1 != 4), year + 1, year)
+
+
+@lru_cache(maxsize=None)
+def _ephemeris_table_arrays() -> tuple[np.ndarray, np.ndarray]:
+    """The yearly ΔT table of CC14 as float64 arrays (year_starts, corrections)"""
+    year_starts, corrections = _ephemeris_correction_table()
+    return (
+        np.array(year_starts, dtype=np.float64),
+        np.array([float(c) for c in corrections], dtype=np.float64),
+    )
+
+
+# p 210 (14.15) vectorized
+def ephemeris_correction_array(moments_rd, interpolate: bool = False) -> np.ndarray:
+    """
+    Ephemeris correction (fraction of a day) for each R.D. moment.
+
+    Args:
+        moments_rd: array-like of R.D. moments
+        interpolate: False gives the yearly step values of ephemeris_correction;
+            True interpolates linearly between the yearly values taken at mid-year,
+            giving a continuous curve inside the tabulated years.
+    """
+    moments = np.asarray(moments_rd, dtype=np.float64)
+    year_starts, corrections = _ephemeris_table_arrays()
+    if interpolate:
+        mid_years = (year_starts[:-1] + year_starts[1:]) / 2
+        result = np.interp(moments, mid_years, corrections)
+    else:
+        ndx = np.searchsorted(year_starts, moments, side="right") - 1
+        result = corrections[np.clip(ndx, 0, len(corrections) - 1)]
+    # Outside the table only the parabolic branch (_eph_c_otherwise) applies
+    outside = (moments < year_starts[0]) | (moments >= year_starts[-1])
+    if np.any(outside):
+        year = gregorian_year_from_rd_array(moments[outside])
+        # Centuries from 1820, as _eph_y_1820
+        y = (year - 1820) / 100
+        result = np.array(result, dtype=np.float64)
+        result[outside] = _EPH_C_OTHERWISE.evaluate_float(y) / float(_SECONDS_PER_DAY)
+    return result
+
+
+# p 212 (14.16-17) vectorized
+def dynamical_from_universal_array(t_utc) -> np.ndarray:
+    t = np.asarray(t_utc, dtype=np.float64)
+    return t + ephemeris_correction_array(t)
+
+
+def universal_from_dynamical_array(t_d) -> np.ndarray:
+    t = np.asarray(t_d, dtype=np.float64)
+    return t - ephemeris_correction_array(t)  # Approximation
+
+
+# p 212 (14.18) vectorized
+def julian_centuries_array(t_utc) -> np.ndarray:
+    """Julian centuries from J2000 for each R.D. moment, dynamical time"""
+    return (dynamical_from_universal_array(t_utc) - _J2000) / 36525
+
+
+def rd_to_julian_centuries_array(t_rd) -> np.ndarray:
+    """Julian centuries from J2000 for each R.D. moment, no ephemeris correction"""
+    return (np.asarray(t_rd, dtype=np.float64) - _J2000) / 36525
+
+
+# Term tables as arrays, one column per term
+_TABLE_14_1 = np.array([[float(v) for v in row] for row in Table_14_1], dtype=np.float64).T
+_TABLE_14_3 = np.array([[float(v) for v in row] for row in Table_14_3], dtype=np.float64).T
+_TABLE_14_4 = np.array([[float(v) for v in row] for row in Table_14_4], dtype=np.float64).T
+_TABLE_14_5 = np.array(Table_14_5, dtype=np.float64).T
+
+
+# p 223 (14.34) vectorized
+def _nutation_array(c: np.ndarray) -> np.ndarray:
+    return (
+        -0.004778 * np.sin(_DEG2RAD * _NUTATION_A.evaluate_float(c))
+        - 0.0003667 * np.sin(_DEG2RAD * _NUTATION_B.evaluate_float(c))
+    )
+
+
+# p 223 (14.33) vectorized
+def solar_longitude_array(moments_rd) -> np.ndarray:
+    """Solar longitude in degrees for each R.D. moment"""
+    c = rd_to_julian_centuries_array(moments_rd)
+    x_, y_, z_ = _TABLE_14_1
+    # One row per moment, one column per term of Table 14.1
+    terms = np.sin(_DEG2RAD * (y_ + np.multiply.outer(c, z_)))
+    _lambda = _SOLAR_LONGITUDE_MEAN.evaluate_float(c) + (terms @ x_) * 0.000005729577951308232
+    aberration = 0.0000974 * np.cos(_DEG2RAD * _ABERRATION_ARGUMENT.evaluate_float(c)) - 0.005575
+    return np.mod(_lambda + aberration + _nutation_array(c), 360)
+
+
+# p 232 (14.48) vectorized
+def lunar_longitude_array(moments_rd) -> np.ndarray:
+    """Lunar longitude in degrees for each R.D. moment"""
+    c = julian_centuries_array(moments_rd)
+    L_p = np.mod(_MEAN_LUNAR_LONGITUDE.evaluate_float(c), 360)
+    D = np.mod(_LUNAR_ELONGATION.evaluate_float(c), 360)
+    M = np.mod(_SOLAR_ANOMALY.evaluate_float(c), 360)
+    M_p = np.mod(_LUNAR_ANOMALY.evaluate_float(c), 360)
+    F = np.mod(_MOON_NODE.evaluate_float(c), 360)
+    E = _LUNAR_LONGITUDE_E.evaluate_float(c)
+    v_, w_, x_, y_, z_ = _TABLE_14_5
+    # (moments x 4) @ (4 x terms) gives the argument of every term of Table 14.5
+    arguments = np.stack([D, M, M_p, F], axis=-1) @ np.stack([w_, x_, y_, z_])
+    terms = np.power.outer(E, np.abs(x_)) * np.sin(_DEG2RAD * arguments)
+    correction = (terms @ v_) / 1_000_000
+    venus = 3958 * np.sin(_DEG2RAD * _LUNAR_LONGITUDE_VENUS.evaluate_float(c)) / 1_000_000
+    jupiter = 318 * np.sin(_DEG2RAD * _LUNAR_LONGITUDE_JUPITER.evaluate_float(c)) / 1_000_000
+    flat_earth = 1962 * np.sin(_DEG2RAD * (L_p - F)) / 1_000_000
+    return np.mod(L_p + correction + venus + jupiter + flat_earth + _nutation_array(c), 360)
+
+
+# p 229 (14.45) vectorized
+def nth_new_moon_array(n) -> np.ndarray:
+    """Moment of the n-th new moon (n = 0 is the new moon of January 11, 1 C.E.) for each n"""
+    k = np.asarray(n, dtype=np.float64) - 24724
+    c = k / 1236.85
+    approx = _J2000 + 5.09766 + _NEW_MOON_APPROX.evaluate_float(c)
+    E = _NEW_MOON_E.evaluate_float(c)
+    solar_anomaly = _NEW_MOON_SOLAR_ANOMALY.evaluate_float(c)
+    lunar_anomaly = _NEW_MOON_LUNAR_ANOMALY.evaluate_float(c)
+    moon_argument = _NEW_MOON_ARGUMENT.evaluate_float(c)
+    sigma = _NEW_MOON_SIGMA.evaluate_float(c)
+    v_, w_, x_, y_, z_ = _TABLE_14_3
+    arguments = np.stack([solar_anomaly, lunar_anomaly, moon_argument], axis=-1) @ np.stack([x_, y_, z_])
+    terms = np.power.outer(E, w_) * np.sin(_DEG2RAD * arguments)
+    correction = -0.00017 * np.sin(_DEG2RAD * sigma) + terms @ v_
+    extra = 0.000325 * np.sin(_NEW_MOON_EXTRA_ARGUMENT.evaluate_float(c)) + _NEW_MOON_EXTRA.evaluate_float(c)
+    i_, j_, l_ = _TABLE_14_4
+    additional = np.sin(_DEG2RAD * (i_ + np.multiply.outer(k, j_))) @ l_
+    return universal_from_dynamical_array(approx + correction + extra + additional)
+
+
+# p 235 (14.56) vectorized
+def lunar_phase_array(moments_rd) -> np.ndarray:
+    """Lunar phase in degrees (0 new moon, 90 first quarter, 180 full moon, 270 last quarter) for each R.D. moment"""
+    t = np.asarray(moments_rd, dtype=np.float64)
+    phi = np.mod(lunar_longitude_array(t) - solar_longitude_array(t), 360)
+    t0 = float(nth_new_moon(0))
+    n = np.floor((t - t0) / _MEAN_SYNODIC_MONTH + 0.5)
+    phi_p = 360 * np.mod((t - nth_new_moon_array(n)) / _MEAN_SYNODIC_MONTH, 1)
+    return np.where(np.abs(phi - phi_p) > 180, phi_p, phi)
@@ -1,6 +1,9 @@
+from bisect import bisect_right
 from decimal import Decimal
+from functools import lru_cache
+from typing import Callable
+from .CC00_Polynomial import Polynomial
 from .CC00_Decimal_library import round, decimal_, sin, cos, tan, DEG2RAD, sign, PI, mod, mod_interval, MAX, MIN, floor 
-from .Astro_Space import psoEarth
 from .CC02_Gregorian import gregorian_date_difference, gregorian_year_from_rd, gregorian_new_year
 
 
@@ -59,14 +62,13 @@ def hms_from_hours(value: Decimal) -> tuple:
 # p 204 (14.1-5) location class
 class location:
     # __slots__
-    point_on_surface_of_earth: psoEarth
     latitude: Decimal
     longitude: Decimal
     elevation: Decimal
     utc_offset: str
     name: str
     # IMMUTABLE ##################################################################################################
-    __slots__ = ("point_on_surface_of_earth", "latitude", "longitude", "elevation", "utc_offset", "name")
+    __slots__ = ("_point_on_surface_of_earth", "latitude", "longitude", "elevation", "utc_offset", "name")
 
     def __setattr__(self, name, value):
         """Prevent modification of attributes after initialization"""
@@ -87,11 +89,18 @@ class location:
         self.latitude = degrees_from_dms(latitude)
         self.longitude = degrees_from_dms(longitude)
         self.elevation = decimal_(elevation)
-        self.point_on_surface_of_earth = psoEarth(self.latitude, self.longitude, self.elevation)
         self.utc_offset = utc_offset
         self.name = name
         return
 
+    @property
+    def point_on_surface_of_earth(self) -> "psoEarth":
+        """The geodesic point, created on first use so that pyproj and shapely load only when needed"""
+        if not hasattr(self, "_point_on_surface_of_earth"):
+            from .Astro_Space import psoEarth
+            self._point_on_surface_of_earth = psoEarth(self.latitude, self.longitude, self.elevation)
+        return self._point_on_surface_of_earth
+
     # location methods ##########################################################################################
     def direction(self, loc_prime: "location") -> Decimal:
         """Calculate the direction from this location to another location in degrees"""
@@ -218,8 +227,36 @@ we use the following adhoc function for this ephemeris correction """
 # p 210 (14.5)
 # rd is an RD Moment
 # Calculates correction in fraction of a day
+# The correction depends only on the Gregorian year of the moment, so the years
+# covered by the polynomial branches are tabulated once (first use) and found by bisect.
 def ephemeris_correction(moment_rd: Decimal) -> Decimal:
-    year = gregorian_year_from_rd(floor(moment_rd))
+    year_starts, corrections = _ephemeris_correction_table()
+    ndx = bisect_right(year_starts, moment_rd) - 1
+    if 0 <= ndx < len(corrections):
+        return corrections[ndx]
+    return ephemeris_correction_for_year(gregorian_year_from_rd(floor(moment_rd)))
+
+
+# First and last Gregorian years tabulated by _ephemeris_correction_table
+EPHEMERIS_TABLE_YEARS = (-500, 2150)
+
+
+@lru_cache(maxsize=None)
+def _ephemeris_correction_table() -> tuple[tuple[int, ...], tuple[Decimal, ...]]:
+    """
+    Build the yearly ΔT table.
+    Returns (year_starts, corrections) where year_starts[i] is the R.D. of January 1
+    of year EPHEMERIS_TABLE_YEARS[0] + i; the extra trailing start closes the last year.
+    """
+    first, last = EPHEMERIS_TABLE_YEARS
+    year_starts = tuple(gregorian_new_year(year) for year in range(first, last + 2))
+    corrections = tuple(ephemeris_correction_for_year(year) for year in range(first, last + 1))
+    return year_starts, corrections
+
+
+@lru_cache(maxsize=4096)
+def ephemeris_correction_for_year(year: int) -> Decimal:
+    """Ephemeris correction (fraction of a day) for a Gregorian year, memoized per year"""
     if year <= -500:
         return _eph_c_otherwise(year)
     elif year < 500:
@@ -246,63 +283,53 @@ def ephemeris_correction(moment_rd: Decimal) -> Decimal:
         return _eph_c_otherwise(year)
 
 
+# Ephemeris correction polynomials, coefficients in ascending powers of the branch variable
+_SECONDS_PER_DAY = Decimal(86400)
+_EPH_C_2051 = Polynomial(-20, 0, 32)
+_EPH_C_2051_LINEAR = Polynomial(0, "0.5628")
+_EPH_C_2006 = Polynomial("62.92", "0.32217", "0.005589")
+_EPH_C_1987 = Polynomial("63.86", "0.3345", "-0.060374", "0.0017275", "0.000651814", "0.00002373599")
+_EPH_C_1900 = Polynomial(
+    "-0.00002", "0.000297", "0.025184", "-0.181133", "0.553040", "-0.861938", "0.677066", "-0.212591"
+)
+_EPH_C_1800 = Polynomial(
+    "-0.000009", "0.003844", "0.083563", "0.865736", "4.867575", "15.845535",
+    "31.332267", "38.291999", "28.316289", "11.636204", "2.043794",
+)
+_EPH_C_1700 = Polynomial("8.118780842", "-0.005092142", "0.003336121", "-0.0000266484")
+_EPH_C_1600 = Polynomial(120, "-0.9808", "-0.01532", "0.000140272128")
+_EPH_C_500 = Polynomial("1574.2", "-556.01", "71.23472", "0.319781", "-0.8503463", "-0.005050998", "0.0083572073")
+_EPH_C_0 = Polynomial("10583.6", "-1014.41", "33.78311", "-5.952053", "-0.1798452", "0.022174192", "0.0090316521")
+_EPH_C_OTHERWISE = Polynomial(-20, 0, 32)
+
+
 def _eph_c_2051(year: Decimal) -> Decimal:
     """Ephemeris correction for years greater-than-or-equal 2051 on-or-before 2150"""
     y = Decimal(year - 1820) / 100
-    x = -20
-    x += +32 * y**2
-    x += +Decimal("0.5628") * (2150 - year)
-    return x / Decimal(86400)
+    x = _EPH_C_2051(y) + _EPH_C_2051_LINEAR(2150 - year)
+    return x / _SECONDS_PER_DAY
 
 
 def _eph_c_2006(year: Decimal) -> Decimal:
     """Ephemeris correction for years greater-than-or-equal 2006 on-or-before 2050"""
     y = year - 2000
-    x = Decimal("62.92") + Decimal("0.32217") * y + Decimal("0.005589") * y**2
-    return x / Decimal(86400)
+    return _EPH_C_2006(y) / _SECONDS_PER_DAY
 
 
 def _eph_c_1987(year: Decimal) -> Decimal:
     """Ephemeris correction for years greater-than-or-equal 1987 on-or-before 2005"""
     y = year - 2000
-    x = (
-        Decimal("63.86")
-        + Decimal("0.3345") * y
-        - Decimal("0.060374") * y**2
-        + Decimal("0.0017275") * y**3
-        + Decimal("0.000651814") * y**4
-        + Decimal("0.00002373599") * y**5
-    )
-    return x / Decimal(86400)
+    return _EPH_C_1987(y) / _SECONDS_PER_DAY
 
 
 def _eph_c_1900(c: Decimal) -> Decimal:
     """Ephemeris correction for years greater-than-or-equal 1900 on-or-before 1986"""
-    x = -Decimal("0.00002")
-    x += +Decimal("0.000297") * c
-    x += +Decimal("0.025184") * c**2
-    x += -Decimal("0.181133") * c**3
-    x += +Decimal("0.553040") * c**4
-    x += -Decimal("0.861938") * c**5
-    x += +Decimal("0.677066") * c**6
-    x += -Decimal("0.212591") * c**7
-    return x
+    return _EPH_C_1900(c)
 
 
 def _eph_c_1800(c: Decimal) -> Decimal:
     """Ephemeris correction for years greater-than-or-equal 1800 before 1900"""
-    x = -Decimal("0.000009")
-    x += +Decimal("0.003844") * c
-    x += +Decimal("0.083563") * c**2
-    x += +Decimal("0.865736") * c**3
-    x += +Decimal("4.867575") * c**4
-    x += +Decimal("15.845535") * c**5
-    x += +Decimal("31.332267") * c**6
-    x += +Decimal("38.291999") * c**7
-    x += +Decimal("28.316289") * c**8
-    x += +Decimal("11.636204") * c**9
-    x += +Decimal("2.043794") * c**10
-    return x
+    return _EPH_C_1800(c)
 
 
 def _eph_y_1700(year: Decimal) -> Decimal:
@@ -312,13 +339,7 @@ def _eph_y_1700(year: Decimal) -> Decimal:
 def _eph_c_1700(year: Decimal) -> Decimal:
     """Ephemeris correction for years greater-than-or-equal 1700 before 1800"""
     y = _eph_y_1700(year)
-    x = (
-        Decimal("8.118780842")
-        - Decimal("0.005092142") * y
-        + Decimal("0.003336121") * y**2
-        - Decimal("0.0000266484") * y**3
-    )
-    return x / Decimal(86400)
+    return _EPH_C_1700(y) / _SECONDS_PER_DAY
 
 
 def _eph_y_1600(year: Decimal) -> Decimal:
@@ -328,13 +349,7 @@ def _eph_y_1600(year: Decimal) -> Decimal:
 def _eph_c_1600(year: Decimal) -> Decimal:
     """Ephemeris correction for years greater-than-or-equal 1600 before 1700"""
     y = _eph_y_1600(year)
-    x = (
-        120
-        - Decimal("0.9808") * y
-        - Decimal("0.01532") * y**2
-        + Decimal("0.000140272128") * y**3
-    )
-    return x / Decimal(86400)
+    return _EPH_C_1600(y) / _SECONDS_PER_DAY
 
 
 def _eph_y_1000(year: Decimal) -> Decimal:
@@ -344,14 +359,7 @@ def _eph_y_1000(year: Decimal) -> Decimal:
 def _eph_c_500(year: Decimal) -> Decimal:
     """Ephemeris correction for years greater-than-or-equal 500 before 1600"""
     y = _eph_y_1000(year)
-    x  = +Decimal("1574.2")
-    x += -Decimal("556.01") * y
-    x += +Decimal("71.23472") * y**2
-    x += +Decimal("0.319781") * y**3
-    x += -Decimal("0.8503463") * y**4
-    x += -Decimal("0.005050998") * y**5
-    x += +Decimal("0.0083572073") * y**6
-    return x / Decimal(86400)
+    return _EPH_C_500(y) / _SECONDS_PER_DAY
 
 
 def _eph_y_0(year: Decimal) -> Decimal:
@@ -361,14 +369,7 @@ def _eph_y_0(year: Decimal) -> Decimal:
 def _eph_c_0(year: Decimal) -> Decimal:
     """Ephemeris correction for years greater-than -500 before 500"""
     y = _eph_y_0(year)
-    x = Decimal("10583.6")
-    x += -Decimal("1014.41") * y
-    x += +Decimal("33.78311") * y**2
-    x += -Decimal("5.952053") * y**3
-    x += -Decimal("0.1798452") * y**4
-    x += +Decimal("0.022174192") * y**5
-    x += +Decimal("0.0090316521") * y**6
-    return x / Decimal(86400)
+    return _EPH_C_0(y) / _SECONDS_PER_DAY
 
 
 def _eph_y_1820(year: Decimal) -> Decimal:
@@ -377,7 +378,7 @@ def _eph_y_1820(year: Decimal) -> Decimal:
 
 def _eph_c_otherwise(year: Decimal) -> Decimal:
     """Ephemeris correction for years less-then-or-equal -500 after 2150"""
-    return (-20 + 32 * _eph_y_1820(year) ** 2) / Decimal(86400)
+    return _EPH_C_OTHERWISE(_eph_y_1820(year)) / _SECONDS_PER_DAY
 
 
 # Universal Time and Dynamical Time
@@ -433,24 +434,16 @@ def rd_to_julian_centuries(t_rd: Decimal) -> Decimal:
 # Equation of time
 # p 215 (14.20) Equation of time
 # Calculates the correction in fraction of day
+_EOT_LAMBDA = Polynomial("280.46645", "36000.76983", "0.0003032")
+_EOT_ANOMALY = Polynomial("357.52910", "35999.05030", "-0.0001559", "-0.00000048")
+_EOT_ECCENTRICITY = Polynomial("0.016708617", "-0.000042037", "-0.0000001236")
+
+
 def equation_of_time(rd_moment: Decimal) -> Decimal:
     j_centuries = rd_to_julian_centuries(rd_moment)
-    _lambda = (
-        Decimal("280.46645")
-        + Decimal("36000.76983") * j_centuries
-        + Decimal("0.0003032") * j_centuries**2
-    )
-    anomaly = (
-        Decimal("357.52910")
-        + Decimal("35999.05030") * j_centuries
-        - Decimal("0.0001559") * j_centuries**2
-        - Decimal("0.00000048") * j_centuries**3
-    )
-    eccentricity = (
-        Decimal("0.016708617")
-        - Decimal("0.000042037") * j_centuries
-        - Decimal("0.0000001236") * j_centuries**2
-    )
+    _lambda = _EOT_LAMBDA(j_centuries)
+    anomaly = _EOT_ANOMALY(j_centuries)
+    eccentricity = _EOT_ECCENTRICITY(j_centuries)
     epsilon = _obliquity(j_centuries)
     y = tan(DEG2RAD * epsilon / Decimal(2)) ** 2
     equation = y * sin(DEG2RAD * Decimal("2") * _lambda)
@@ -472,16 +465,16 @@ def equation_of_time(rd_moment: Decimal) -> Decimal:
 
 
 # p 220 (14.28) mean obliquity of the ecliptic
+_OBLIQUITY = Polynomial(
+    Decimal("23") + Decimal("26") / Decimal("60") + Decimal("21.448") / Decimal("3600"),
+    -Decimal("46.8150") / Decimal("3600"),
+    -Decimal("0.00059") / Decimal("3600"),
+    Decimal("0.001813") / Decimal("3600"),
+)
+
+
 def _obliquity(j_centuries: Decimal) -> Decimal:
-    epsilon_0 = (
-        +Decimal("23")
-        + (Decimal("26") / Decimal("60"))
-        + (Decimal("21.448") / Decimal("3600"))
-    )
-    epsilon_0 += -Decimal("46.8150") / Decimal("3600") * j_centuries
-    epsilon_0 += -Decimal("0.00059") / Decimal("3600") * j_centuries**2
-    epsilon_0 += +Decimal("0.001813") / Decimal("3600") * j_centuries**3
-    return epsilon_0
+    return _OBLIQUITY(j_centuries)
 
 
 # p 221 (14.31-32)
@@ -496,10 +489,13 @@ def mean_sidereal_year() -> Decimal:
 
 
 # p 223 (14.33)
+_SOLAR_LONGITUDE_MEAN = Polynomial("282.7771834", "36000.76953744")
+
+
 def solar_longitude(rd_moment: Decimal) -> Decimal:
     """Calculate the solar longitude in degrees from R.D. moment"""
     j_centuries = rd_to_julian_centuries(rd_moment)
-    _lambda = Decimal("282.7771834") + Decimal("36000.76953744") * j_centuries
+    _lambda = _SOLAR_LONGITUDE_MEAN(j_centuries)
     _sum = Decimal("0")
     for x_, y_, z_ in Table_14_1:
         _sum += x_ * sin(DEG2RAD * (y_ + z_ * j_centuries))
@@ -511,28 +507,27 @@ def solar_longitude(rd_moment: Decimal) -> Decimal:
 
 
 # p 223 (14.34)
+_NUTATION_A = Polynomial("124.90", "-1934.134", "0.002063")
+_NUTATION_B = Polynomial("201.11", "72001.5377", "0.00057")
+
+
 def nutation(j_centuries: Decimal) -> Decimal:
     """Calculate the nutation in longitude in degrees from julian centuries"""
-    A = (
-        Decimal("124.90")
-        - Decimal("1934.134") * j_centuries
-        + Decimal("0.002063") * j_centuries**2
-    )
-    B = (
-        Decimal("201.11")
-        + Decimal("72001.5377") * j_centuries
-        + Decimal("0.00057") * j_centuries**2
-    )
+    A = _NUTATION_A(j_centuries)
+    B = _NUTATION_B(j_centuries)
     return -Decimal("0.004778") * sin(DEG2RAD * A) - Decimal("0.0003667") * sin(
         DEG2RAD * B
     )
 
 
 # p 223 (14.35)
+_ABERRATION_ARGUMENT = Polynomial("177.63", "35999.01848")
+
+
 def aberration(j_centuries: Decimal) -> Decimal:
     """Calculate the aberration in longitude in degrees from julian centuries"""
     L = Decimal("0.0000974") * cos(
-        DEG2RAD * (Decimal("177.63") + Decimal("35999.01848") * j_centuries)
+        DEG2RAD * _ABERRATION_ARGUMENT(j_centuries)
     ) - Decimal("0.005575")
     return L
 
@@ -718,37 +713,40 @@ Table_14_4 = [
 
 
 # p 229 (14.45) mean synodic month
+_NEW_MOON_APPROX = Polynomial(
+    0,  # _j2000() + 5.09766 is added separately, keeping the constant term exact
+    mean_synodic_month() * Decimal("1236.85"),
+    "0.00015437",
+    "-0.000000150",
+    "0.00000000073",
+)
+_NEW_MOON_E = Polynomial(1, "-0.002516", "-0.0000074")
+_NEW_MOON_SOLAR_ANOMALY = Polynomial(
+    "2.5534", Decimal("1236.85") * Decimal("29.10535670"), "-0.0000014", "-0.00000011"
+)
+_NEW_MOON_LUNAR_ANOMALY = Polynomial(
+    "201.5643", Decimal("385.81693528") * Decimal("1236.85"), "0.0107582", "0.00001238", "-0.000000058"
+)
+_NEW_MOON_ARGUMENT = Polynomial(
+    "160.7108", Decimal("390.67050284") * Decimal("1236.85"), "-0.0016118", "-0.00000227", "0.000000011"
+)
+_NEW_MOON_SIGMA = Polynomial("124.7746", -Decimal("1.56375588") * Decimal("1236.85"), "0.0020672", "0.00000215")
+_NEW_MOON_EXTRA_ARGUMENT = Polynomial(Decimal(299.77), "132.8475848")
+_NEW_MOON_EXTRA = Polynomial(0, 0, "-0.009173")
+
+
 def nth_new_moon(n: Decimal) -> Decimal:
     n0 = 24724
     k = n - n0
     c = k / Decimal("1236.85")
     approx = _j2000()
     approx += Decimal("5.09766")
-    approx += mean_synodic_month() * Decimal("1236.85") * c
-    approx += Decimal("0.00015437") * c**2
-    approx += -Decimal("0.000000150") * c**3
-    approx += Decimal("0.00000000073") * c**4
-    E = 1
-    E += -Decimal("0.002516") * c
-    E += -Decimal("0.0000074") * c**2
-    solar_anomaly = Decimal("2.5534")
-    solar_anomaly += Decimal("1236.85") * Decimal("29.10535670") * c
-    solar_anomaly += -Decimal("0.0000014") * c**2
-    solar_anomaly += -Decimal("0.00000011") * c**3
-    lunar_anomaly = Decimal("201.5643")
-    lunar_anomaly += Decimal("385.81693528") * Decimal("1236.85") * c
-    lunar_anomaly += Decimal("0.0107582") * c**2
-    lunar_anomaly += Decimal("0.00001238") * c**3
-    lunar_anomaly += -Decimal("0.000000058") * c**4
-    moon_argument = Decimal("160.7108")
-    moon_argument += Decimal("390.67050284") * Decimal("1236.85") * c
-    moon_argument += -Decimal("0.0016118") * c**2
-    moon_argument += -Decimal("0.00000227") * c**3
-    moon_argument += Decimal("0.000000011") * c**4
-    sigma = Decimal("124.7746")
-    sigma += -Decimal("1.56375588") * Decimal("1236.85") * c
-    sigma += Decimal("0.0020672") * c**2
-    sigma += Decimal("0.00000215") * c**3
+    approx += _NEW_MOON_APPROX(c)
+    E = _NEW_MOON_E(c)
+    solar_anomaly = _NEW_MOON_SOLAR_ANOMALY(c)
+    lunar_anomaly = _NEW_MOON_LUNAR_ANOMALY(c)
+    moon_argument = _NEW_MOON_ARGUMENT(c)
+    sigma = _NEW_MOON_SIGMA(c)
     correction = -Decimal("0.00017") * sin(DEG2RAD * sigma)
     for v_, w_, x_, y_, z_ in Table_14_3:
         correction += (
@@ -758,8 +756,8 @@ def nth_new_moon(n: Decimal) -> Decimal:
                 DEG2RAD * (x_ * solar_anomaly + y_ * lunar_anomaly + z_ * moon_argument)
             )
         )
-    extra = Decimal("0.000325") * sin(Decimal(299.77) + Decimal("132.8475848") * c)
-    extra += -Decimal("0.009173") * c**2
+    extra = Decimal("0.000325") * sin(_NEW_MOON_EXTRA_ARGUMENT(c))
+    extra += _NEW_MOON_EXTRA(c)
     additional = 0
     for i_, j_, l_ in Table_14_4:
         additional += l_ * sin(DEG2RAD * (i_ + j_ * k))
@@ -792,6 +790,11 @@ def new_moon_at_or_after(t: Decimal) -> Decimal:
 
 
 # p232 (14.48)
+_LUNAR_LONGITUDE_E = Polynomial(1, "-0.002516", "-0.0000074")
+_LUNAR_LONGITUDE_VENUS = Polynomial("119.75", "131.849")
+_LUNAR_LONGITUDE_JUPITER = Polynomial("53.09", "479264.29")
+
+
 def lunar_longitude(t: Decimal) -> Decimal:
     """Calculate the lunar longitude at time t in degrees"""
     c = julian_centuries(t)
@@ -800,24 +803,25 @@ def lunar_longitude(t: Decimal) -> Decimal:
     M = solar_anomaly(c)
     M_p = lunar_anomaly(c)
     F = moon_node(c)
-    E = Decimal("1") + Decimal("0.00251") * c - Decimal("0.0000074") * c**2
+    E = _LUNAR_LONGITUDE_E(c)
     correction = 0
     for v_, w_, x_, y_, z_ in Table_14_5:
         correction += (
             v_ * E ** abs(x_) * sin(DEG2RAD * (w_ * D + x_ * M + y_ * M_p + z_ * F))
         )
+    correction /= 1_000_000
     venus = (
         Decimal(3958)
-        * sin(DEG2RAD * Decimal("119.75") + c * Decimal("131.849"))
+        * sin(DEG2RAD * _LUNAR_LONGITUDE_VENUS(c))
         / 1_000_000
     )
     jupiter = (
         Decimal(318)
-        * sin(DEG2RAD * Decimal("53.09") + c * Decimal("479264.29"))
+        * sin(DEG2RAD * _LUNAR_LONGITUDE_JUPITER(c))
         / 1_000_000
     )
     flat_earth = Decimal(1962) * sin(DEG2RAD * (L_p - F)) / 1_000_000
-    return mod(L_p + correction + venus + jupiter + flat_earth, Decimal(360))
+    return mod(L_p + correction + venus + jupiter + flat_earth + nutation(c), Decimal(360))
 
 
 # 233 Table 14.5
@@ -885,62 +889,56 @@ Table_14_5 = [
 
 
 # 233 (14.49)
+_MEAN_LUNAR_LONGITUDE = Polynomial(
+    "218.3164477", "481267.88123421", "-0.0015786", 1 / Decimal(538_841), -1 / Decimal(65_194_000)
+)
+
+
 def mean_lunar_longitude(c: Decimal) -> Decimal:
     """Calculate the mean lunar longitude at time c in degrees"""
-    L_0 = (
-        Decimal("218.3164477")
-        + Decimal("481267.88123421") * c
-        - Decimal("0.0015786") * c**2
-        + (1 / Decimal(538_841)) * c**3
-        - (1 / Decimal(65_194_00)) * c**4
-    )
+    L_0 = _MEAN_LUNAR_LONGITUDE(c)
     return mod(L_0, Decimal(360))
 
 
 # p 234 (14.50)
+_LUNAR_ELONGATION = Polynomial(
+    "297.8501921", "445267.1114034", "-0.0018819", 1 / Decimal(545_868), -1 / Decimal(113_065_000)
+)
+
+
 def lunar_elongation(c: Decimal) -> Decimal:
-    L_0 = (
-        Decimal("297.8501921")
-        + Decimal("445267.1114034") * c
-        - Decimal("0.0018819") * c**2
-        + (1 / Decimal(545_868)) * c**3
-        - (1 / Decimal(113_065_000)) * c**4
-    )
+    L_0 = _LUNAR_ELONGATION(c)
     return mod(L_0, Decimal(360))
 
 
 # p 234 (14.51)
+_SOLAR_ANOMALY = Polynomial("357.5291092", "35999.0502909", "-0.0001536", 1 / Decimal(24_490_000))
+
+
 def solar_anomaly(c: Decimal) -> Decimal:
-    M = (
-        Decimal("357.5291092")
-        + Decimal("35999.0502909") * c
-        - Decimal("0.0001536") * c**2
-        + (1 / Decimal(24_490_000)) * c**3
-    )
+    M = _SOLAR_ANOMALY(c)
     return mod(M, Decimal(360))
 
 
 # p 234 (14.52)
+_LUNAR_ANOMALY = Polynomial(
+    "134.9633964", "477198.8675055", "0.0087414", 1 / Decimal(69_699), -1 / Decimal(14_712_000)
+)
+
+
 def lunar_anomaly(c: Decimal) -> Decimal:
-    M_p = (
-        Decimal("134.9633964")
-        + Decimal("477198.8675055") * c
-        + Decimal("0.0087414") * c**2
-        + (1 / Decimal(69_699)) * c**3
-        - (1 / Decimal(14_712_000)) * c**4
-    )
+    M_p = _LUNAR_ANOMALY(c)
     return mod(M_p, Decimal(360))
 
 
 # p 234 (14.53)
+_MOON_NODE = Polynomial(
+    "93.2720950", "483202.0175233", "-0.0036539", -1 / Decimal(3_526_000), 1 / Decimal(863_310_000)
+)
+
+
 def moon_node(c: Decimal) -> Decimal:
-    F = (
-        Decimal("93.2720950")
-        + Decimal("483202.0175233") * c
-        - Decimal("0.0036539") * c**2
-        - (1 / Decimal(3_526_000)) * c**3
-        + (1 / Decimal(863_310_000)) * c**4
-    )
+    F = _MOON_NODE(c)
     return mod(F, Decimal(360))
 
 
@@ -954,3 +952,148 @@ def lunar_phase(t: Decimal) -> Decimal:
         return phi_p
     else:
         return phi
+
+
+# p 235 (14.57)
+def new() -> Decimal:
+    return 0
+
+
+def first_quarter() -> Decimal:
+    return 90
+
+
+def full() -> Decimal:
+    return 180
+
+
+def last_quarter() -> Decimal:
+    return 270
+
+
+def _angle_offset(angle: Callable[[Decimal], Decimal], target: Decimal, t: Decimal) -> Decimal:
+    """Signed distance in degrees, in [-180, 180), of angle(t) past target"""
+    return mod(angle(t) - target + 180, Decimal(360)) - 180
+
+
+def _angle_in_bracket(
+    angle: Callable[[Decimal], Decimal], target: Decimal, lo: Decimal, hi: Decimal, tolerance: Decimal
+) -> Decimal:
+    """
+    Moment in [lo, hi] at which the increasing angle(t), in degrees, passes target.
+    The bracket is widened by whole days if it does not contain the crossing.
+    Regula falsi with the Illinois modification keeps the root bracketed while converging
+    in a handful of evaluations of angle.
+    """
+    f_lo, f_hi = _angle_offset(angle, target, lo), _angle_offset(angle, target, hi)
+    while f_lo > 0:
+        lo -= 1
+        f_lo = _angle_offset(angle, target, lo)
+    while f_hi < 0:
+        hi += 1
+        f_hi = _angle_offset(angle, target, hi)
+    side = 0
+    while hi - lo > tolerance:
+        x = hi - f_hi * (hi - lo) / (f_hi - f_lo)
+        if not lo < x < hi:
+            x = (lo + hi) / 2
+        f_x = _angle_offset(angle, target, x)
+        if f_x == 0:
+            return x
+        if f_x < 0:
+            lo, f_lo = x, f_x
+            if side == -1:
+                f_hi /= 2
+            side = -1
+        else:
+            hi, f_hi = x, f_x
+            if side == 1:
+                f_lo /= 2
+            side = 1
+    return (lo + hi) / 2
+
+
+# p 235 (14.58)
+def lunar_phase_at_or_after(phi: Decimal, t: Decimal) -> Decimal:
+    """Moment of the first time at or after t when the lunar phase is phi degrees"""
+    phi = decimal_(phi)
+    tau = t + mean_synodic_month() * mod(phi - lunar_phase(t), Decimal(360)) / 360
+    lo = max(t, tau - 2)
+    if _angle_offset(lunar_phase, phi, lo) >= 0:
+        return lo
+    return _angle_in_bracket(lunar_phase, phi, lo, tau + 2, Decimal("1e-6"))
+
+
+def lunar_phase_events(
+    start: Decimal,
+    end: Decimal,
+    phases=(new(), first_quarter(), full(), last_quarter()),
+    tolerance: Decimal = Decimal("1e-6"),
+):
+    """
+    Generate (moment, phase) for every lunar phase event start <= moment < end, in order.
+
+    The lunations are walked by number: new moons come from nth_new_moon, every other
+    phase is solved in a 4 day bracket around the previous event plus the mean elapsed
+    time.  Only the previous event is kept, so any span can be iterated in constant memory.
+    tolerance is the width of the final bracket in days.
+    """
+    start, end = decimal_(start), decimal_(end)
+    phases = sorted(mod(decimal_(phi), Decimal(360)) for phi in phases)
+    if not phases:
+        return
+    synodic = mean_synodic_month()
+    n = round((start - nth_new_moon(0)) / synodic) - 1
+    while True:
+        previous_t, previous_phi = nth_new_moon(n), Decimal(0)
+        for phi in phases:
+            if phi == 0:
+                t = previous_t
+            else:
+                estimate = previous_t + synodic * (phi - previous_phi) / 360
+                t = _angle_in_bracket(lunar_phase, phi, estimate - 2, estimate + 2, tolerance)
+            if t >= end:
+                return
+            if t >= start:
+                yield t, phi
+            previous_t, previous_phi = t, phi
+        n += 1
+
+
+def solar_longitude_events(
+    start: Decimal,
+    end: Decimal,
+    longitudes=tuple(range(0, 360, 15)),
+    tolerance: Decimal = Decimal("1e-6"),
+):
+    """
+    Generate (moment, longitude) for every time start <= moment < end at which the solar
+    longitude reaches one of longitudes (degrees), in order.  The default longitudes are the
+    24 solar terms.
+
+    Each crossing is solved in a 4 day bracket around the previous crossing plus the mean
+    time the sun takes to cover the difference in longitude.
+    tolerance is the width of the final bracket in days.
+    """
+    start, end = decimal_(start), decimal_(end)
+    longitudes = sorted(set(mod(decimal_(_lambda), Decimal(360)) for _lambda in longitudes))
+    if not longitudes:
+        return
+    rate = mean_tropical_year() / 360
+    previous_t, previous_lambda = start, solar_longitude(start)
+    ndx = bisect_right(longitudes, previous_lambda) % len(longitudes)
+    first = True
+    while True:
+        _lambda = longitudes[ndx]
+        diff = mod(_lambda - previous_lambda, Decimal(360))
+        if diff == 0 and not first:
+            diff = Decimal(360)
+        first = False
+        estimate = previous_t + rate * diff
+        t = _angle_in_bracket(solar_longitude, _lambda, estimate - 2, estimate + 2, tolerance)
+        if t >= end:
+            return
+        if t >= start:
+            yield t, _lambda
+        previous_t, previous_lambda = t, _lambda
+        ndx = (ndx + 1) % len(longitudes)
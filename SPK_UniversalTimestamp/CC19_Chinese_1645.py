@@ -154,6 +154,8 @@ def chinese_from_rd(date : Decimal) -> tuple[int, int, int, bool, int]:
 # p 318 (19.17)
 def rd_from_chinese(cycle: Decimal, year: Decimal, month: Decimal, leap_month: bool, day: Decimal) -> Decimal:
     """Convert a Chinese date to R.D."""
+    month = month if month is not None else 1
+    day = day if day is not None else 1
     mid_year = floor(Epoch_rd['chinese'] + ((cycle -1) * 60 + year -1 + Decimal(0.5)) * mean_tropical_year())
     new_year = chinese_new_year_on_or_before(mid_year)
     p = chinese_new_moon_on_or_after(new_year + (month-1) * 29)
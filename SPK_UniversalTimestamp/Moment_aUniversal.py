@@ -15,12 +15,13 @@ Comprehensive multi-scale time system:
     It is NOT a second as measured by the radioactive decay of Cesium 133 atoms.
 - Precision levels to indicate the certainty of the timestamp
 """
-import langcodes
 import re
 from datetime import datetime, timezone
 from decimal import Decimal, getcontext, ROUND_DOWN
+from functools import lru_cache
+from importlib import import_module
 from .CC00_Decimal_library import floor
-from typing import Optional, Union
+from typing import Iterable, Optional, Union
 from abc import abstractmethod
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
@@ -37,6 +38,205 @@ from .Constants_Julian import julian_MONTH_ATTS
 getcontext().prec = 50
 
 
+@lru_cache(maxsize=512)
+def _compile_format(calendar: Calendar, format: str, language: str) -> tuple:
+    """
+    Compile a format string into a plan, a tuple of ops: a str is literal text, a dict is an insert
+    segment, resolved for presentation by _compile_presentation.
+    The calendar name (%K) and abbreviation (%k) are resolved into the literals.
+
+    Format specifier is a string split on % into text and insert segments
+    1. Text segments are copied as is
+    2. Insert segments are processed according to their type and modifiers
+        a. For type modifier see Moment Geological and Moment Calendars
+    """
+    plan = []
+    text = ""
+
+    def append_text(fragment: str):
+        nonlocal text
+        text += fragment
+        return
+
+    # capture lead text
+    lead, _, remainder = format.partition("%")
+    append_text(lead)
+    # split remainder into insert segments
+    segments = remainder.split("%") if remainder else []
+    for segment in segments:
+        # If the segment is empty, skip it
+        if len(segment) == 0:
+            continue
+        # get segment type and any modifiers
+        seg_remainder_start = 1
+        seg_eliminate_leading_zero = False
+        seg_frac_digits = None
+        seg_type = segment[0]
+        if seg_type == "#":
+            seg_eliminate_leading_zero = True
+            if len(segment) > 1:
+                seg_type = segment[1]
+                seg_remainder_start = 2
+        if seg_type == 'f':
+            if len(segment) > 1 and segment[1].isdigit():
+                # fractional seconds precision
+                frac_digits = 0
+                for i in range(1, len(segment)):
+                    if not segment[i].isdigit():
+                        break
+                    frac_digits = frac_digits*10 + int(segment[i])
+                seg_frac_digits = frac_digits
+                seg_remainder_start = i+1
+        # process the segment
+        if seg_type in ['K']:
+            append_text(CalendarAtts[language][calendar]['name'])
+        elif seg_type in ['k']:
+            append_text(CalendarAtts[language][calendar]['abbrv'])
+        else:
+            if text:
+                plan.append(text)
+                text = ""
+            plan.append({'type' : seg_type, 'eliminate_leading_zero' : seg_eliminate_leading_zero, 'frac_digits' : seg_frac_digits})
+        append_text(segment[seg_remainder_start:])
+    if text:
+        plan.append(text)
+    return tuple(plan)
+
+
+@lru_cache(maxsize=512)
+def _compile_presentation(presentation_class: type, calendar: Calendar, format: str, language: str) -> tuple:
+    """
+    The plan of _compile_format made executable by a presentation class: each insert segment is resolved
+    once, by presentation_class._compile_segment, to a function of the presentation returning its text
+    or to literal text, merged with the neighbouring literals.
+    """
+    plan = []
+    for op in _compile_format(calendar, format, language):
+        if op.__class__ is not str:
+            op = presentation_class._compile_segment(op, language)
+        if op.__class__ is str and plan and plan[-1].__class__ is str:
+            plan[-1] += op
+        else:
+            plan.append(op)
+    return tuple(plan)
+
+
+# Presentation classes by calendar, imported on first use
+_PRESENTATION_CLASS_NAMES = {
+    Calendar.GEOLOGICAL: ("Moment_bPresent_Geological", "Present_Geological"),
+    Calendar.GREGORIAN: ("Moment_cPresent_Gregorian", "Present_Gregorian"),
+    Calendar.JULIAN: ("Moment_cPresent_Julian", "Present_Julian"),
+    Calendar.HEBREW: ("Moment_cPresent_Hebrew", "Present_Hebrew"),
+    Calendar.CHINESE: ("Moment_cPresent_Chinese", "Present_Chinese"),
+}
+_PRESENTATION_CLASSES = {}
+
+
+def _presentation_class(calendar: Calendar) -> type:
+    presentation_class = _PRESENTATION_CLASSES.get(calendar)
+    if presentation_class is None:
+        module, name = _PRESENTATION_CLASS_NAMES[calendar]
+        presentation_class = getattr(import_module(f".{module}", __package__), name)
+        _PRESENTATION_CLASSES[calendar] = presentation_class
+    return presentation_class
+
+
+def _present_specs(specs: Union[Iterable[tuple], dict]) -> tuple[Optional[tuple], tuple]:
+    """Normalize present_many specs into (names or None, ((calendar, format, tz, language), ...))"""
+    names = None
+    if isinstance(specs, dict):
+        names = tuple(specs.keys())
+        specs = specs.values()
+    normalized = []
+    for spec in specs:
+        calendar, format, *rest = spec
+        tz = rest[0] if len(rest) > 0 else 'UTC'
+        language = rest[1] if len(rest) > 1 else 'en'
+        normalized.append((calendar, format, tz, language))
+    return names, tuple(normalized)
+
+
+def _present_many(moment: "UnivMoment", names: Optional[tuple], specs: tuple) -> Union[tuple, dict]:
+    """Present the moment for the normalized specs, converting once per (calendar, tz)"""
+    presentations = {}
+    results = []
+    for calendar, format, tz, language in specs:
+        presentation = presentations.get((calendar, tz))
+        if presentation is None:
+            presentation = moment.presentation(calendar, tz)
+            presentations[(calendar, tz)] = presentation
+        if presentation.calendar != calendar:
+            # Deep time falls back to the geological year and eon
+            format = "%y %O"
+        results.append(presentation._format(format, language))
+    if names is not None:
+        return dict(zip(names, results))
+    return tuple(results)
+
+
+def _precision_of_key_level(precision_level: int) -> Precision:
+    """The precision of a StdLexicalKey level, a level between two precisions maps to the coarser one"""
+    last_prec = Precision.BILLION_YEARS
+    for prec in Precision:
+        if PrecisionAtts[prec]['level'] == precision_level:
+            return prec
+        elif PrecisionAtts[prec]['level'] > precision_level:
+            return last_prec
+        last_prec = prec
+    return Precision.ATTOSECOND
+
+
+# StdLexicalKey layout, fixed width:  univRD<rd_day 18>H<hh>M<mm>S<ss.18 digits>UTC:<level 2>
+STD_LEXICAL_KEY_LENGTH = 58
+STD_LEXICAL_KEY_DAY_OFFSET = 100_000_000_000_000_000
+_STD_LEXICAL_KEY_LITERALS = ((0, "univRD"), (24, "H"), (27, "M"), (30, "S"), (33, "."), (52, "UTC:"))
+_STD_LEXICAL_KEY_DIGITS = ((6, 24), (25, 27), (28, 30), (31, 33), (34, 52), (56, 58))
+_PRECISION_BY_KEY_LEVEL = {level: _precision_of_key_level(level) for level in range(100)}
+
+
+def _is_digits(text: str) -> bool:
+    """Non-empty ASCII digits only, str.isdigit alone accepts other Unicode digits"""
+    return text.isascii() and text.isdigit()
+
+
+class _AlternativeMatch:
+    """The groups of one alternative of a combined pattern, numbered and named as in its own pattern"""
+    __slots__ = ("_match", "_offset", "_names")
+
+    def __init__(self, match: re.Match, offset: int, names: dict):
+        self._match = match
+        self._offset = offset
+        self._names = names
+
+    def group(self, ndx: int = 0):
+        return self._match.group(self._offset + ndx)
+
+    def groupdict(self) -> dict:
+        return {name: self._match.group(self._offset + ndx) for name, ndx in self._names.items()}
+
+
+def _combine_patterns(patterns: list) -> tuple[re.Pattern, dict]:
+    """
+    Compile the (pattern, converter) list into one regex of alternatives tried in order.
+    Each alternative is wrapped in a capturing group, the outermost closes last so match.lastindex
+    identifies the alternative.  Named groups get the alternative number as suffix to stay unique.
+
+    Returns:
+        tuple[re.Pattern, dict]: the regex and, by wrapper group index,
+            (position in patterns, group offset, {name: group number within the pattern})
+    """
+    alternatives = []
+    dispatch = {}
+    group = 1
+    for ndx, (pattern, _) in enumerate(patterns):
+        compiled = re.compile(pattern)
+        renamed = re.sub(r"\(\?P<(\w+)>", lambda m: f"(?P<{m.group(1)}_{ndx}>", pattern)
+        alternatives.append(f"({renamed})")
+        dispatch[group] = (ndx, group, dict(compiled.groupindex))
+        group += 1 + compiled.groups
+    return re.compile("|".join(alternatives)), dispatch
+
+
 class UnivMoment:
     """
     Attributes:
@@ -152,7 +352,7 @@ class UnivMoment:
             rd_day_off = 0
         else:
             rd_day_int = int(self.rd_day )
-            rd_day_off = rd_day_int + 100_000_000_000_000_000  # Offset to ensure positive and fixed width
+            rd_day_off = rd_day_int + STD_LEXICAL_KEY_DAY_OFFSET  # Offset to ensure positive and fixed width
         rd_day_str = f"{rd_day_off:018d}"
         rd_time_str = f"H{self.rd_time[0]:02d}M{self.rd_time[1]:02d}S{self.rd_time[2]:021.18f}"
         rd_lex_str = f"univRD{rd_day_str}{rd_time_str}UTC:{PrecisionAtts[self.precision]['level']:02d}"
@@ -166,31 +366,23 @@ class UnivMoment:
         Args:
             lex_key (str): Standardized lexical key representing the UnivMoment
         """
-        pattern = r"univRD(?P<rd_day>\d{18})H(?P<hour>\d{2})M(?P<minute>\d{2})S(?P<second>\d{2}\.\d{18})UTC:(?P<precision>\d{2})$"
-        match = re.match(pattern, lex_key)
-        if not match:
+        if len(lex_key) == STD_LEXICAL_KEY_LENGTH + 1 and lex_key[-1] == "\n":
+            lex_key = lex_key[:-1]
+        if (
+            len(lex_key) != STD_LEXICAL_KEY_LENGTH
+            or not all(lex_key.startswith(literal, start) for start, literal in _STD_LEXICAL_KEY_LITERALS)
+            or not all(lex_key[start:end].isdigit() for start, end in _STD_LEXICAL_KEY_DIGITS)
+        ):
             raise ValueError("Invalid lexical key format for UnivMoment")
-        rd_day = Decimal(match.group("rd_day"))
+        rd_day = int(lex_key[6:24])
         if rd_day <= 0:
             rd_day = Decimal('-infinity')
         else:
-            rd_day = rd_day - 100_000_000_000_000_000
-        hour = int(match.group("hour"))
-        minute = int(match.group("minute"))
-        second = Decimal(match.group("second"))
-        precision_level = int(match.group("precision"))
-        precision = None
-        last_prec = Precision.BILLION_YEARS
-        for prec in Precision:
-            if PrecisionAtts[prec]['level'] == precision_level:
-                precision = prec
-                break
-            elif PrecisionAtts[prec]['level'] > precision_level:
-                precision = last_prec
-                break
-            last_prec = prec
-        if precision is None:
-            precision = Precision.ATTOSECOND
+            rd_day = Decimal(rd_day - STD_LEXICAL_KEY_DAY_OFFSET)
+        hour = int(lex_key[25:27])
+        minute = int(lex_key[28:30])
+        second = Decimal(lex_key[31:52])
+        precision = _PRECISION_BY_KEY_LEVEL[int(lex_key[56:58])]
         return UnivMoment(rd_day, (hour, minute, second), precision)
     
     ################################################################################
@@ -399,11 +591,32 @@ class UnivMoment:
             ZoneInfo(tz_str)
         except ZoneInfoNotFoundError:
             raise ValueError(f"Unknown time zone '{tz_str}' in format string.")      
+        import langcodes
         if not langcodes.tag_is_valid(lang_code):
             raise ValueError(f"Invalid language code '{lang_code}' in format string.")
         
         return self.present(calendar, format_str, tz_str, lang_code)
     
+    def presentation(self, calendar: Calendar, tz = 'UTC') -> "UnivMoment.Presentation":
+        """
+        The calendar conversion of the moment, which can format any number of format strings.
+        Moments before -9999 years are presented in the geological calendar.
+
+        Args:
+            calendar (Calendar): Calendar system to use for presentation
+            tz: Time zone of the presentation, not used by the geological calendar
+        Returns:
+            UnivMoment.Presentation: the Present_* object of the calendar
+        """
+        if calendar == Calendar.GEOLOGICAL or self.rd_day < -9999*Decimal('365.25'):
+            return _presentation_class(Calendar.GEOLOGICAL)(self)
+        elif calendar in _PRESENTATION_CLASS_NAMES:
+            return _presentation_class(calendar)(self, tz)
+        else:
+            raise NotImplementedError(
+                f"Calendar {calendar} not implemented in UnivMoment.present()"
+            )
+
     def present(self, calendar: Calendar, format: str, tz = 'UTC', language: str = 'en') -> str:
         """
         Present the moment in a specific calendar format.
@@ -415,28 +628,58 @@ class UnivMoment:
         Returns:
             str: Formatted timestamp string
         """
-        if calendar == Calendar.GEOLOGICAL:
-            from .Moment_bPresent_Geological import Present_Geological
-            return Present_Geological(self)._format(format, language)
-        elif self.rd_day < -9999*Decimal('365.25'):
-            from .Moment_bPresent_Geological import Present_Geological
-            return Present_Geological(self)._format("%y %O", language)
-        elif calendar == Calendar.GREGORIAN:
-            from .Moment_cPresent_Gregorian import Present_Gregorian
-            return Present_Gregorian(self, tz)._format(format, language)
-        elif calendar == Calendar.JULIAN:
-            from .Moment_cPresent_Julian import Present_Julian
-            return Present_Julian(self, tz)._format(format, language)
-        elif calendar == Calendar.HEBREW:
-            from .Moment_cPresent_Hebrew import Present_Hebrew
-            return Present_Hebrew(self, tz)._format(format, language)
-        elif calendar == Calendar.CHINESE:
-            from .Moment_cPresent_Chinese import Present_Chinese
-            return Present_Chinese(self, tz)._format(format, language)
-        else:
-            raise NotImplementedError(
-                f"Calendar {calendar} not implemented in UnivMoment.present()"
-            )
+        presentation = self.presentation(calendar, tz)
+        if presentation.calendar != calendar:
+            # Deep time falls back to the geological year and eon
+            format = "%y %O"
+        return presentation._format(format, language)
+
+    def present_many(self, specs: Union[Iterable[tuple], dict]) -> Union[tuple, dict]:
+        """
+        Present the moment in several calendars and formats at once.
+        Each distinct (calendar, tz) conversion is computed once and reused by all of its formats.
+
+        Args:
+            specs (Iterable[tuple] | dict): (calendar, format), (calendar, format, tz) or
+                (calendar, format, tz, language) tuples, or a dict of such tuples by name
+        Returns:
+            tuple | dict: the formatted strings in the order of specs, or by name for a dict
+        """
+        return _present_many(self, *_present_specs(specs))
+
+    @staticmethod
+    def strptime(
+        text: str,
+        calendar: Calendar = Calendar.GREGORIAN,
+        format: str = "%Y-%m-%d %H:%M:%S",
+        language: str = 'en',
+        description: Optional[str] = None,
+    ) -> "UnivMoment":
+        """
+        Parse text written by present(calendar, format, tz, language) back into a UnivMoment.
+        The format is compiled once into a regex from the same directives as present.
+        A %z offset or %Z zone name converts the local time back to U.T.
+
+        Args:
+            text (str): the presented moment
+            calendar (Calendar): Gregorian, Julian or Hebrew
+            format (str): the presentation format, it must contain the year (%Y or %y)
+            language (str): language of the month and weekday names
+        Returns:
+            UnivMoment: with the precision of the finest field in the format
+        Raises:
+            ValueError: when the text does not match the format or the fields are not a valid date
+        """
+        return import_module(".Moment_cStrptime", __package__).strptime(text, calendar, format, language, description)
+
+    def interval(self, calendar: Calendar = Calendar.GREGORIAN):
+        """
+        The half-open span [start, end) the moment denotes at its precision, e.g. its year in the calendar.
+
+        Returns:
+            MomentInterval: see Moment_dInterval
+        """
+        return import_module(".Moment_dInterval", __package__).MomentInterval.of(self, calendar)
 
     def format_signature(self) -> str:
         """
@@ -459,7 +702,9 @@ class UnivMoment:
             self.calendar = calendar
             self.moment = moment
             self.precision = moment.precision
-            self.year = year
+            if year is not None:
+                # Otherwise the subclass computes the year on first use
+                self.year = year
             return
 
         # Presentation methods
@@ -467,65 +712,22 @@ class UnivMoment:
             """
             Format the timestamp using a custom format string.
             This is a simplified version and does not support all Python strftime features.
-
-            Format specifier is a string split on % into text and insert segments
-            1. Text segments are copied as is
-            2. Insert segments are processed according to their type and modifiers
-                a. For type modifier see Moment Geological and Moment Calendars
+            See _compile_format for the format specifier.
             """
-            # format string
-            fmt = ""
-            # capture lead text
-            for i in range(len(format)):
-                if format[i] == "%":
-                    break
-                fmt += format[i]
-                continue
-            # split remainder into insert segments
-            segments = format[i + 1 :].split("%")
-            for segment in segments:
-                # If the segment is empty, skip it
-                if len(segment) == 0:
-                    continue
-                # get segment type and any modifiers
-                seg_remainder_start = 1
-                seg_eliminate_leading_zero = False
-                seg_frac_digits = None
-                seg_type = segment[0]
-                if seg_type == "#":
-                    seg_eliminate_leading_zero = True
-                    if len(segment) > 1:
-                        seg_type = segment[1]
-                        seg_remainder_start = 2
-                if seg_type == 'f':
-                    if len(segment) > 1 and segment[1].isdigit():
-                        # fractional seconds precision
-                        frac_digits = 0
-                        for i in range(1, len(segment)):
-                            if not segment[i].isdigit():
-                                break
-                            frac_digits = frac_digits*10 + int(segment[i])
-                        seg_frac_digits = frac_digits
-                        seg_remainder_start = i+1
-                # process the segment
-                if seg_type in ['K']:
-                    fmt += CalendarAtts[language][self.calendar]['name']
-                elif seg_type in ['k']:
-                    fmt += CalendarAtts[language][self.calendar]['abbrv']
-                else:
-                    fmt += self._format_segment({'type' : seg_type, 'eliminate_leading_zero' : seg_eliminate_leading_zero, 'frac_digits' : seg_frac_digits}, language)
-                for i in range(seg_remainder_start, len(segment)):
-                    fmt += segment[i]
-
-            return fmt
+            # The plan is compiled once per (presentation class, calendar, format, language)
+            plan = _compile_presentation(type(self), self.calendar, format, language)
+            return "".join([op if op.__class__ is str else op(self) for op in plan])
+
+        @classmethod
         @abstractmethod
-        def _format_segment(self, segment: dict, language: str) -> str:
+        def _compile_segment(cls, segment: dict, language: str):
             """
-            Format a single segment based on the segment information and language.
+            Resolve an insert segment of a format to a function of the presentation returning its text, or
+            to literal text.  Called once per segment when the format is compiled, see _compile_presentation.
             This method should be implemented in subclasses for specific calendar systems.
             """
             raise NotImplementedError(
-                "Subclasses must implement _format_segment() method"
+                "Subclasses must implement _compile_segment() method"
             )
 
 
@@ -894,6 +1096,39 @@ class UnivMoment:
             raise ValueError("jdn must be an integer, decimal, float or string")
         rd_day = jdn - Decimal(1721424.5)
         return UnivMoment(rd_day, precision=Precision.HOUR, description=description)
+    # CONSTRUCT moment from a fractional R.D. moment
+    @staticmethod
+    def from_rd_moment(
+        rd_moment: int | Decimal | str,
+        precision: Precision = Precision.SECOND,
+        description: str = None
+    ) -> "UnivMoment":
+        """
+        Create from an R.D. moment, a day number with the time of day as its fraction,
+        as returned by the astronomical functions. The time of day is rounded to the precision,
+        DAY and coarser precisions keep the day only.
+        """
+        rd_moment = Decimal(rd_moment) if isinstance(rd_moment, (int, str)) else rd_moment
+        if not isinstance(rd_moment, Decimal):
+            raise ValueError("rd_moment must be an integer, decimal or string")
+        rd_day = floor(rd_moment)
+        if PrecisionAtts[precision]['level'] <= PrecisionAtts[Precision.DAY]['level']:
+            return UnivMoment(rd_day, precision=precision, description=description)
+        quantum = {Precision.HOUR: Decimal(3600), Precision.MINUTE: Decimal(60)}.get(
+            precision, Decimal(10) ** (PrecisionAtts[precision]['power'] or 0)
+        )
+        seconds = ((rd_moment - rd_day) * 86400 / quantum).to_integral_value() * quantum
+        if seconds >= 86400:
+            rd_day, seconds = rd_day + 1, seconds - 86400
+        hour, seconds = divmod(seconds, 3600)
+        minute, second = divmod(seconds, 60)
+        return UnivMoment(rd_day, (int(hour), int(minute), second), precision, description=description)
+
+    def to_rd_moment(self) -> Decimal:
+        """The moment as a single R.D. number, the time of day as the fraction of the day."""
+        hour, minute, second = self.rd_time
+        return self.rd_day + (hour * 3600 + minute * 60 + second) / Decimal(86400)
+
     # CONSTRUCT moment from UNIX timestamp
     @staticmethod
     def from_unix_timestamp( 
@@ -1324,20 +1559,165 @@ class UnivMoment:
         + _ISO_8601_PATTERNS
     )
 
+    # All patterns compiled once into a single regex, so parsing is one pass with direct dispatch
+    _ALL_REGEX, _ALL_DISPATCH = _combine_patterns(_ALL_PATTERNS)
+    _ALL_COMPILED = [(re.compile(pattern), converter) for pattern, converter in _ALL_PATTERNS]
+
+    # ISO 8601 FAST PATH ######################################################################
+    # The grammar index reported by _parse for moments of the fast path
+    ISO_8601_GRAMMAR = len(_ALL_PATTERNS)
+
     @staticmethod
-    def from_string(timestamp_str: str, description : str = "") -> "UnivMoment":
-        """Parse all time scales: geological, astronomical, and human calendars"""
+    def _iso_week_monday(year: int) -> int:
+        """R.D. of the Monday of ISO week 1, the week with January 4 (R.D. 1 is a Monday)"""
+        jan_4 = rd_from_gregorian(year, 1, 4)
+        return jan_4 - (jan_4 - 1) % 7
+
+    @staticmethod
+    def _iso_8601_date(text: str) -> Optional[tuple]:
+        """(year, month, day) of an ISO 8601 date by slicing, None when not a valid ISO date"""
+        n = len(text)
+        if n < 7 or not _is_digits(text[:4]):
+            return None
+        year = int(text[:4])
+        extended = text[4] == '-'
+        body = text[5:] if extended else text[4:]
+        if body[:1] == 'W':
+            # Week date YYYY-Www-D, YYYYWwwD, YYYY-Www, YYYYWww
+            week, weekday = body[1:3], body[3:]
+            if extended and weekday:
+                if weekday[0] != '-':
+                    return None
+                weekday = weekday[1:]
+            if not _is_digits(week) or (weekday and (len(weekday) != 1 or not _is_digits(weekday))):
+                return None
+            week, weekday = int(week), int(weekday) if weekday else 1
+            monday = UnivMoment._iso_week_monday(year)
+            weeks = (UnivMoment._iso_week_monday(year + 1) - monday) // 7
+            if not (1 <= week <= weeks and 1 <= weekday <= 7):
+                return None
+            year, month, day = gregorian_from_rd(monday + (week - 1) * 7 + weekday - 1)
+            return int(year), int(month), int(day)
+        if len(body) == 3 and _is_digits(body):
+            # Ordinal date YYYY-DDD, YYYYDDD
+            ordinal = int(body)
+            if not 1 <= ordinal <= (366 if is_gregorian_leap_year(year) else 365):
+                return None
+            year, month, day = gregorian_from_rd(rd_from_gregorian(year, 1, 1) + ordinal - 1)
+            return int(year), int(month), int(day)
+        if extended and len(body) == 5 and body[2] == '-' and _is_digits(body[:2]) and _is_digits(body[3:]):
+            return year, int(body[:2]), int(body[3:])
+        if not extended and len(body) == 4 and _is_digits(body):
+            return year, int(body[:2]), int(body[2:])
+        if extended and len(body) == 2 and _is_digits(body):
+            # Year and month YYYY-MM
+            return year, int(body), None
+        return None
+
+    @staticmethod
+    def _iso_8601_time(text: str) -> Optional[tuple]:
+        """(hour, minute, second, precision, offset in minutes) of an ISO 8601 time by slicing, None when not valid"""
+        offset = 0
+        if text[-1:] == 'Z':
+            text = text[:-1]
+        else:
+            sign_at = max(text.rfind('+'), text.rfind('-'))
+            if sign_at >= 0:
+                zone = text[sign_at + 1:].replace(':', '', 1) if text[sign_at + 3:sign_at + 4] == ':' else text[sign_at + 1:]
+                if len(zone) not in (2, 4) or not _is_digits(zone):
+                    return None
+                offset = int(zone[:2]) * 60 + (int(zone[2:]) if len(zone) == 4 else 0)
+                if text[sign_at] == '-':
+                    offset = -offset
+                text = text[:sign_at]
+        fraction = None
+        for separator in '.,':
+            if separator in text:
+                text, _, fraction = text.partition(separator)
+                if not (1 <= len(fraction) <= 18) or not _is_digits(fraction):
+                    return None
+                break
+        fields = text.split(':') if ':' in text else [text[i:i + 2] for i in range(0, len(text), 2)]
+        if not (1 <= len(fields) <= 3) or not all(len(field) == 2 and _is_digits(field) for field in fields):
+            return None
+        if fraction is not None and len(fields) != 3:
+            return None
+        hour = int(fields[0])
+        minute = int(fields[1]) if len(fields) > 1 else None
+        if len(fields) < 3:
+            return hour, minute, None, (Precision.HOUR, Precision.MINUTE)[len(fields) - 1], offset
+        if fraction is None:
+            return hour, minute, int(fields[2]), Precision.SECOND, offset
+        second = Decimal(f"{fields[2]}.{fraction}")
+        return hour, minute, second, UnivMoment._precision_from_fraction_digits(len(fraction)), offset
+
+    @staticmethod
+    def _from_iso_8601(text: str, description: str = "") -> Optional["UnivMoment"]:
+        """
+        ISO 8601 by integer slicing, None when the text is not ISO 8601 or not a valid date.
+        Dates: calendar (YYYY-MM-DD, YYYYMMDD, YYYY-MM), week (YYYY-Www-D, YYYYWwwD, YYYY-Www) and
+        ordinal (YYYY-DDD, YYYYDDD).  An optional time Thh[:mm[:ss[.f]]] or Thh[mm[ss[.f]]] has up to
+        18 fraction digits, mapped to the precision as by from_string, and an offset Z, +hh, +hh:mm or +hhmm.
+        """
+        date_text, separator, time_text = text.partition('T')
+        date = UnivMoment._iso_8601_date(date_text)
+        if date is None:
+            return None
+        if not separator:
+            year, month, day = date
+            if month is None:
+                return UnivMoment.from_gregorian(year, month, None, precision=Precision.MONTH, description=description)
+            return UnivMoment.from_gregorian(year, month, day, precision=Precision.DAY, description=description)
+        time = UnivMoment._iso_8601_time(time_text)
+        if time is None or date[2] is None:
+            return None
+        hour, minute, second, precision, offset = time
+        moment = UnivMoment.from_gregorian(*date, hour, minute, second, precision=precision, description=description)
+        if offset:
+            moment = moment - (Decimal(0), 0, offset, Decimal(0))
+        return moment
+
+    @staticmethod
+    def _parse(timestamp_str: str, description : str = "") -> tuple[Optional["UnivMoment"], int]:
+        """
+        from_string, also returning the index in _ALL_PATTERNS of the grammar that produced the moment,
+        ISO_8601_GRAMMAR for the ISO 8601 fast path.
+        When all matching converters failed the moment is None with the index of the first grammar
+        that matched, when no grammar matched it is None with -1.
+        """
         timestamp_str = timestamp_str.strip()
 
-        for pattern, converter in UnivMoment._ALL_PATTERNS:
-            match = re.fullmatch(pattern, timestamp_str)
+        # ISO 8601 first, most input is ISO; anything it rejects goes through the grammars
+        try:
+            moment = UnivMoment._from_iso_8601(timestamp_str, description)
+        except (ValueError, TypeError):
+            moment = None
+        if moment is not None:
+            return moment, UnivMoment.ISO_8601_GRAMMAR
+
+        match = UnivMoment._ALL_REGEX.fullmatch(timestamp_str)
+        if match is None:
+            return None, -1
+        ndx, offset, names = UnivMoment._ALL_DISPATCH[match.lastindex]
+        try:
+            return UnivMoment._ALL_COMPILED[ndx][1](_AlternativeMatch(match, offset, names), description=description), ndx
+        except Exception:
+            pass
+        # The converter rejected the values (e.g. month 13), try the later patterns as before
+        for later, (pattern, converter) in enumerate(UnivMoment._ALL_COMPILED[ndx + 1:], ndx + 1):
+            match = pattern.fullmatch(timestamp_str)
             if match:
                 try:
-                    return converter(match, description=description)
+                    return converter(match, description=description), later
                 except Exception:
                     continue
 
-        return None
+        return None, ndx
+
+    @staticmethod
+    def from_string(timestamp_str: str, description : str = "") -> "UnivMoment":
+        """Parse all time scales: geological, astronomical, and human calendars"""
+        return UnivMoment._parse(timestamp_str, description)[0]
 
 
 
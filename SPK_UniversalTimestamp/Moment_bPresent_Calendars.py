@@ -1,13 +1,56 @@
 from decimal import Decimal
 from abc import abstractmethod
-from datetime import datetime
+from bisect import bisect_right
+from datetime import date, datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
-from tzlocal import get_localzone
-from .CC00_Decimal_library import trunc
-from .CC02_Gregorian import gregorian_from_rd
+from .CC00_Decimal_library import floor, trunc
+from .CC02_Gregorian import gregorian_from_rd, rd_from_gregorian
 from .Constants_aCommon import Calendar, CalendarAtts, Precision, PrecisionAtts
 from .Moment_aUniversal import UnivMoment
 
+# Time zone transition tables cover these Gregorian years, outside them offsets are computed directly
+TZ_TABLE_FIRST_YEAR = 1847
+TZ_TABLE_LAST_YEAR = 2100
+
+
+def _time_zone(tz_name: str):
+    try:
+        if tz_name.lower() == 'local':
+            from tzlocal import get_localzone
+            return get_localzone()
+        return ZoneInfo(tz_name)
+    except ZoneInfoNotFoundError:
+        raise ValueError(f"Timezone '{tz_name}' not found.")
+
+
+def _utc_offset_at_midnight(tz, year: int, month: int, day: int) -> tuple[int, int]:
+    offset = datetime(year, month, day, 0, 0, 0, 0, tzinfo=tz).utcoffset()
+    # Format as ±HH:MM
+    hours, remainder = divmod(offset.total_seconds(), 3600)
+    minutes = remainder // 60
+    return (int(hours), int(minutes))
+
+
+@lru_cache(maxsize=64)
+def _utc_offset_table(tz_name: str) -> tuple[list, list]:
+    """
+    The transitions of a time zone as (R.D. days, offsets): offsets[i] applies from days[i]
+    up to the next transition.  Built once per zone, day by day over the table years,
+    since the R.D. day is the ordinal of the proleptic Gregorian date.
+    """
+    tz = _time_zone(tz_name)
+    days = []
+    offsets = []
+    for rd in range(rd_from_gregorian(TZ_TABLE_FIRST_YEAR, 1, 1), rd_from_gregorian(TZ_TABLE_LAST_YEAR + 1, 1, 1)):
+        d = date.fromordinal(rd)
+        offset = _utc_offset_at_midnight(tz, d.year, d.month, d.day)
+        if not offsets or offset != offsets[-1]:
+            days.append(rd)
+            offsets.append(offset)
+    return days, offsets
+
+
 class Present_Calendars(UnivMoment.Presentation):
     """
     Calendar representation of a UnivMoment.
@@ -65,39 +108,79 @@ class Present_Calendars(UnivMoment.Presentation):
     # timing for train schedules. North American railroads adopted time zones in November 1883,
     # known as "the Day of Two Noons".
     @staticmethod
-    def get_utc_offset(tz_name: str, rd_day : Decimal) -> tuple[Decimal, int ,int, Decimal]:
+    def get_utc_offset(tz_name: str, rd_day : Decimal) -> tuple[int, int]:
         """
-        Return the UTC offset for a given time zone name and datetime.
-        If dt is None, use current time.
+        Return the UTC offset (hours, minutes) of a time zone at local midnight of the R.D. day.
+        Days before 1847 have no offset.  Within the table years the offset is found by bisect
+        in the cached transition table of the zone.
         """
-        try:
-            if tz_name.lower() == 'local':
-                tz = get_localzone()
-            else:
-                tz = ZoneInfo(tz_name)
-        except ZoneInfoNotFoundError:
-            raise ValueError(f"Timezone '{tz_name}' not found.")
-        year, month, day = gregorian_from_rd(rd_day)
-        if year < 1847:
-            return (Decimal(0), 0, 0, Decimal(0))
-        dt = datetime(int(year), int(month), int(day), 0, 0, 0, 0, tzinfo=tz)
-        offset = dt.utcoffset()
-        # Format as ±HH:MM
-        hours, remainder = divmod(offset.total_seconds(), 3600)
-        minutes = remainder // 60
-        return (int(hours), int(minutes))
+        days, offsets = _utc_offset_table(tz_name)
+        if rd_day < days[0]:
+            return (0, 0)
+        rd = int(floor(rd_day))
+        if rd < rd_from_gregorian(TZ_TABLE_LAST_YEAR + 1, 1, 1):
+            return offsets[bisect_right(days, rd) - 1]
+        year, month, day = gregorian_from_rd(rd)
+        return _utc_offset_at_midnight(_time_zone(tz_name), int(year), int(month), int(day))
+
+    @staticmethod
+    def get_utc_offset_array(tz_name: str, rd_days):
+        """
+        Vectorized get_utc_offset over an array of R.D. days.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: int32 hours and minutes, 0 before 1847
+        """
+        import numpy as np
+        days, offsets = _utc_offset_table(tz_name)
+        rd = np.floor(np.asarray(rd_days, dtype=np.float64)).astype(np.int64)
+        table_hours = np.array([0] + [offset[0] for offset in offsets], dtype=np.int32)
+        table_minutes = np.array([0] + [offset[1] for offset in offsets], dtype=np.int32)
+        # index 0 is before the first transition, that is before 1847
+        ndx = np.searchsorted(np.asarray(days, dtype=np.int64), rd, side='right')
+        hours = table_hours[ndx]
+        minutes = table_minutes[ndx]
+        beyond = rd >= rd_from_gregorian(TZ_TABLE_LAST_YEAR + 1, 1, 1)
+        for day in np.unique(rd[beyond]):
+            hours[rd == day], minutes[rd == day] = Present_Calendars.get_utc_offset(tz_name, Decimal(int(day)))
+        return hours, minutes
     
     # CONSTRUCTOR ############################################################################
-    def __init__(self, calendar : Calendar, moment: UnivMoment, year: Decimal, tz : str | dict = 'UTC'):
+    def __init__(self, calendar : Calendar, moment: UnivMoment, year: Decimal | None, tz : str | dict = 'UTC'):
+        """
+        year is None when the subclass computes its calendar fields lazily, see _convert_calendar
+        """
+        self._beginning_of_time = moment.rd_day == Decimal('-Infinity')
         self.tz = tz
         self.tz_offset = (0,0)  # (hours, minutes)        
         if tz and tz != 'UTC':
             self.tz_offset = Present_Calendars.get_utc_offset(tz, moment.rd_day)
             moment = moment + (Decimal(0), self.tz_offset[0], self.tz_offset[1], Decimal(0))
+        # The date is the one of the local time
+        self._calendar_rd_day = moment.rd_day
         super().__init__(calendar, moment, year)
-        if year != Decimal('-Infinity'):
+        if not self._beginning_of_time:
             self.hour, self.minute, self.seconds = moment.rd_time
         return
+
+    # LAZY CALENDAR FIELDS ###################################################################
+    # The calendar conversion runs only when a directive of the format plan references one
+    # of these fields, so that a time only format (%H:%M) never converts the date.
+    _CALENDAR_FIELDS = ("year", "month", "day")
+
+    def __getattr__(self, name: str):
+        if name in self._CALENDAR_FIELDS and "_calendar_rd_day" in self.__dict__:
+            self._convert_calendar(name)
+            if name in self.__dict__:
+                return self.__dict__[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def _convert_calendar(self, field: str):
+        """
+        Set the calendar fields (year, month, day) from the R.D. day self._calendar_rd_day.
+        field is the one being accessed, a subclass may compute less when it is the only one needed.
+        """
+        raise NotImplementedError("Sub-classes must implement this method")
     
     # PRESENTATION LAYER METHODS ############################################################
     """
@@ -154,24 +237,27 @@ class Present_Calendars(UnivMoment.Presentation):
     Modifiers
     %#m,%#d,%#j - eliminates leading 0s
     """   
-    def _format_segment(self, segment : dict, language : str) -> str:
+    @classmethod
+    def _compile_segment(cls, segment : dict, language : str):
         seg_type = segment['type']
         eliminate_leading_zero = segment.get('eliminate_leading_zero', False)
         frac_digits = segment.get('frac_digits', None)
-        # 
+        # The handlers of cls, so the overrides of a calendar subclass apply
         if seg_type in 'YyCc':
-            return self._strftime_year(seg_type, language, eliminate_leading_zero)
+            handler = cls._strftime_year
         elif seg_type in 'mBb':
-            return self._strftime_month(seg_type, language, eliminate_leading_zero)
+            handler = cls._strftime_month
         elif seg_type in 'dAaj':
-            return self._strftime_day(seg_type, language, eliminate_leading_zero)
+            handler = cls._strftime_day
         elif seg_type in 'HIpMSfZz':
-            return self._strftime_time(seg_type, language, eliminate_leading_zero, frac_digits)
+            strftime_time = cls._strftime_time
+            return lambda self: strftime_time(self, seg_type, language, eliminate_leading_zero, frac_digits)
         elif seg_type in 'Xx':
-            return self._strftime_compound(seg_type, language, eliminate_leading_zero)
+            handler = cls._strftime_compound
         else:
             return f'%{seg_type}'  # Unknown segment, return as is
-        
+        return lambda self: handler(self, seg_type, language, eliminate_leading_zero)
+
     def _strftime_year(
         self, seg_type: str, language: str, eliminate_leading_zero: bool
     ) -> str:
@@ -196,7 +282,7 @@ class Present_Calendars(UnivMoment.Presentation):
         return fmt
 
     def _strftime_month(self, seg_type : str, language :str, eliminate_leading_zero: bool = False) -> str:
-        if self.year == Decimal('-Infinity'):
+        if self._beginning_of_time:
             return ""
         if self.month is None:
             return ""
@@ -216,7 +302,7 @@ class Present_Calendars(UnivMoment.Presentation):
         raise NotImplementedError("Sub-classes must implement this method")
     
     def _strftime_day(self, seg_type : str, language :str, eliminate_leading_zero: bool = False) -> str:
-        if self.year == Decimal('-Infinity'):
+        if self._beginning_of_time:
             return ""
         fmt = ""
         if self.day is None:
@@ -238,14 +324,14 @@ class Present_Calendars(UnivMoment.Presentation):
         """
         Get a day of the week attribute.
         """
-        if self.year == Decimal('-Infinity'):
+        if self._beginning_of_time:
             return "..."
         index = int(self.moment.rd_day - 1) % 7
         return Present_Calendars.DAY_OF_THE_WEEK_ATTS[language][index][attr]
 
 
     def _strftime_time(self, seg_type : str, language :str, eliminate_leading_zero: bool = False, frac_digits : int = None) -> str:
-        if self.year == Decimal('-Infinity'):
+        if self._beginning_of_time:
             return ""
         # Hour ###############################################################################
         fmt = ""
@@ -305,9 +391,10 @@ class Present_Calendars(UnivMoment.Presentation):
         elif seg_type == 'z':
             # UTC offset, assuming no timezone information is available
             if self.tz_offset is not None:
-                offset_hours, offset_minutes = self.tz_offset[0], self.tz_offset[1]
-                sign = '+' if (offset_hours > 0 or (offset_hours == 0 and offset_minutes >= 0)) else '-'
-                fmt = f"{sign}{abs(offset_hours):02d}:{abs(offset_minutes):02d}"
+                # get_utc_offset floors the hours, -03:30 is (-4, 30)
+                offset = int(self.tz_offset[0]) * 60 + int(self.tz_offset[1])
+                sign = '+' if offset >= 0 else '-'
+                fmt = f"{sign}{abs(offset) // 60:02d}:{abs(offset) % 60:02d}"
         # Internal Timezone Name ###################################################################
         elif seg_type == 'Z':
             if self.tz is not None:
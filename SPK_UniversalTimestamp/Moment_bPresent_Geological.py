@@ -1,8 +1,10 @@
 from decimal import Decimal
+from typing import Optional, Union
 from .Constants_aCommon import Calendar, Precision, PrecisionAtts
 from .Moment_aUniversal import UnivMoment
 
 import bisect
+import threading
 
 GEOLOGICAL_TIME_STRUCTURE = {
     "Source": "https://rock.geosociety.org/net/documents/gsa/timescale/timescl.pdf",
@@ -872,10 +874,165 @@ GEOLOGICAL_TIME_STRUCTURE = {
 }
 
 
-GEOLOGICAL_EONS = []
-GEOLOGICAL_ERAS = []
-GEOLOGICAL_PERIODS = []
-GEOLOGICAL_EPOCHSandAGES = []
+# GEOLOGICAL_EONS, GEOLOGICAL_ERAS, GEOLOGICAL_PERIODS and GEOLOGICAL_EPOCHSandAGES are built
+# from GEOLOGICAL_TIME_STRUCTURE on first use, see _geological_index and __getattr__
+GEOLOGICAL_TABLE_NAMES = ("GEOLOGICAL_EONS", "GEOLOGICAL_ERAS", "GEOLOGICAL_PERIODS", "GEOLOGICAL_EPOCHSandAGES")
+GEOLOGICAL_LEVELS = ("eon", "era", "period", "epoch")
+_GEOLOGICAL_LOCK = threading.Lock()
+_GEOLOGICAL_TABLES = None   # table name -> list of entries
+_GEOLOGICAL_INDEX = None    # level -> (sorted start years, entries in the same order)
+
+
+def _geological_index(compact: Optional[dict] = None) -> dict:
+    """
+    The compiled geological index, built once under a lock on first use.
+    The tables are published only when complete, so readers never see a partial index.
+    """
+    global _GEOLOGICAL_TABLES, _GEOLOGICAL_INDEX
+    if _GEOLOGICAL_INDEX is None:
+        with _GEOLOGICAL_LOCK:
+            if _GEOLOGICAL_INDEX is None:
+                if compact is None:
+                    tables = _build_geological_tables()
+                else:
+                    tables = _tables_from_compact(compact)
+                index = {}
+                for level, name in zip(GEOLOGICAL_LEVELS, GEOLOGICAL_TABLE_NAMES):
+                    entries = sorted(tables[name], key=lambda period: period["start"]["year"])
+                    index[level] = ([period["start"]["year"] for period in entries], entries)
+                _GEOLOGICAL_TABLES = tables
+                _GEOLOGICAL_INDEX = index
+    return _GEOLOGICAL_INDEX
+
+
+def __getattr__(name: str):
+    """Build the geological tables on first access of GEOLOGICAL_EONS ... GEOLOGICAL_EPOCHSandAGES"""
+    if name in GEOLOGICAL_TABLE_NAMES:
+        _geological_index()
+        return _GEOLOGICAL_TABLES[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def geological_tables_compact() -> dict:
+    """
+    The geological tables in a compact JSON serializable form, boundaries as [year string, description].
+    Passing it to load_geological_tables skips the walk of GEOLOGICAL_TIME_STRUCTURE.
+    """
+    _geological_index()
+
+    def compact_entry(entry: dict) -> dict:
+        row = {key: value for key, value in entry.items() if key not in ("start", "end")}
+        for key in ("start", "end"):
+            value = entry[key]
+            row[key] = [str(value["year"]), value["description"]] if isinstance(value, dict) else value
+        return row
+
+    compact = {"version": GEOLOGICAL_TIME_STRUCTURE["version"]}
+    for name in GEOLOGICAL_TABLE_NAMES:
+        compact[name] = [compact_entry(entry) for entry in _GEOLOGICAL_TABLES[name]]
+    return compact
+
+
+def _tables_from_compact(compact: dict) -> dict:
+    if compact.get("version") != GEOLOGICAL_TIME_STRUCTURE["version"]:
+        raise ValueError(
+            f"Geological tables version {compact.get('version')} does not match {GEOLOGICAL_TIME_STRUCTURE['version']}"
+        )
+    tables = {}
+    for name in GEOLOGICAL_TABLE_NAMES:
+        entries = []
+        for row in compact[name]:
+            entry = dict(row)
+            for key in ("start", "end"):
+                if isinstance(row[key], list):
+                    entry[key] = {"year": Decimal(row[key][0]), "description": row[key][1]}
+            entries.append(entry)
+        tables[name] = entries
+    return tables
+
+
+def load_geological_tables(compact: dict) -> None:
+    """
+    Initialize the geological tables from the form of geological_tables_compact.
+    Has no effect when the tables are already built.
+    """
+    _geological_index(compact)
+    return
+
+
+def _geological_entry(level: str, year: Decimal) -> Optional[dict]:
+    """The entry of the level in which the year (negative, years before present) falls, None before the first"""
+    keys, entries = _geological_index()[level]
+    ins_pnt = bisect.bisect_left(keys, year) - 1
+    if ins_pnt < 0:
+        return None
+    return entries[ins_pnt]
+
+
+def classify(years_ago: Union[int, float, str, Decimal]) -> dict:
+    """
+    Classify a geological age in a single lookup per level.
+
+    Args:
+        years_ago (Union[int, float, str, Decimal]): years before present, the sign is ignored
+    Returns:
+        dict: the names of the "eon", "era", "period" and "epoch" (epoch or age),
+              None where the age precedes the first unit of the level
+    """
+    if not isinstance(years_ago, Decimal):
+        years_ago = Decimal(str(years_ago))
+    year = (-abs(years_ago)).to_integral_value(rounding='ROUND_FLOOR')
+    chain = {}
+    for level in GEOLOGICAL_LEVELS:
+        entry = _geological_entry(level, year)
+        chain[level] = entry["name"] if entry else None
+    return chain
+
+
+# Compiled on first use by classify_array: level -> (float64 start years, names)
+_GEOLOGICAL_ARRAYS = {}
+
+
+def _geological_arrays(level: str) -> tuple:
+    if level not in _GEOLOGICAL_ARRAYS:
+        import numpy as np
+        keys, entries = _geological_index()[level]
+        _GEOLOGICAL_ARRAYS[level] = (
+            np.array([float(key) for key in keys], dtype=np.float64),
+            tuple(entry["name"] for entry in entries),
+        )
+    return _GEOLOGICAL_ARRAYS[level]
+
+
+def classify_array(ages, precision: Precision = Precision.MILLION_YEARS) -> tuple[dict, dict]:
+    """
+    Classify an array of geological ages with NumPy searchsorted over the compiled boundaries.
+    The ages are interpreted as in UnivMoment.from_geological, for example 66.0 million years ago.
+
+    Args:
+        ages (array-like): ages before present in units of the precision, the sign is ignored
+        precision (Precision): YEAR or coarser
+    Returns:
+        tuple[dict, dict]: codes, names
+            codes maps "eon", "era", "period" and "epoch" to int16 arrays of indices into names[level],
+            -1 where the age precedes the first unit of the level (or is NaN)
+    """
+    import numpy as np
+    if PrecisionAtts[precision]["level"] > PrecisionAtts[Precision.YEAR]["level"]:
+        raise ValueError(f"Invalid precision {precision} for geological time. Must be YEAR or higher.")
+    ages = np.abs(np.asarray(ages, dtype=np.float64))
+    # Whole years ago as from_geological truncates them; rounding first absorbs the float error of the scaling
+    with np.errstate(invalid='ignore'):
+        year = -np.floor(np.round(ages * 10.0 ** PrecisionAtts[precision]["power"], 6))
+    missing = np.isnan(year)
+    codes = {}
+    names = {}
+    for level in GEOLOGICAL_LEVELS:
+        keys, names[level] = _geological_arrays(level)
+        code = np.searchsorted(keys, year, side='left').astype(np.int16) - 1
+        code[missing] = -1
+        codes[level] = code
+    return codes, names
 
 
 class Present_Geological(UnivMoment.Presentation):
@@ -923,119 +1080,64 @@ class Present_Geological(UnivMoment.Presentation):
     Modifiers
     
     """
-    def _format_segment(self, segment : dict, language : str) -> str:
+    @classmethod
+    def _compile_segment(cls, segment : dict, language : str):
         seg_type = segment['type']
         #eliminate_leading_zero = segment.get('eliminate_leading_zero', False)
         # 
         if seg_type in 'Yy':
-            """
-            Format the year component based on the segment type and language.
-            """
-            if self.precision == Precision.BILLION_YEARS:
-                year = f"{self.year / 1_000_000_000:.2f}"
-            elif self.precision == Precision.MILLION_YEARS:
-                year = f"{self.year / 1_000_000:.2f}"
-            elif self.precision == Precision.THOUSAND_YEARS:
-                year = f"{self.year / 1_000:.2f}"
-            elif self.precision == Precision.YEAR:
-                year = f"{self.year}"
-            else:
-                raise ValueError("Year is not defined for the current precision level.")
-            # Handle negative vales
-            fmt = year
-            if seg_type == "Y":
-                if (PrecisionAtts[self.precision]["level"] < PrecisionAtts[Precision.YEAR]["level"]):
-                    fmt += f" {PrecisionAtts[self.precision]['abbrv']}"
-            elif seg_type == "y":
-                if (PrecisionAtts[self.precision]["level"] < PrecisionAtts[Precision.YEAR]["level"]):
-                    fmt += f" {PrecisionAtts[self.precision]['abbrv']}"
-            return fmt
-        elif seg_type in 'O':
-            """
-            Format the EONs Component 
-            """
-            global GEOLOGICAL_EONS
-
-            def key_func(x):
-                return x["start"]["year"]
-
-            ins_pnt = (
-                bisect.bisect_left(
-                    [key_func(item) for item in GEOLOGICAL_EONS], self.year
-                )
-                - 1
-            )
-            if ins_pnt < 0:
-                return ""
-            period = GEOLOGICAL_EONS[ins_pnt]
-            return period["name"] if period else "Unknown eon"
-        elif seg_type in 'R':
-            """
-            Format the ERAs Component 
-            """
-            global GEOLOGICAL_ERAS
-
-            def key_func(x):
-                return x["start"]["year"]
+            return lambda self: self._strftime_year(seg_type)
+        elif seg_type in _PERIOD_DIRECTIVES:
+            level, before_first = _PERIOD_DIRECTIVES[seg_type]
+            return lambda self: self._strftime_period(level, before_first)
+        else:
+            return f'%{seg_type}'  # Unknown segment, return as is
 
-            ins_pnt = (
-                bisect.bisect_left(
-                    [key_func(item) for item in GEOLOGICAL_ERAS], self.year
-                )
-                - 1
-            )
-            if ins_pnt < 0:
-                return "pre-eras"
-            period = GEOLOGICAL_ERAS[ins_pnt]
-            return period["name"] if period else "Unknown era"
-        elif seg_type == "P":
-            """
-            Format the PERIODSs Component 
-            """
-            global GEOLOGICAL_PERIODS
+    def _strftime_year(self, seg_type : str) -> str:
+        """
+        Format the year component based on the segment type and language.
+        """
+        if self.precision == Precision.BILLION_YEARS:
+            year = f"{self.year / 1_000_000_000:.2f}"
+        elif self.precision == Precision.MILLION_YEARS:
+            year = f"{self.year / 1_000_000:.2f}"
+        elif self.precision == Precision.THOUSAND_YEARS:
+            year = f"{self.year / 1_000:.2f}"
+        elif self.precision == Precision.YEAR:
+            year = f"{self.year}"
+        else:
+            raise ValueError("Year is not defined for the current precision level.")
+        # Handle negative vales
+        fmt = year
+        if seg_type == "Y":
+            if (PrecisionAtts[self.precision]["level"] < PrecisionAtts[Precision.YEAR]["level"]):
+                fmt += f" {PrecisionAtts[self.precision]['abbrv']}"
+        elif seg_type == "y":
+            if (PrecisionAtts[self.precision]["level"] < PrecisionAtts[Precision.YEAR]["level"]):
+                fmt += f" {PrecisionAtts[self.precision]['abbrv']}"
+        return fmt
 
-            def key_func(x):
-                return x["start"]["year"]
+    def _strftime_period(self, level : str, before_first : str) -> str:
+        """
+        Format the eon, era, period or small epoch and age component, before_first precedes the first one
+        """
+        period = _geological_entry(level, self.year)
+        if period is None:
+            return before_first
+        return period["name"]
 
-            ins_pnt = (
-                bisect.bisect_left(
-                    [key_func(item) for item in GEOLOGICAL_PERIODS], self.year
-                )
-                - 1
-            )
-            if ins_pnt < 0:
-                return "pre-periods"
-            period = GEOLOGICAL_PERIODS[ins_pnt]
-            return period["name"] if period else "Unknown period"
-        elif seg_type == "a":
-            """
-            Format the small epochs and ages Component 
-            """
-            global GEOLOGICAL_EPOCHSandAGES
 
-            def key_func(x):
-                return x["start"]["year"]
+# Geological directives: (level, text before the first unit of the level)
+_PERIOD_DIRECTIVES = {
+    'O': ("eon", ""),
+    'R': ("era", "pre-eras"),
+    'P': ("period", "pre-periods"),
+    'a': ("epoch", "pre-epochs"),
+}
 
-            ins_pnt = (
-                bisect.bisect_left(
-                    [key_func(item) for item in GEOLOGICAL_EPOCHSandAGES], self.year
-                )
-                - 1
-            )
-            if ins_pnt < 0:
-                return "pre-epochs"
-            period = GEOLOGICAL_EPOCHSandAGES[ins_pnt]
-            return period["name"] if period else "Unknown epoch"
-        else:
-            return f'%{seg_type}'  # Unknown segment, return as is
-        
 
-def main():
-    global \
-        GEOLOGICAL_EONS, \
-        GEOLOGICAL_ERAS, \
-        GEOLOGICAL_PERIODS, \
-        GEOLOGICAL_EPOCHSandAGES
+def _build_geological_tables() -> dict:
+    """Walk GEOLOGICAL_TIME_STRUCTURE into the lists of eons, eras, periods and epochs/ages"""
 
     def convert_time(
         year: Decimal | int | float, precision: Precision, description: str = ""
@@ -1308,10 +1410,9 @@ def main():
     GEOLOGICAL_EONS.sort(
         key=lambda period: period["start"]["year"] if period["start"] else float("-inf")
     )
-    return
-
-
-try:
-    main()
-except Exception as e:
-    print(f"Error creating geological periods: {e}")
+    return dict(
+        zip(
+            GEOLOGICAL_TABLE_NAMES,
+            (GEOLOGICAL_EONS, GEOLOGICAL_ERAS, GEOLOGICAL_PERIODS, GEOLOGICAL_EPOCHSandAGES),
+        )
+    )
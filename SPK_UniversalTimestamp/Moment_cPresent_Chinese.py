@@ -1,4 +1,3 @@
-
 from .CC19_Chinese_1645 import chinese_from_rd
 from .Constants_aCommon import Calendar, Precision, PrecisionAtts
 from .Constants_Chinese import chinese_MONTH_ATTS
@@ -12,9 +11,14 @@ class Present_Chinese(Present_Calendars):
     """
     # CONSTRUCTOR ############################################################################
     def __init__(self, moment: UnivMoment, tz : str | tuple[float,float] = 'UTC'):
-        rd = moment.rd_day
+        super().__init__(Calendar.CHINESE, moment, None, tz)
+        return
+
+    def _convert_calendar(self, field: str):
+        # The year, month and day always come from one chinese_from_rd, so %Y agrees with %Y-%m-%d
+        rd = self._calendar_rd_day
         cycle, year, month, leap, day = chinese_from_rd(rd)
-        super().__init__(Calendar.CHINESE, moment, (cycle,year), tz)
+        self.year = (cycle, year)
         self.month = ( 1, False)
         self.day = 1
         if PrecisionAtts[self.precision]['level'] >= PrecisionAtts[Precision.MONTH]['level']:
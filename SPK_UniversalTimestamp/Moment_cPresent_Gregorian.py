@@ -11,20 +11,24 @@ class Present_Gregorian(Present_Calendars):
     """
     # CONSTRUCTOR ############################################################################
     def __init__(self, moment: UnivMoment, tz : str | tuple[float,float] = 'UTC'):
-        rd = moment.rd_day
-        if rd == Decimal('-Infinity'):
-            year = rd
+        if moment.rd_day == Decimal('-Infinity'):
             tz = None
-        else:
-            year, month, day = gregorian_from_rd(int(str(rd)))
-        super().__init__(Calendar.GREGORIAN, moment, year, tz)
-        if self.year != Decimal('-Infinity'):
-            self.month = 1
-            self.day = 1
-            if PrecisionAtts[self.precision]['level'] >= PrecisionAtts[Precision.MONTH]['level']:
-                self.month = month
-            if PrecisionAtts[self.precision]['level'] >= PrecisionAtts[Precision.DAY]['level']: 
-                self.day = day
+        super().__init__(Calendar.GREGORIAN, moment, None, tz)
+        return
+
+    def _convert_calendar(self, field: str):
+        rd = self._calendar_rd_day
+        if rd == Decimal('-Infinity'):
+            self.year = rd
+            return
+        year, month, day = gregorian_from_rd(int(str(rd)))
+        self.year = year
+        self.month = 1
+        self.day = 1
+        if PrecisionAtts[self.precision]['level'] >= PrecisionAtts[Precision.MONTH]['level']:
+            self.month = month
+        if PrecisionAtts[self.precision]['level'] >= PrecisionAtts[Precision.DAY]['level']: 
+            self.day = day
         return
     
     # PRESENTATION LAYER METHODS ############################################################
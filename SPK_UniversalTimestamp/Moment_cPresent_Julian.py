@@ -10,9 +10,12 @@ class Present_Julian(Present_Calendars):
     """
     # CONSTRUCTOR ############################################################################
     def __init__(self, moment: UnivMoment, tz : str | tuple[float,float] = 'UTC'):
-        rd = moment.rd_day
-        year, month, day = julian_from_rd(int(str(rd)))
-        super().__init__(Calendar.JULIAN, moment, year, tz)
+        super().__init__(Calendar.JULIAN, moment, None, tz)
+        return
+
+    def _convert_calendar(self, field: str):
+        year, month, day = julian_from_rd(int(str(self._calendar_rd_day)))
+        self.year = year
         self.month = 1
         self.day = 1
         if PrecisionAtts[self.precision]['level'] >= PrecisionAtts[Precision.MONTH]['level']:
@@ -0,0 +1,185 @@
+"""
+Format-directed parsing of presentations, the inverse of Presentation._format.
+
+A format is compiled once per (calendar, format, language) from the plan of _compile_format into a regex
+with one named group per directive, so %K and %k are matched as the same literals the presentation writes.
+Month and weekday names are looked up in reverse dictionaries of the Constants_* and
+Present_Calendars.DAY_OF_THE_WEEK_ATTS tables.
+
+Supported directives: %Y %y %m %B %b %d %A %a %H %I %p %M %S %f %z %Z (and %K %k), with the %# modifier,
+for the Gregorian, Julian and Hebrew calendars.
+"""
+import re
+from decimal import Decimal
+from functools import lru_cache
+from typing import Optional
+
+from .Constants_aCommon import Calendar, CalendarAtts, Precision, PrecisionAtts
+from .Constants_Gregorian import gregorian_MONTH_ATTS
+from .Constants_Hebrew import hebrew_MONTH_ATTS
+from .Constants_Julian import julian_MONTH_ATTS
+from .Moment_aUniversal import UnivMoment, _compile_format
+from .Moment_bPresent_Calendars import Present_Calendars
+
+_MONTH_ATTS = {
+    Calendar.GREGORIAN: gregorian_MONTH_ATTS,
+    Calendar.JULIAN: julian_MONTH_ATTS,
+    Calendar.HEBREW: hebrew_MONTH_ATTS,
+}
+_CONSTRUCTORS = {
+    Calendar.GREGORIAN: UnivMoment.from_gregorian,
+    Calendar.JULIAN: UnivMoment.from_julian,
+    Calendar.HEBREW: UnivMoment.from_hebrew,
+}
+
+# Reverse lookups, [calendar][language][attribute] name -> month number, attribute is 'name' or 'abbrv'
+MONTH_BY_NAME = {
+    calendar: {
+        language: {attr: {atts[attr]: month for month, atts in months.items()} for attr in ('name', 'abbrv')}
+        for language, months in month_atts.items()
+    }
+    for calendar, month_atts in _MONTH_ATTS.items()
+}
+# [language][attribute] name -> weekday index, 0 is Monday as in Present_Calendars
+WEEKDAY_BY_NAME = {
+    language: {attr: {atts[attr]: index for index, atts in days.items()} for attr in ('name', 'abbrv')}
+    for language, days in Present_Calendars.DAY_OF_THE_WEEK_ATTS.items()
+}
+
+
+def _names_regex(names) -> str:
+    # Longest first, so that 'Adar II' is not read as 'Adar I'
+    return "|".join(re.escape(name) for name in sorted(names, key=len, reverse=True))
+
+
+def _directive_regex(calendar: Calendar, seg_type: str, language: str) -> Optional[str]:
+    """The regex body of a directive, None when the directive cannot be parsed"""
+    if seg_type == 'Y':
+        return r"-?\d+"
+    if seg_type == 'y':
+        suffix = CalendarAtts[language][calendar]['bce_suffix']
+        return rf"\d+(?: {re.escape(suffix)})?" if suffix else r"\d+"
+    if seg_type in 'BbAa':
+        table = MONTH_BY_NAME[calendar][language] if seg_type in 'Bb' else WEEKDAY_BY_NAME[language]
+        return _names_regex(table['name' if seg_type in 'BA' else 'abbrv'])
+    if seg_type in 'mdHIMS':
+        return r"\d{1,2}"
+    if seg_type == 'p':
+        return r"am|pm"
+    if seg_type == 'f':
+        return r"(?:\.\d{1,18})?"
+    if seg_type == 'z':
+        return r"[+-]\d{2}:\d{2}"
+    if seg_type == 'Z':
+        return r"\S+"
+    return None
+
+
+@lru_cache(maxsize=256)
+def _compile_strptime(calendar: Calendar, format: str, language: str) -> re.Pattern:
+    if calendar not in _CONSTRUCTORS:
+        raise ValueError(f"strptime supports the Gregorian, Julian and Hebrew calendars, not {calendar}")
+    parts = []
+    directives = set()
+    plan = _compile_format(calendar, format, language)
+    for ndx, op in enumerate(plan):
+        if isinstance(op, str):
+            # Surrounding white space is optional, e.g. after an empty calendar abbreviation (%k)
+            if ndx == 0:
+                op = op.lstrip()
+            if ndx == len(plan) - 1:
+                op = op.rstrip()
+            parts.append(re.escape(op))
+            continue
+        seg_type = op['type']
+        if seg_type in 'CcjxX':
+            raise ValueError(f"strptime does not support the directive %{seg_type}")
+        body = _directive_regex(calendar, seg_type, language)
+        if body is None:
+            # Unknown directives are presented as is
+            parts.append(re.escape(f"%{seg_type}"))
+        elif seg_type in directives:
+            parts.append(f"(?P={seg_type})")
+        else:
+            parts.append(f"(?P<{seg_type}>{body})")
+            directives.add(seg_type)
+    if not directives & {'Y', 'y'}:
+        raise ValueError(f"The format '{format}' has no year, %Y or %y")
+    return re.compile(r"\s*" + "".join(parts) + r"\s*")
+
+
+def _moment_from_fields(
+    calendar: Calendar, language: str, fields: dict, description: Optional[str]
+) -> UnivMoment:
+    if fields.get('Y') is not None:
+        year = int(fields['Y'])
+    else:
+        digits, _, suffix = fields['y'].partition(" ")
+        year = -int(digits) if suffix else int(digits)
+    month = day = hour = minute = second = precision = None
+    if fields.get('m') is not None:
+        month = int(fields['m'])
+    elif fields.get('B') is not None:
+        month = MONTH_BY_NAME[calendar][language]['name'][fields['B']]
+    elif fields.get('b') is not None:
+        month = MONTH_BY_NAME[calendar][language]['abbrv'][fields['b']]
+    if fields.get('d') is not None:
+        day = int(fields['d'])
+    if fields.get('H') is not None:
+        hour = int(fields['H'])
+    elif fields.get('I') is not None:
+        # The presentation writes hour % 12
+        hour = int(fields['I']) % 12 + (12 if fields.get('p') == 'pm' else 0)
+    if fields.get('M') is not None:
+        minute = int(fields['M'])
+    if fields.get('S') is not None:
+        second = int(fields['S'])
+        if fields.get('f'):
+            fraction = fields['f'][1:]
+            second = Decimal(f"{second}.{fraction}")
+            precision = UnivMoment._precision_from_fraction_digits(len(fraction))
+    args = [year, month, day, hour, minute, second]
+    while args[-1] is None:
+        args.pop()
+    if None in args:
+        raise ValueError("The parsed fields must be contiguous, e.g. a day needs a month")
+    moment = _CONSTRUCTORS[calendar](*args, precision=precision, description=description)
+
+    # The presentation shows the local time of the zone, the weekday is the one of the local day
+    weekday = fields.get('A') or fields.get('a')
+    if weekday is not None:
+        attr = 'name' if fields.get('A') is not None else 'abbrv'
+        if WEEKDAY_BY_NAME[language][attr][weekday] != int(moment.rd_day - 1) % 7:
+            raise ValueError(f"{weekday} does not match the date")
+    offset_minutes = 0
+    if fields.get('z') is not None:
+        sign = -1 if fields['z'][0] == '-' else 1
+        offset_minutes = sign * (int(fields['z'][1:3]) * 60 + int(fields['z'][4:6]))
+    elif fields.get('Z') is not None and fields['Z'] != 'UTC':
+        offset = Present_Calendars.get_utc_offset(fields['Z'], moment.rd_day)
+        offset_minutes = int(offset[0]) * 60 + int(offset[1])
+    if offset_minutes and PrecisionAtts[moment.precision]['level'] >= PrecisionAtts[Precision.HOUR]['level']:
+        moment = moment - (Decimal(0), 0, offset_minutes, Decimal(0))
+    return moment
+
+
+def strptime(
+    text: str,
+    calendar: Calendar = Calendar.GREGORIAN,
+    format: str = "%Y-%m-%d %H:%M:%S",
+    language: str = 'en',
+    description: Optional[str] = None,
+) -> UnivMoment:
+    """
+    Parse a presentation of a moment back into a UnivMoment, see UnivMoment.strptime.
+
+    Raises:
+        ValueError: when the text does not match the format or the fields are not a valid date
+    """
+    match = _compile_strptime(calendar, format, language).fullmatch(text)
+    if match is None:
+        raise ValueError(f"'{text}' does not match the format '{format}'")
+    try:
+        return _moment_from_fields(calendar, language, match.groupdict(), description)
+    except KeyError as error:
+        raise ValueError(f"'{text}': {error} is not a name of the format '{format}'")
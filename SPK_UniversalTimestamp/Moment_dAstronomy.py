@@ -0,0 +1,86 @@
+"""
+Astronomical events as UnivMoments.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, Optional
+
+from .CC02_Gregorian import gregorian_new_year
+from .CC14_Time_and_Astronomy import lunar_phase_events, new, first_quarter, full, last_quarter, solar_longitude_events
+from .Constants_aCommon import Precision
+from .Constants_Chinese import chinese_MONTHS
+from .Moment_aUniversal import UnivMoment
+from .Moment_dMomentArray import MomentArray
+
+LUNAR_PHASE_NAMES = {
+    new(): "New Moon",
+    first_quarter(): "First Quarter",
+    full(): "Full Moon",
+    last_quarter(): "Last Quarter",
+}
+
+
+def lunar_events(
+    start: UnivMoment,
+    end: UnivMoment,
+    phases: Iterable = (new(), first_quarter(), full(), last_quarter()),
+    precision: Precision = Precision.SECOND,
+) -> Iterator[UnivMoment]:
+    """
+    Lazily yield the lunar phase events start <= event < end in chronological order.
+
+    Args:
+        start (UnivMoment): first moment of the range
+        end (UnivMoment): end of the range (exclusive)
+        phases (Iterable): lunar phases in degrees, 0 new moon, 90 first quarter, 180 full moon, 270 last quarter
+        precision (Precision): precision of the yielded moments
+    Yields:
+        UnivMoment: the event, described by the name of the phase
+    """
+    for t, phi in lunar_phase_events(start.to_rd_moment(), end.to_rd_moment(), phases):
+        description = LUNAR_PHASE_NAMES.get(phi, f"Lunar phase {phi.normalize()}°")
+        yield UnivMoment.from_rd_moment(t, precision, description=description)
+    return
+
+
+SOLAR_TERM_NAMES = {term["solar_longitude"]: term["english"] for term in chinese_MONTHS}
+
+
+def _solar_terms_block(first_year: int, last_year: int, precision: Precision) -> MomentArray:
+    """The solar terms of the Gregorian years first_year .. last_year"""
+    start, end = gregorian_new_year(first_year), gregorian_new_year(last_year + 1)
+    return MomentArray.from_moments(
+        UnivMoment.from_rd_moment(t, precision, description=SOLAR_TERM_NAMES[int(_lambda)])
+        for t, _lambda in solar_longitude_events(start, end)
+    )
+
+
+def solar_terms(
+    year_range: Iterable[int],
+    precision: Precision = Precision.SECOND,
+    processes: Optional[int] = None,
+    block_size: int = 10,
+) -> MomentArray:
+    """
+    The 24 solar terms (solar longitudes 0, 15, ... 345 degrees) of each Gregorian year, in U.T.
+
+    Args:
+        year_range (Iterable[int]): Gregorian years, for example range(1900, 2101)
+        precision (Precision): precision of the moments
+        processes (Optional[int]): when given, blocks of years are computed in a process pool of this size
+        block_size (int): number of consecutive years per block
+    Returns:
+        MomentArray: the solar terms in chronological order, described by their English names
+    """
+    years = sorted(set(int(year) for year in year_range))
+    blocks = []
+    for year in years:
+        if blocks and blocks[-1][1] == year - 1 and blocks[-1][1] - blocks[-1][0] + 1 < block_size:
+            blocks[-1][1] = year
+        else:
+            blocks.append([year, year])
+    if processes is None or len(blocks) <= 1:
+        return MomentArray.concatenate(_solar_terms_block(first, last, precision) for first, last in blocks)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return MomentArray.concatenate(
+            executor.map(_solar_terms_block, [b[0] for b in blocks], [b[1] for b in blocks], [precision] * len(blocks))
+        )
@@ -0,0 +1,214 @@
+"""
+The span of time a moment denotes at its precision, and an index of spans for overlap queries.
+
+A moment at YEAR precision is any instant of its year: MomentInterval.of(moment, calendar) is the half-open
+span [start, end) of the precision unit containing the moment.
+- BILLION_YEARS, MILLION_YEARS, THOUSAND_YEARS  units of 10**power years of 365.25 days, as from_geological
+- YEAR, MONTH  the year or month of the calendar (Gregorian, Julian, Hebrew or Chinese)
+- DAY .. ATTOSECOND  the R.D. day, hour, minute or 10**power seconds
+The beginning of time is the empty span at the beginning of time.
+
+The units of one precision partition time, so sorted by start their ends are sorted too; IntervalIndex keeps
+the spans of each precision in sorted start and end key lists and answers an overlap query with two
+bisections per precision, in O(log n + k).
+"""
+from bisect import bisect_left, bisect_right
+from decimal import Decimal
+from functools import lru_cache
+from typing import Iterable, NamedTuple, Union
+
+import numpy as np
+
+from .CC00_Decimal_library import floor
+from .CC02_Gregorian import gregorian_from_rd, rd_from_gregorian
+from .CC03_Julian import julian_from_rd, rd_from_julian
+from .CC08_Hebrew import hebrew_from_rd, last_day_of_hebrew_month, months, rd_from_hebrew
+from .CC19_Chinese_1645 import chinese_new_moon_before, chinese_new_moon_on_or_after, chinese_new_year_on_or_before
+from .Constants_aCommon import Calendar, Precision, PrecisionAtts
+from .Moment_aUniversal import UnivMoment
+from .Moment_dMomentArray import (
+    ATTOSECONDS_PER_SECOND, BEGINNING_OF_TIME_DAY, MomentArray, instant_binary_key, moment_columns, moment_from_columns
+)
+
+DAYS_PER_YEAR = Decimal('365.25')
+_LEVEL_YEAR = PrecisionAtts[Precision.YEAR]['level']
+_LEVEL_MONTH = PrecisionAtts[Precision.MONTH]['level']
+_LEVEL_DAY = PrecisionAtts[Precision.DAY]['level']
+# Length of the sub-day units in attoseconds, by precision level
+_UNIT_ATTOSECONDS = {
+    PrecisionAtts[Precision.HOUR]['level']: 3600 * ATTOSECONDS_PER_SECOND,
+    PrecisionAtts[Precision.MINUTE]['level']: 60 * ATTOSECONDS_PER_SECOND,
+    **{
+        atts['level']: 10 ** (18 + atts['power'])
+        for atts in PrecisionAtts.values() if atts['level'] >= PrecisionAtts[Precision.SECOND]['level']
+    },
+}
+_DAY_ATTOSECONDS = 86400 * ATTOSECONDS_PER_SECOND
+
+
+@lru_cache(maxsize=4096)
+def calendar_unit_days(calendar: Calendar, precision: Precision, rd_day: int) -> tuple[int, int]:
+    """
+    [first, last + 1) R.D. days of the calendar year or month, by precision, containing rd_day.
+    The conversions are cached, moments of a year or month share them.
+
+    Raises:
+        ValueError: for a calendar without years and months here
+    """
+    year_unit = precision == Precision.YEAR
+    if calendar == Calendar.GREGORIAN:
+        year, month, _ = gregorian_from_rd(rd_day)
+        if year_unit:
+            return rd_from_gregorian(year, 1, 1), rd_from_gregorian(year + 1, 1, 1)
+        return rd_from_gregorian(year, month, 1), rd_from_gregorian(year + month // 12, month % 12 + 1, 1)
+    if calendar == Calendar.JULIAN:
+        year, month, _ = julian_from_rd(rd_day)
+        if year_unit:
+            # There is no Julian year 0
+            return rd_from_julian(year, 1, 1), rd_from_julian(year + 1 if year != -1 else 1, 1, 1)
+        if month < 12:
+            return rd_from_julian(year, month, 1), rd_from_julian(year, month + 1, 1)
+        return rd_from_julian(year, 12, 1), rd_from_julian(year, 12, 1) + 31
+    if calendar == Calendar.HEBREW:
+        year, month, _ = hebrew_from_rd(rd_day)
+        if year_unit:
+            return rd_from_hebrew(year, months.TISHRI.value, 1), rd_from_hebrew(year + 1, months.TISHRI.value, 1)
+        first = rd_from_hebrew(year, month, 1)
+        return first, first + last_day_of_hebrew_month(year, month)
+    if calendar == Calendar.CHINESE:
+        if year_unit:
+            first = int(chinese_new_year_on_or_before(rd_day))
+            # Chinese years have 353 to 385 days
+            return first, int(chinese_new_year_on_or_before(first + 400))
+        first = int(floor(chinese_new_moon_before(rd_day + 1)))
+        return first, int(floor(chinese_new_moon_on_or_after(first + 1)))
+    raise ValueError(f"Years and months of the {calendar} calendar are not supported")
+
+
+_CONSTRUCTORS = {
+    Calendar.GREGORIAN: UnivMoment.from_gregorian,
+    Calendar.JULIAN: UnivMoment.from_julian,
+    Calendar.HEBREW: UnivMoment.from_hebrew,
+    Calendar.CHINESE: UnivMoment.from_chinese,
+}
+
+
+@lru_cache(maxsize=1024)
+def calendar_span(calendar: Calendar, *fields: int) -> "MomentInterval":
+    """
+    The span of a calendar date at the precision of its last field, e.g. (Calendar.HEBREW, 5785) is
+    the Hebrew year 5785 and (Calendar.CHINESE, 78, 42) the year 42 of the Chinese cycle 78.
+    The calendar engines are called once per date.
+
+    Raises:
+        ValueError: for a calendar without a constructor here or an invalid date
+    """
+    if calendar not in _CONSTRUCTORS:
+        raise ValueError(f"Dates of the {calendar} calendar are not supported")
+    return MomentInterval.of(_CONSTRUCTORS[calendar](*fields), calendar)
+
+
+class MomentInterval(NamedTuple):
+    """The half-open span [start, end) denoted by a moment, see MomentInterval.of"""
+    start: UnivMoment
+    end: UnivMoment
+
+    @staticmethod
+    def of(moment: UnivMoment, calendar: Calendar = Calendar.GREGORIAN) -> "MomentInterval":
+        """
+        The span of the precision unit containing the moment, the year or month in the calendar.
+
+        Raises:
+            ValueError: for YEAR or MONTH precision in a calendar without years and months here
+        """
+        day, second, attosecond, level = moment_columns(moment)
+        if day == BEGINNING_OF_TIME_DAY:
+            return MomentInterval(moment, moment)
+        precision = moment.precision
+        if level < _LEVEL_YEAR or (level == _LEVEL_YEAR and calendar == Calendar.GEOLOGICAL):
+            unit = 10 ** (PrecisionAtts[precision]['power'])
+            first = floor(moment.to_rd_moment() / DAYS_PER_YEAR / unit) * unit
+            return MomentInterval(
+                UnivMoment(first * DAYS_PER_YEAR, precision=precision),
+                UnivMoment((first + unit) * DAYS_PER_YEAR, precision=precision),
+            )
+        if level <= _LEVEL_MONTH:
+            first, end = calendar_unit_days(calendar, precision, day)
+            return MomentInterval(moment_from_columns(first, 0, 0, level), moment_from_columns(end, 0, 0, level))
+        if level == _LEVEL_DAY:
+            return MomentInterval(moment_from_columns(day, 0, 0, level), moment_from_columns(day + 1, 0, 0, level))
+        unit = _UNIT_ATTOSECONDS[level]
+        tick = second * ATTOSECONDS_PER_SECOND + attosecond
+        first = tick - tick % unit
+        end_day, end = divmod(first + unit, _DAY_ATTOSECONDS)
+        return MomentInterval(
+            moment_from_columns(day, *divmod(first, ATTOSECONDS_PER_SECOND), level),
+            moment_from_columns(day + end_day, *divmod(end, ATTOSECONDS_PER_SECOND), level),
+        )
+
+    def keys(self) -> tuple[bytes, bytes]:
+        """The instant binary keys of start and end, see instant_binary_key"""
+        return instant_binary_key(self.start), instant_binary_key(self.end)
+
+    def overlaps(self, other: "MomentInterval") -> bool:
+        """True when the spans share an instant"""
+        start, end = self.keys()
+        other_start, other_end = other.keys()
+        return start < other_end and other_start < end
+
+    def contains(self, moment: UnivMoment) -> bool:
+        """True when the instant of the moment is in the span"""
+        start, end = self.keys()
+        return start <= instant_binary_key(moment) < end
+
+
+class IntervalIndex:
+    """
+    Overlap index of the spans of many moments, see the module docstring.
+    Queries return the positions of the moments in the input sequence.
+    """
+
+    def __init__(self, moments: Union[Iterable[UnivMoment], MomentArray], calendar: Calendar = Calendar.GREGORIAN):
+        """
+        Args:
+            moments (Iterable[UnivMoment] | MomentArray): the indexed moments
+            calendar (Calendar): the calendar of the YEAR and MONTH spans
+        """
+        self.calendar = calendar
+        groups = {}
+        count = 0
+        for position, moment in enumerate(moments):
+            start, end = MomentInterval.of(moment, calendar).keys()
+            groups.setdefault(moment.precision, []).append((start, end, position))
+            count += 1
+        self._count = count
+        # Per precision: starts, ends and positions sorted by start
+        self._groups = []
+        for spans in groups.values():
+            spans.sort()
+            starts, ends, positions = zip(*spans)
+            self._groups.append((list(starts), list(ends), np.array(positions, dtype=np.int64)))
+        return
+
+    def __len__(self) -> int:
+        return self._count
+
+    def overlapping(self, span: Union[MomentInterval, UnivMoment]) -> np.ndarray:
+        """
+        Positions, in ascending order, of the moments whose spans overlap the span, or the span of a moment.
+
+        Returns:
+            np.ndarray: int64 positions in the indexed sequence
+        """
+        if isinstance(span, UnivMoment):
+            span = MomentInterval.of(span, self.calendar)
+        start, end = span.keys()
+        found = []
+        for starts, ends, positions in self._groups:
+            # Spans ending after start and starting before end, a contiguous run since the ends are sorted
+            low, high = bisect_right(ends, start), bisect_left(starts, end)
+            if low < high:
+                found.append(positions[low:high])
+        if not found:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(np.concatenate(found))
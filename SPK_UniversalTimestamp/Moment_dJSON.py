@@ -0,0 +1,144 @@
+"""
+Compact JSON for UnivMoments and streaming JSON Lines (NDJSON).
+
+A moment is the object {"t": ticks, "p": precision level} with an optional "d" description, where
+- t  int   attoseconds since R.D. 0 at midnight, day * 86400 * 10**18 + second * 10**18 + attosecond;
+           null for the beginning of time
+- p  int   the precision level of PrecisionAtts, as in the MomentArray precision column
+MomentJSONEncoder writes moments in mixed documents and moment_object_hook reads them back,
+write_ndjson and read_ndjson stream one moment per line in batches, in bounded memory.
+"""
+import json
+from itertools import islice
+from typing import IO, Iterable, Iterator, Optional, Union
+
+from .Moment_aUniversal import UnivMoment
+from .Moment_dMomentArray import (
+    ATTOSECONDS_PER_SECOND, BEGINNING_OF_TIME_DAY, MomentArray, moment_columns, moment_from_columns
+)
+
+ATTOSECONDS_PER_DAY = 86400 * ATTOSECONDS_PER_SECOND
+_MOMENT_KEYS = ({"t", "p"}, {"t", "p", "d"})
+
+
+def ticks_from_columns(day: int, second: int, attosecond: int) -> Optional[int]:
+    """The ticks of MomentArray columns, None for the beginning of time"""
+    if day == BEGINNING_OF_TIME_DAY:
+        return None
+    return int(day) * ATTOSECONDS_PER_DAY + int(second) * ATTOSECONDS_PER_SECOND + int(attosecond)
+
+
+def columns_from_ticks(ticks: Optional[int]) -> tuple[int, int, int]:
+    """(day, second, attosecond) of ticks, the inverse of ticks_from_columns"""
+    if ticks is None:
+        return BEGINNING_OF_TIME_DAY, 0, 0
+    day, rest = divmod(ticks, ATTOSECONDS_PER_DAY)
+    second, attosecond = divmod(rest, ATTOSECONDS_PER_SECOND)
+    return day, second, attosecond
+
+
+def moment_to_json(moment: UnivMoment) -> dict:
+    """The compact JSON object of a moment"""
+    day, second, attosecond, level = moment_columns(moment)
+    obj = {"t": ticks_from_columns(day, second, attosecond), "p": level}
+    description = getattr(moment, 'description', None)
+    if description is not None:
+        obj["d"] = description
+    return obj
+
+
+def moment_from_json(obj: dict) -> UnivMoment:
+    """The moment of a compact JSON object"""
+    return moment_from_columns(*columns_from_ticks(obj["t"]), obj["p"], obj.get("d"))
+
+
+class MomentJSONEncoder(json.JSONEncoder):
+    """json.dumps(document, cls=MomentJSONEncoder) writes the UnivMoments of a document in the compact form"""
+
+    def default(self, o):
+        if isinstance(o, UnivMoment):
+            return moment_to_json(o)
+        return super().default(o)
+
+
+def moment_object_hook(obj: dict):
+    """json.loads(text, object_hook=moment_object_hook) reads the compact objects back as UnivMoments"""
+    if obj.keys() in _MOMENT_KEYS and isinstance(obj["p"], int):
+        return moment_from_json(obj)
+    return obj
+
+
+def _ndjson_lines(day, second, attosecond, precision, description) -> str:
+    lines = []
+    for ndx in range(len(day)):
+        ticks = ticks_from_columns(day[ndx], second[ndx], attosecond[ndx])
+        line = f'{{"t":{"null" if ticks is None else ticks},"p":{int(precision[ndx])}'
+        if description is not None and description[ndx] is not None:
+            line += f',"d":{json.dumps(description[ndx], ensure_ascii=False)}'
+        lines.append(line + "}\n")
+    return "".join(lines)
+
+
+def write_ndjson(
+    moments: Union[Iterable[UnivMoment], MomentArray], fp: IO[str], batch_size: int = 10_000
+) -> int:
+    """
+    Write one compact JSON moment per line.
+
+    Args:
+        moments (Iterable[UnivMoment] | MomentArray): consumed once, in batches
+        fp (IO[str]): a text file open for writing
+        batch_size (int): number of lines per write
+    Returns:
+        int: the number of moments written
+    """
+    count = 0
+    if isinstance(moments, MomentArray):
+        for start in range(0, len(moments), batch_size):
+            end = min(start + batch_size, len(moments))
+            description = moments.description[start:end] if moments.description is not None else None
+            fp.write(_ndjson_lines(
+                moments.day[start:end].tolist(), moments.second[start:end].tolist(),
+                moments.attosecond[start:end].tolist(), moments.precision[start:end].tolist(), description,
+            ))
+        return len(moments)
+    moments = iter(moments)
+    while True:
+        batch = list(islice(moments, batch_size))
+        if not batch:
+            return count
+        columns = [moment_columns(moment) for moment in batch]
+        fp.write(_ndjson_lines(
+            [c[0] for c in columns], [c[1] for c in columns], [c[2] for c in columns], [c[3] for c in columns],
+            [getattr(moment, 'description', None) for moment in batch],
+        ))
+        count += len(batch)
+
+
+def read_ndjson(fp: Iterable[str], chunk_size: int = 100_000) -> Iterator[MomentArray]:
+    """
+    Lazily read compact JSON moments, one per line, as MomentArrays of up to chunk_size moments.
+    Blank lines are skipped.
+    """
+    lines = iter(fp)
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            return
+        day, second, attosecond, precision, description = [], [], [], [], []
+        for line in chunk:
+            if not line.strip():
+                continue
+            obj = json.loads(line)
+            d, s, a = columns_from_ticks(obj["t"])
+            day.append(d)
+            second.append(s)
+            attosecond.append(a)
+            precision.append(obj["p"])
+            description.append(obj.get("d"))
+        yield MomentArray(day, second, attosecond, precision, description)
+
+
+def load_ndjson(fp: Iterable[str], chunk_size: int = 100_000) -> MomentArray:
+    """All moments of a JSON Lines file as one MomentArray, see read_ndjson"""
+    return MomentArray.concatenate(read_ndjson(fp, chunk_size))
@@ -0,0 +1,379 @@
+"""
+Append-only, memory-mapped log of (UnivMoment, payload) events.
+
+A log is a directory of segments, each an .index file of fixed-width records (the binary key of the
+moment, see moment_to_binary_key, and the offset and length of the payload) and a .data file of payloads.
+- Events are appended to the active segment, {seq}.log.*, in arrival order.
+- When the active segment holds segment_records events it is sealed: sorted (stably, equal moments keep
+  their order of arrival) into the run {seq}-{seq}.run.*.
+- Runs of similar size are merged, in a background thread, into one run {first}-{last}.run.* once fan_in
+  of them follow each other (size tiered compaction: each merge multiplies the run size by fan_in).
+Range queries binary search the memory-mapped keys of each run and scan the active segment.
+
+    with MomentLog(directory) as log:
+        log.append(moment, b"payload")
+        moments, payloads = log.range(start, end)
+"""
+import os
+import re
+import threading
+from bisect import bisect_left
+from typing import Iterable, NamedTuple, Optional, Union
+
+import numpy as np
+
+from .Moment_aUniversal import UnivMoment
+from .Moment_dMomentArray import BINARY_KEY_LENGTH, MomentArray, instant_binary_key, moment_to_binary_key
+
+LOG_RECORD_DTYPE = np.dtype([('key', f'S{BINARY_KEY_LENGTH}'), ('offset', '<u8'), ('length', '<u4')])
+_SEGMENT_NAME = re.compile(r"(\d{8})\.log\.index|(\d{8})-(\d{8})\.run\.index")
+# Records merged per step of sealing and compaction, bounds the memory of the payload copy
+_MERGE_RECORDS = 1 << 20
+
+
+class LogEntries(NamedTuple):
+    """Events of a range query, in chronological order"""
+    moments: MomentArray
+    payloads: list
+
+
+def _map(path: str, dtype) -> np.ndarray:
+    """Read-only memory map of a file, np.memmap cannot map an empty file"""
+    size = os.path.getsize(path) // np.dtype(dtype).itemsize
+    if size == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', shape=(size,))
+
+
+def _positions(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """The byte positions of the payloads at starts with lengths, concatenated"""
+    lengths = lengths.astype(np.int64)
+    total = int(lengths.sum())
+    firsts = np.cumsum(lengths) - lengths
+    return np.arange(total, dtype=np.int64) + np.repeat(starts.astype(np.int64) - firsts, lengths)
+
+
+def _split(data: np.ndarray, records: np.ndarray) -> list:
+    """The payloads of records as a list of bytes"""
+    buffer = data[_positions(records['offset'], records['length'])].tobytes()
+    ends = np.cumsum(records['length'], dtype=np.int64).tolist()
+    return [buffer[end - length:end] for end, length in zip(ends, records['length'].tolist())]
+
+
+class _Segment:
+    """The memory maps of the index and data files of a segment"""
+    __slots__ = ("base", "first", "last", "records", "data")
+
+    def __init__(self, base: str, first: int, last: int):
+        self.base = base
+        self.first = first
+        self.last = last
+        self.records = _map(base + ".index", LOG_RECORD_DTYPE)
+        self.data = _map(base + ".data", np.uint8)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def remove(self):
+        self.records = self.data = None
+        for suffix in (".index", ".data"):
+            os.remove(self.base + suffix)
+        return
+
+
+def _write_run(base: str, segments: list):
+    """
+    Merge the records of segments, in the order given for equal keys, into the sorted run base.
+    The run is written to temporary files and renamed, so a run file is always complete.
+    """
+    keys = np.concatenate([segment.records['key'] for segment in segments])
+    order = np.argsort(keys, kind='stable')
+    source = np.concatenate([np.full(len(segment), ndx, dtype=np.int32) for ndx, segment in enumerate(segments)])
+    starts = np.concatenate([segment.records['offset'] for segment in segments])
+    lengths = np.concatenate([segment.records['length'] for segment in segments])
+    offset = 0
+    with open(base + ".index.tmp", "wb") as index, open(base + ".data.tmp", "wb") as data:
+        for chunk in range(0, len(order), _MERGE_RECORDS):
+            ndx = order[chunk:chunk + _MERGE_RECORDS]
+            records = np.empty(len(ndx), dtype=LOG_RECORD_DTYPE)
+            records['key'] = keys[ndx]
+            records['length'] = lengths[ndx]
+            ends = offset + np.cumsum(lengths[ndx], dtype=np.uint64)
+            records['offset'] = ends - lengths[ndx]
+            payloads = np.empty(int(ends[-1]) - offset, dtype=np.uint8)
+            for ndx_segment, segment in enumerate(segments):
+                mask = source[ndx] == ndx_segment
+                if mask.any():
+                    payloads[_positions(records['offset'][mask] - offset, records['length'][mask])] = (
+                        segment.data[_positions(starts[ndx][mask], lengths[ndx][mask])]
+                    )
+            index.write(records.tobytes())
+            data.write(payloads.tobytes())
+            offset = int(ends[-1])
+    # The index last, a run is found by its index file
+    os.replace(base + ".data.tmp", base + ".data")
+    os.replace(base + ".index.tmp", base + ".index")
+    return
+
+
+def _recover_log(base: str):
+    """
+    Truncate the index of the log segment base to the records whose payloads are in its data file.
+    The two files are buffered separately, a crash may leave a partial record or records past the data.
+    """
+    if not os.path.exists(base + ".index"):
+        return
+    data_size = os.path.getsize(base + ".data") if os.path.exists(base + ".data") else 0
+    records = _map(base + ".index", LOG_RECORD_DTYPE)
+    ends = records['offset'] + records['length']
+    # The payloads of a log segment are appended in order, the offsets ascend
+    count = int(np.searchsorted(ends, data_size, side='right'))
+    del records
+    with open(base + ".index", "r+b") as index:
+        index.truncate(count * LOG_RECORD_DTYPE.itemsize)
+    return
+
+
+class MomentLog:
+    """
+    Append-only store of (UnivMoment, payload bytes) events in a directory, see the module docstring.
+    Appends, sealing and queries may come from several threads; one process owns a directory.
+    """
+
+    def __init__(self, directory: str, segment_records: int = 1_000_000, fan_in: int = 8):
+        """
+        Open the log in directory, creating it if needed.
+
+        Args:
+            directory (str): the directory of the segment files
+            segment_records (int): events of the active segment before it is sealed into a sorted run
+            fan_in (int): number of consecutive runs of a size tier that starts a background compaction
+        """
+        self.directory = directory
+        self.segment_records = segment_records
+        self.fan_in = fan_in
+        self._lock = threading.RLock()
+        self._compaction: Optional[threading.Thread] = None
+        os.makedirs(directory, exist_ok=True)
+        logs, self._runs = [], []
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".tmp"):
+                # An interrupted sealing or compaction, its inputs are still in place
+                os.remove(os.path.join(directory, name))
+                continue
+            match = _SEGMENT_NAME.fullmatch(name)
+            if match is None:
+                continue
+            if match[1] is not None:
+                logs.append(int(match[1]))
+            else:
+                first, last = int(match[2]), int(match[3])
+                self._runs.append(_Segment(os.path.join(directory, f"{first:08d}-{last:08d}.run"), first, last))
+        self._runs.sort(key=lambda run: run.first)
+        self._drop_covered_runs()
+        for sequence in [sequence for sequence in logs if self._covered(sequence)]:
+            # Sealed before a crash, but not yet removed
+            logs.remove(sequence)
+            _Segment(os.path.join(directory, f"{sequence:08d}.log"), sequence, sequence).remove()
+        self._sequence = max([run.last for run in self._runs] + logs + [0])
+        # Only the last active segment can still be open; earlier ones, left by a crash, are sealed now
+        for sequence in logs[:-1]:
+            self._seal(sequence)
+        self._open_active(logs[-1] if logs else self._sequence + 1)
+        if self._active_count >= self.segment_records:
+            # Reopened with a smaller segment_records than the active segment holds
+            self.seal()
+        return
+
+    def _drop_covered_runs(self):
+        """Remove the inputs of a compaction that was interrupted after its output was renamed"""
+        for run in list(self._runs):
+            if any(other is not run and other.first <= run.first and run.last <= other.last for other in self._runs):
+                self._runs.remove(run)
+                run.remove()
+        return
+
+    def _covered(self, sequence: int) -> bool:
+        return any(run.first <= sequence <= run.last for run in self._runs)
+
+    def _open_active(self, sequence: int):
+        self._active_sequence = sequence
+        self._sequence = max(self._sequence, sequence)
+        base = os.path.join(self.directory, f"{sequence:08d}.log")
+        _recover_log(base)
+        self._index = open(base + ".index", "ab")
+        self._data = open(base + ".data", "ab")
+        self._active_count = self._index.tell() // LOG_RECORD_DTYPE.itemsize
+        self._data_size = self._data.tell()
+        return
+
+    def _seal(self, sequence: int):
+        """Sort the log segment sequence into a run"""
+        base = os.path.join(self.directory, f"{sequence:08d}.log")
+        _recover_log(base)
+        log = _Segment(base, sequence, sequence)
+        if len(log):
+            run = os.path.join(self.directory, f"{sequence:08d}-{sequence:08d}.run")
+            _write_run(run, [log])
+            self._runs.append(_Segment(run, sequence, sequence))
+            self._runs.sort(key=lambda run: run.first)
+        log.remove()
+        return
+
+    # WRITING ####################################################################################################
+    def append(self, moment: UnivMoment, payload: bytes = b""):
+        """Append an event"""
+        self.extend([moment], [payload])
+        return
+
+    def extend(self, moments: Union[Iterable[UnivMoment], MomentArray], payloads: Optional[Iterable[bytes]] = None) -> int:
+        """
+        Append events, the keys of a MomentArray are encoded at once by MomentArray.to_binary_keys.
+
+        Returns:
+            int: the number of events appended
+        """
+        if isinstance(moments, MomentArray):
+            keys = moments.to_binary_keys()
+        else:
+            keys = np.array([moment_to_binary_key(moment) for moment in moments], dtype=f"S{BINARY_KEY_LENGTH}")
+        payloads = [b""] * len(keys) if payloads is None else [bytes(payload) for payload in payloads]
+        if len(payloads) != len(keys):
+            raise ValueError(f"{len(keys)} moments but {len(payloads)} payloads")
+        lengths = np.array([len(payload) for payload in payloads], dtype=np.uint32)
+        start = 0
+        with self._lock:
+            while start < len(keys):
+                end = min(len(keys), start + self.segment_records - self._active_count)
+                records = np.empty(end - start, dtype=LOG_RECORD_DTYPE)
+                records['key'] = keys[start:end]
+                records['length'] = lengths[start:end]
+                records['offset'] = self._data_size + np.cumsum(lengths[start:end], dtype=np.uint64) - lengths[start:end]
+                # The payloads first; a crash can still leave index records past the data, see _recover_log
+                self._data.write(b"".join(payloads[start:end]))
+                self._index.write(records.tobytes())
+                self._data_size += int(lengths[start:end].sum())
+                self._active_count += end - start
+                if self._active_count >= self.segment_records:
+                    self.seal()
+                start = end
+        return len(keys)
+
+    def flush(self, sync: bool = False):
+        """Write the buffered events of the active segment to its files, and to disk when sync"""
+        with self._lock:
+            self._data.flush()
+            self._index.flush()
+            if sync:
+                os.fsync(self._data.fileno())
+                os.fsync(self._index.fileno())
+        return
+
+    def seal(self):
+        """Sort the active segment into a run, start a new one and, if due, a background compaction"""
+        with self._lock:
+            self._index.close()
+            self._data.close()
+            self._seal(self._active_sequence)
+            self._open_active(self._sequence + 1)
+            if (self._compaction is None or not self._compaction.is_alive()) and self._tier_runs():
+                self._compaction = threading.Thread(target=self._compact_tiers, name="MomentLog.compact", daemon=True)
+                self._compaction.start()
+        return
+
+    # COMPACTION ###############################################################################################
+    def _tier(self, run: _Segment) -> int:
+        """Size tier of a run, sealed runs are tier 0 and a merge of fan_in runs of a tier is the next tier"""
+        tier, size = 0, len(run)
+        while size >= self.segment_records * self.fan_in:
+            size //= self.fan_in
+            tier += 1
+        return tier
+
+    def _tier_runs(self) -> list:
+        """The trailing runs of the tier of the last run, when there are at least fan_in of them"""
+        runs = []
+        for run in reversed(self._runs):
+            if runs and self._tier(run) != self._tier(runs[0]):
+                break
+            runs.insert(0, run)
+        return runs if len(runs) >= self.fan_in else []
+
+    def _compact_tiers(self):
+        """The background compaction, merges tiers until none is due"""
+        while True:
+            with self._lock:
+                runs = self._tier_runs()
+            if not runs:
+                return
+            self._merge(runs)
+
+    def _merge(self, runs: list):
+        """Merge consecutive runs into one, queries keep using them until the new run is complete"""
+        first, last = runs[0].first, runs[-1].last
+        base = os.path.join(self.directory, f"{first:08d}-{last:08d}.run")
+        _write_run(base, runs)
+        with self._lock:
+            for run in runs:
+                self._runs.remove(run)
+                run.remove()
+            self._runs.append(_Segment(base, first, last))
+            self._runs.sort(key=lambda run: run.first)
+        return
+
+    def compact(self):
+        """Merge all runs into one sorted run, after the running background compaction"""
+        while True:
+            if self._compaction is not None:
+                self._compaction.join()
+            with self._lock:
+                if self._compaction is not None and self._compaction.is_alive():
+                    continue
+                if len(self._runs) > 1:
+                    self._merge(list(self._runs))
+                return
+
+    # QUERIES ####################################################################################################
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(run) for run in self._runs) + self._active_count
+
+    def range(self, start: UnivMoment, end: UnivMoment) -> LogEntries:
+        """
+        The events at instants start <= moment < end, whatever their precision, in chronological order;
+        equal moments in their order of arrival.
+        """
+        low, high = instant_binary_key(start), instant_binary_key(end)
+        records, payloads = [], []
+        with self._lock:
+            for run in self._runs:
+                keys = run.records['key']
+                found = run.records[bisect_left(keys, low):bisect_left(keys, high)]
+                records.append(np.array(found))
+                payloads.extend(_split(run.data, found))
+            # The active segment is in arrival order
+            self.flush()
+            active = _Segment(os.path.join(self.directory, f"{self._active_sequence:08d}.log"), 0, 0)
+            found = active.records[(active.records['key'] >= low) & (active.records['key'] < high)]
+            records.append(found)
+            payloads.extend(_split(active.data, found))
+        records = np.concatenate(records)
+        order = np.argsort(records['key'], kind='stable')
+        return LogEntries(MomentArray.from_binary_keys(records['key'][order]), [payloads[ndx] for ndx in order])
+
+    def close(self):
+        """Wait for a running compaction and close the files; the active segment is kept for the next open"""
+        if self._compaction is not None:
+            self._compaction.join()
+        with self._lock:
+            self._index.close()
+            self._data.close()
+            self._runs = []
+        return
+
+    def __enter__(self) -> "MomentLog":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return
@@ -0,0 +1,298 @@
+"""
+MomentArray, a compact columnar sequence of UnivMoments.
+
+Each moment is held as integers in NumPy columns:
+- day        int64  the R.D. day, floor(rd_day); the beginning of time is the int64 minimum
+- second     int32  seconds of the day, 0 .. 86399
+- attosecond int64  fraction of the second in attoseconds, 0 .. 10**18 - 1
+- precision  int8   the precision level of PrecisionAtts
+A fractional rd_day is folded into the time of day.  Descriptions, when present, are kept in a list.
+"""
+from decimal import Decimal
+from typing import Iterable, Iterator, Optional, Union
+
+import numpy as np
+
+from .CC00_Decimal_library import floor
+from .Constants_aCommon import Precision, PrecisionAtts
+from .Moment_aUniversal import (
+    STD_LEXICAL_KEY_DAY_OFFSET, STD_LEXICAL_KEY_LENGTH, UnivMoment, _PRECISION_BY_KEY_LEVEL,
+    _STD_LEXICAL_KEY_DIGITS, _STD_LEXICAL_KEY_LITERALS, _present_many, _present_specs
+)
+
+BEGINNING_OF_TIME_DAY = np.iinfo(np.int64).min
+ATTOSECONDS_PER_SECOND = 10**18
+PRECISION_BY_LEVEL = {atts['level']: precision for precision, atts in PrecisionAtts.items()}
+# MomentArray precision level of each StdLexicalKey level 00 .. 99
+KEY_LEVEL_TO_LEVEL = np.array(
+    [PrecisionAtts[_PRECISION_BY_KEY_LEVEL[level]]['level'] for level in range(100)], dtype=np.int8
+)
+
+
+def moment_columns(moment: UnivMoment) -> tuple[int, int, int, int]:
+    """(day, second, attosecond, precision level) of a UnivMoment"""
+    level = PrecisionAtts[moment.precision]['level']
+    if moment.rd_day == Decimal('-Infinity'):
+        return BEGINNING_OF_TIME_DAY, 0, 0, level
+    day = floor(moment.rd_day)
+    hour, minute, second = moment.rd_time
+    seconds = (moment.rd_day - day) * 86400 + hour * 3600 + minute * 60 + second
+    whole = floor(seconds)
+    attosecond = int((seconds - whole) * ATTOSECONDS_PER_SECOND)
+    extra_days, second_of_day = divmod(int(whole), 86400)
+    return int(day) + extra_days, second_of_day, attosecond, level
+
+
+def moment_from_columns(
+    day: int, second: int, attosecond: int, level: int, description: Optional[str] = None
+) -> UnivMoment:
+    """The UnivMoment of (day, second, attosecond, precision level)"""
+    precision = PRECISION_BY_LEVEL[int(level)]
+    if day == BEGINNING_OF_TIME_DAY:
+        return UnivMoment(Decimal('-Infinity'), precision=precision, description=description)
+    hour, rest = divmod(int(second), 3600)
+    minute, second = divmod(rest, 60)
+    seconds = Decimal(second) + Decimal(int(attosecond)).scaleb(-18) if attosecond else Decimal(second)
+    return UnivMoment(Decimal(int(day)), (hour, minute, seconds), precision, description=description)
+
+
+# Order preserving binary key, 21 bytes compared as unsigned bytes (memcmp) sort chronologically:
+# day + 2**63 (0 for the beginning of time), second, attosecond, all big-endian, and the precision level
+BINARY_KEY_DTYPE = np.dtype([('day', '>u8'), ('second', '>u4'), ('attosecond', '>u8'), ('precision', 'u1')])
+BINARY_KEY_LENGTH = BINARY_KEY_DTYPE.itemsize
+_DAY_BIAS = 2**63
+
+
+def binary_key_from_columns(day: int, second: int, attosecond: int, level: int) -> bytes:
+    """The binary key of (day, second, attosecond, precision level)"""
+    return (
+        (int(day) + _DAY_BIAS).to_bytes(8, 'big') + int(second).to_bytes(4, 'big')
+        + int(attosecond).to_bytes(8, 'big') + int(level).to_bytes(1, 'big')
+    )
+
+
+def moment_to_binary_key(moment: UnivMoment) -> bytes:
+    """The order preserving binary key of a UnivMoment, the description is not part of the key"""
+    return binary_key_from_columns(*moment_columns(moment))
+
+
+def instant_binary_key(moment: UnivMoment) -> bytes:
+    """The smallest binary key of the instant of a moment, below the key of any precision"""
+    day, second, attosecond, _ = moment_columns(moment)
+    return binary_key_from_columns(day, second, attosecond, 0)
+
+
+def moment_from_binary_key(key: bytes) -> UnivMoment:
+    """The UnivMoment of a binary key"""
+    if len(key) != BINARY_KEY_LENGTH:
+        raise ValueError(f"Binary key of a UnivMoment must have {BINARY_KEY_LENGTH} bytes, got {len(key)}")
+    return moment_from_columns(
+        int.from_bytes(key[0:8], 'big') - _DAY_BIAS, int.from_bytes(key[8:12], 'big'),
+        int.from_bytes(key[12:20], 'big'), key[20],
+    )
+
+
+class MomentArray:
+    """
+    An immutable array of UnivMoments stored as NumPy columns.
+    Indexing with an integer returns a UnivMoment, with a slice or index array a MomentArray.
+    """
+    day: np.ndarray
+    second: np.ndarray
+    attosecond: np.ndarray
+    precision: np.ndarray
+    description: Optional[list]
+    # IMMUTABLE ##################################################################################################
+    __slots__ = ("day", "second", "attosecond", "precision", "description")
+
+    def __setattr__(self, name, value):
+        """Prevent modification of attributes after initialization"""
+        if hasattr(self, name):
+            raise AttributeError(f"Cannot modify attribute '{name}' of MomentArray")
+        super().__setattr__(name, value)
+        return
+
+    # CONSTRUCTORS ###############################################################################################
+    def __init__(self, day, second, attosecond, precision, description: Optional[Iterable[Optional[str]]] = None):
+        """
+        Args:
+            day, second, attosecond, precision: array-likes of equal length, see the module documentation
+            description (Optional[Iterable[Optional[str]]]): one description (or None) per moment
+        """
+        self.day = np.asarray(day, dtype=np.int64)
+        self.second = np.asarray(second, dtype=np.int32)
+        self.attosecond = np.asarray(attosecond, dtype=np.int64)
+        self.precision = np.asarray(precision, dtype=np.int8)
+        if not (len(self.day) == len(self.second) == len(self.attosecond) == len(self.precision)):
+            raise ValueError("MomentArray columns must have the same length")
+        if description is not None:
+            description = list(description)
+            if len(description) != len(self.day):
+                raise ValueError("MomentArray description must have one entry per moment")
+            if all(d is None for d in description):
+                description = None
+        self.description = description
+        return
+
+    @staticmethod
+    def from_moments(moments: Iterable[UnivMoment]) -> "MomentArray":
+        """Build from an iterable of UnivMoments, consumed once."""
+        columns = []
+        descriptions = []
+        for moment in moments:
+            columns.append(moment_columns(moment))
+            descriptions.append(getattr(moment, 'description', None))
+        if not columns:
+            return MomentArray([], [], [], [])
+        day, second, attosecond, precision = zip(*columns)
+        return MomentArray(day, second, attosecond, precision, descriptions)
+
+    @staticmethod
+    def concatenate(arrays: Iterable["MomentArray"]) -> "MomentArray":
+        """Join MomentArrays end to end."""
+        arrays = list(arrays)
+        if not arrays:
+            return MomentArray([], [], [], [])
+        if all(a.description is None for a in arrays):
+            description = None
+        else:
+            description = [d for a in arrays for d in (a.description or [None] * len(a))]
+        return MomentArray(
+            np.concatenate([a.day for a in arrays]),
+            np.concatenate([a.second for a in arrays]),
+            np.concatenate([a.attosecond for a in arrays]),
+            np.concatenate([a.precision for a in arrays]),
+            description,
+        )
+
+    @staticmethod
+    def from_StdLexicalKeys(keys) -> "MomentArray":
+        """
+        Decode a column of UnivMoment.to_StdLexicalKey keys without building UnivMoments.
+        The fixed width keys are sliced as a 2-D array of ASCII bytes, the digit fields summed by place value.
+
+        Args:
+            keys: array-like of keys, ideally a NumPy bytes array (S dtype) as read from storage
+        Returns:
+            MomentArray: one moment per key
+        """
+        keys = np.asarray(keys)
+        if keys.dtype.kind == 'U':
+            keys = np.char.encode(keys, 'ascii')
+        if keys.dtype.kind == 'S' and keys.dtype.itemsize > STD_LEXICAL_KEY_LENGTH and len(keys):
+            # The cast below would truncate longer keys silently
+            too_long = np.char.str_len(keys) > STD_LEXICAL_KEY_LENGTH
+            if too_long.any():
+                ndx = int(np.argmax(too_long))
+                raise ValueError(f"Invalid lexical key format for UnivMoment at index {ndx}: {keys[ndx]!r}")
+        keys = np.ascontiguousarray(keys.astype(f"S{STD_LEXICAL_KEY_LENGTH}", copy=False))
+        if len(keys) == 0:
+            return MomentArray([], [], [], [])
+        # Keys shorter than the width are padded with zero bytes and fail the checks below
+        chars = keys.view(np.uint8).reshape(len(keys), STD_LEXICAL_KEY_LENGTH)
+        valid = np.ones(len(keys), dtype=bool)
+        for start, literal in _STD_LEXICAL_KEY_LITERALS:
+            expected = np.frombuffer(literal.encode('ascii'), dtype=np.uint8)
+            valid &= (chars[:, start:start + len(expected)] == expected).all(axis=1)
+        # uint8 wraps around below '0', so one comparison checks for digits
+        digits = chars - np.uint8(ord('0'))
+        for start, end in _STD_LEXICAL_KEY_DIGITS:
+            valid &= (digits[:, start:end] <= 9).all(axis=1)
+        if not valid.all():
+            ndx = int(np.argmin(valid))
+            raise ValueError(f"Invalid lexical key format for UnivMoment at index {ndx}: {keys[ndx]!r}")
+
+        def number(start: int, end: int) -> np.ndarray:
+            value = np.zeros(len(keys), dtype=np.int64)
+            for column in range(start, end):
+                value = value * 10 + digits[:, column]
+            return value
+
+        day_offset = number(6, 24)
+        day = np.where(day_offset <= 0, BEGINNING_OF_TIME_DAY, day_offset - STD_LEXICAL_KEY_DAY_OFFSET)
+        second = number(25, 27) * 3600 + number(28, 30) * 60 + number(31, 33)
+        attosecond = number(34, 52)
+        precision = KEY_LEVEL_TO_LEVEL[number(56, 58)]
+        return MomentArray(day, second, attosecond, precision)
+
+    @staticmethod
+    def from_binary_keys(keys) -> "MomentArray":
+        """Decode a column of binary keys (bytes or a NumPy S21 array), see moment_to_binary_key"""
+        keys = np.asarray(keys)
+        if keys.dtype.kind != 'S':
+            keys = keys.astype(bytes)
+        if len(keys) == 0:
+            return MomentArray([], [], [], [])
+        # The last byte, the precision level, is never 0, so the lengths are those of the keys; checked
+        # before the cast, which would truncate longer keys
+        if (np.char.str_len(keys) != BINARY_KEY_LENGTH).any():
+            raise ValueError(f"Binary keys of UnivMoments must have {BINARY_KEY_LENGTH} bytes")
+        keys = keys.astype(f"S{BINARY_KEY_LENGTH}", copy=False)
+        fields = np.ascontiguousarray(keys).view(BINARY_KEY_DTYPE)
+        day = (fields['day'].astype(np.uint64) ^ np.uint64(_DAY_BIAS)).view(np.int64)
+        return MomentArray(day, fields['second'], fields['attosecond'], fields['precision'])
+
+    def to_binary_keys(self) -> np.ndarray:
+        """The binary keys of the moments as a NumPy S21 array, see moment_to_binary_key"""
+        fields = np.empty(len(self), dtype=BINARY_KEY_DTYPE)
+        fields['day'] = self.day.view(np.uint64) ^ np.uint64(_DAY_BIAS)
+        fields['second'] = self.second
+        fields['attosecond'] = self.attosecond
+        fields['precision'] = self.precision
+        return fields.view(f"S{BINARY_KEY_LENGTH}")
+
+    # SEQUENCE ###################################################################################################
+    def __len__(self) -> int:
+        return len(self.day)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            ndx = int(key)
+            if ndx < 0:
+                ndx += len(self)
+            if not 0 <= ndx < len(self):
+                raise IndexError("MomentArray index out of range")
+            description = self.description[ndx] if self.description is not None else None
+            return moment_from_columns(
+                self.day[ndx], self.second[ndx], self.attosecond[ndx], self.precision[ndx], description
+            )
+        ndx = np.arange(len(self))[key]
+        description = [self.description[i] for i in ndx] if self.description is not None else None
+        return MomentArray(self.day[ndx], self.second[ndx], self.attosecond[ndx], self.precision[ndx], description)
+
+    def __iter__(self) -> Iterator[UnivMoment]:
+        for ndx in range(len(self)):
+            yield self[ndx]
+
+    def to_moments(self) -> list[UnivMoment]:
+        return list(self)
+
+    # ARRAY VIEWS ################################################################################################
+    def rd_moments(self) -> np.ndarray:
+        """The moments as float64 R.D. numbers (time of day as fraction), for plots and vectorized astronomy"""
+        days = self.day.astype(np.float64)
+        days[self.day == BEGINNING_OF_TIME_DAY] = -np.inf
+        return days + (self.second + self.attosecond / ATTOSECONDS_PER_SECOND) / 86400
+
+    def precisions(self) -> list[Precision]:
+        return [PRECISION_BY_LEVEL[int(level)] for level in self.precision]
+
+    def argsort(self) -> np.ndarray:
+        """Indices that sort the moments chronologically"""
+        return np.lexsort((self.attosecond, self.second, self.day))
+
+    # FORMATTING #################################################################################################
+    def present_many(self, specs: Union[Iterable[tuple], dict]) -> list:
+        """
+        UnivMoment.present_many over the array, the specs are normalized once.
+
+        Returns:
+            list: one tuple (or dict for dict specs) of formatted strings per moment
+        """
+        names, specs = _present_specs(specs)
+        return [_present_many(moment, names, specs) for moment in self]
+
+    def __repr__(self) -> str:
+        if len(self) == 0:
+            return "MomentArray([])"
+        return f"MomentArray(len={len(self)}, first={self[0]!r}, last={self[-1]!r})"
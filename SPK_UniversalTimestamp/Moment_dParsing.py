@@ -0,0 +1,170 @@
+"""
+Bulk parsing of timestamp strings into MomentArrays.
+
+The input is consumed in chunks, so a file of any length parses in bounded memory with parse_chunks.
+Each row gets a status and the grammar, the index in UnivMoment._ALL_PATTERNS (see GRAMMAR_PATTERNS),
+that produced the moment or, for an invalid row, the first grammar that matched it.
+strptime_many parses a column with one UnivMoment.strptime format the same way.
+Rows that did not parse hold the beginning of time.
+"""
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+import numpy as np
+
+from .Constants_aCommon import Calendar
+from .Moment_aUniversal import UnivMoment
+from .Moment_cStrptime import _compile_strptime, _moment_from_fields
+from .Moment_dMomentArray import MomentArray, moment_columns
+
+# Row status
+PARSE_OK = 0
+PARSE_NO_MATCH = 1  # no grammar matched the string
+PARSE_INVALID = 2   # a grammar matched but the values were rejected, e.g. month 13
+
+# The columns of a row that did not parse, the beginning of time
+_FAILED_ROW = moment_columns(UnivMoment.beginning_of_time())
+
+# The last grammar, UnivMoment.ISO_8601_GRAMMAR, is the ISO 8601 fast path
+GRAMMAR_PATTERNS = tuple(pattern for pattern, _ in UnivMoment._ALL_PATTERNS) + ("ISO 8601",)
+
+
+class ParseResult(NamedTuple):
+    """Parsed rows: moments, status (int8) and grammar (int16, -1 when no grammar matched) of each row"""
+    moments: MomentArray
+    status: np.ndarray
+    grammar: np.ndarray
+
+
+def _parse_chunk(lines: list) -> ParseResult:
+    """Parse a list of strings, the unit of work of the process pool"""
+    columns = []
+    status = np.full(len(lines), PARSE_OK, dtype=np.int8)
+    grammar = np.empty(len(lines), dtype=np.int16)
+    for ndx, line in enumerate(lines):
+        moment, grammar[ndx] = UnivMoment._parse(line)
+        if moment is None:
+            status[ndx] = PARSE_NO_MATCH if grammar[ndx] < 0 else PARSE_INVALID
+            columns.append(_FAILED_ROW)
+        else:
+            columns.append(moment_columns(moment))
+    return _rows_result(columns, status, grammar)
+
+
+def _rows_result(rows: list, status: np.ndarray, grammar: np.ndarray) -> ParseResult:
+    if not rows:
+        return ParseResult(MomentArray([], [], [], []), status, grammar)
+    day, second, attosecond, precision = zip(*rows)
+    return ParseResult(MomentArray(day, second, attosecond, precision), status, grammar)
+
+
+def _strptime_chunk(lines: list, calendar: Calendar, format: str, language: str) -> ParseResult:
+    """Parse a list of strings with one format, the grammar is 0 where the format matched"""
+    regex = _compile_strptime(calendar, format, language)
+    columns = []
+    status = np.full(len(lines), PARSE_OK, dtype=np.int8)
+    grammar = np.zeros(len(lines), dtype=np.int16)
+    for ndx, line in enumerate(lines):
+        match = regex.fullmatch(line)
+        if match is None:
+            status[ndx], grammar[ndx] = PARSE_NO_MATCH, -1
+            columns.append(_FAILED_ROW)
+            continue
+        try:
+            columns.append(moment_columns(_moment_from_fields(calendar, language, match.groupdict(), None)))
+        except (ValueError, KeyError, TypeError):
+            status[ndx] = PARSE_INVALID
+            columns.append(_FAILED_ROW)
+    return _rows_result(columns, status, grammar)
+
+
+def _chunks(lines: Iterable[str], chunk_size: int) -> Iterator[list]:
+    lines = iter(lines)
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _stream(worker, args: tuple, lines: Iterable[str], chunk_size: int, processes: Optional[int]) -> Iterator[ParseResult]:
+    """worker(chunk, *args) over the chunks of lines, in input order"""
+    if processes is None:
+        for chunk in _chunks(lines, chunk_size):
+            yield worker(chunk, *args)
+        return
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending = deque()
+        for chunk in _chunks(lines, chunk_size):
+            pending.append(executor.submit(worker, chunk, *args))
+            if len(pending) >= 2 * processes:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    return
+
+
+def _concatenate(results: list) -> ParseResult:
+    if not results:
+        return _parse_chunk([])
+    return ParseResult(
+        MomentArray.concatenate(result.moments for result in results),
+        np.concatenate([result.status for result in results]),
+        np.concatenate([result.grammar for result in results]),
+    )
+
+
+def parse_chunks(
+    lines: Iterable[str],
+    chunk_size: int = 100_000,
+    processes: Optional[int] = None,
+) -> Iterator[ParseResult]:
+    """
+    Lazily parse timestamp strings, one ParseResult per chunk of input lines, in input order.
+
+    Args:
+        lines (Iterable[str]): timestamp strings in any UnivMoment.from_string grammar, e.g. an open file
+        chunk_size (int): number of lines per chunk
+        processes (Optional[int]): when given, chunks are parsed in a process pool of this size;
+            at most 2 * processes chunks are in flight, so memory stays bounded
+    Yields:
+        ParseResult: the moments, status and grammar of the rows of one chunk
+    """
+    return _stream(_parse_chunk, (), lines, chunk_size, processes)
+
+
+def parse_many(
+    lines: Iterable[str],
+    chunk_size: int = 100_000,
+    processes: Optional[int] = None,
+) -> ParseResult:
+    """
+    Parse timestamp strings into one MomentArray, see parse_chunks.
+
+    Returns:
+        ParseResult: moments (the beginning of time where the row did not parse), status and grammar per row
+    """
+    return _concatenate(list(parse_chunks(lines, chunk_size, processes)))
+
+
+def strptime_many(
+    lines: Iterable[str],
+    calendar: Calendar = Calendar.GREGORIAN,
+    format: str = "%Y-%m-%d %H:%M:%S",
+    language: str = 'en',
+    chunk_size: int = 100_000,
+    processes: Optional[int] = None,
+) -> ParseResult:
+    """
+    UnivMoment.strptime over a column of strings, streamed in chunks as parse_chunks.
+    The format is compiled once; grammar is 0 where the format matched, -1 where it did not.
+
+    Returns:
+        ParseResult: moments (the beginning of time where the row did not parse), status and grammar per row
+    Raises:
+        ValueError: when the format itself cannot be parsed
+    """
+    _compile_strptime(calendar, format, language)
+    return _concatenate(list(_stream(_strptime_chunk, (calendar, format, language), lines, chunk_size, processes)))
@@ -0,0 +1,127 @@
+"""
+SQLite persistence of UnivMoments as order preserving binary keys.
+
+SQLite compares BLOBs with memcmp, so an index on a column of binary keys (see moment_to_binary_key)
+is in chronological order and answers range scans directly.  The 21 byte key is less than half the
+58 characters of to_StdLexicalKey.  The description of a moment is not part of its key.
+
+    register_sqlite()
+    conn = sqlite3.connect(path, detect_types=sqlite3.PARSE_DECLTYPES)
+    create_moment_table(conn, "events")
+    insert_moments(conn, "events", moments, payloads)
+    for moment, payload in between(conn, "events", start, end): ...
+"""
+import re
+import sqlite3
+from itertools import islice, zip_longest
+from typing import Iterable, Iterator, Optional, Union
+
+from .Moment_aUniversal import UnivMoment
+from .Moment_dMomentArray import MomentArray, instant_binary_key, moment_from_binary_key, moment_to_binary_key
+
+SQLITE_TYPE = "MOMENT"
+# An SQLite type name: words, optionally followed by one or two numbers in parentheses, e.g. VARCHAR(20)
+_TYPE_NAME = re.compile(r"[A-Za-z_]\w*( [A-Za-z_]\w*)*(\(\s*[+-]?\d+\s*(,\s*[+-]?\d+\s*)?\))?")
+
+
+def register_sqlite(type_name: str = SQLITE_TYPE):
+    """
+    Register the sqlite3 adapter of UnivMoment and the converter of columns declared as type_name.
+    The converter applies to connections opened with detect_types=sqlite3.PARSE_DECLTYPES.
+    """
+    sqlite3.register_adapter(UnivMoment, moment_to_binary_key)
+    sqlite3.register_converter(type_name, moment_from_binary_key)
+    return
+
+
+def _identifier(name: str) -> str:
+    if not name.isidentifier():
+        raise ValueError(f"'{name}' is not a valid SQLite table name")
+    return name
+
+
+def _type_name(name: str) -> str:
+    if _TYPE_NAME.fullmatch(name) is None:
+        raise ValueError(f"'{name}' is not a valid SQLite type name")
+    return name
+
+
+def _rows(keys: Iterable[bytes], payloads: Iterable) -> Iterator[tuple]:
+    """(key, payload) pairs, zip would silently drop the moments or payloads in excess"""
+    missing = object()
+    for row in zip_longest(keys, payloads, fillvalue=missing):
+        if row[0] is missing or row[1] is missing:
+            raise ValueError("Moments and payloads differ in number")
+        yield row
+    return
+
+
+def create_moment_table(conn: sqlite3.Connection, table: str, payload_type: str = "TEXT"):
+    """
+    Create the table (moment MOMENT NOT NULL, payload) with an index on moment, if it does not exist.
+
+    Raises:
+        ValueError: if table is not an identifier or payload_type not a type name
+    """
+    table = _identifier(table)
+    payload_type = _type_name(payload_type)
+    with conn:
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (moment {SQLITE_TYPE} NOT NULL, payload {payload_type})")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_moment ON {table} (moment)")
+    return
+
+
+def insert_moments(
+    conn: sqlite3.Connection,
+    table: str,
+    moments: Union[Iterable[UnivMoment], MomentArray],
+    payloads: Optional[Iterable] = None,
+    batch_size: int = 10_000,
+) -> int:
+    """
+    Insert moments, and a payload each, with executemany in batches of one transaction each.
+    The keys of a MomentArray are encoded at once by MomentArray.to_binary_keys.
+
+    Returns:
+        int: the number of rows inserted
+    Raises:
+        ValueError: if moments and payloads differ in number; when neither has a length the batches
+            before the mismatch are committed
+    """
+    table = _identifier(table)
+    if payloads is not None and hasattr(moments, "__len__") and hasattr(payloads, "__len__"):
+        if len(moments) != len(payloads):
+            raise ValueError(f"{len(moments)} moments but {len(payloads)} payloads")
+    if isinstance(moments, MomentArray):
+        keys = iter(moments.to_binary_keys().tolist())
+    else:
+        keys = (moment_to_binary_key(moment) for moment in moments)
+    rows = _rows(keys, payloads) if payloads is not None else ((key, None) for key in keys)
+    statement = f"INSERT INTO {table} (moment, payload) VALUES (?, ?)"
+    count = 0
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return count
+        with conn:
+            conn.executemany(statement, batch)
+        count += len(batch)
+
+
+def between(
+    conn: sqlite3.Connection, table: str, start: UnivMoment, end: UnivMoment
+) -> Iterator[tuple[UnivMoment, object]]:
+    """
+    Range scan over the moment index, the rows at instants start <= moment < end whatever their precision.
+
+    Yields:
+        tuple[UnivMoment, object]: (moment, payload) in chronological order
+    """
+    table = _identifier(table)
+    cursor = conn.execute(
+        f"SELECT CAST(moment AS BLOB), payload FROM {table} WHERE moment >= ? AND moment < ? ORDER BY moment",
+        (instant_binary_key(start), instant_binary_key(end)),
+    )
+    for key, payload in cursor:
+        yield moment_from_binary_key(key), payload
+    return
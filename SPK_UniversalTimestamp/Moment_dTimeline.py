@@ -0,0 +1,234 @@
+"""
+Timeline, a sorted container of UnivMoments with range queries by calendar dates.
+
+The moments are kept in order of their binary keys (see moment_to_binary_key: the instant, then the
+precision level) in a list of sorted blocks of at most 2 * load moments with the last key of each block,
+so an insertion costs two bisections and a block insert whatever the size.  Moments with equal keys keep
+their order of insertion.
+
+    timeline = Timeline(moments)
+    timeline.in_calendar(Calendar.HEBREW, 5785)        # the moments in the Hebrew year 5785
+    timeline.in_calendar(Calendar.CHINESE, 78, 42)     # in the year 42 of the Chinese cycle 78
+    timeline.range(start, end, reverse=True)
+
+merge_sorted merges streams that are each sorted, lazily, comparing keys computed once per moment.
+"""
+import heapq
+from bisect import bisect_left, bisect_right
+from decimal import Decimal
+from itertools import chain
+from typing import Iterable, Iterator, Optional, Union
+
+from .Constants_aCommon import Calendar
+from .Moment_aUniversal import UnivMoment
+from .Moment_dInterval import MomentInterval, calendar_span
+from .Moment_dMomentArray import MomentArray, instant_binary_key, moment_to_binary_key
+
+DEFAULT_LOAD = 1000
+
+
+class Timeline:
+    """A sorted container of UnivMoments, see the module docstring"""
+
+    def __init__(self, moments: Union[Iterable[UnivMoment], MomentArray] = (), load: int = DEFAULT_LOAD):
+        """
+        Args:
+            moments (Iterable[UnivMoment] | MomentArray): the initial moments, in any order
+            load (int): the block size, blocks are split beyond 2 * load moments
+        """
+        self._load = load
+        self._keys: list[list[bytes]] = []
+        self._moments: list[list[UnivMoment]] = []
+        self._maxes: list[bytes] = []
+        self._len = 0
+        self.update(moments)
+        return
+
+    def _set_sorted(self, keys: list, moments: list):
+        """Replace the contents by sorted keys and moments, cut into blocks of load"""
+        self._keys = [keys[ndx:ndx + self._load] for ndx in range(0, len(keys), self._load)]
+        self._moments = [moments[ndx:ndx + self._load] for ndx in range(0, len(moments), self._load)]
+        self._maxes = [block[-1] for block in self._keys]
+        self._len = len(keys)
+        return
+
+    # INSERTION ##################################################################################################
+    def add(self, moment: UnivMoment):
+        """Insert a moment after the moments with an equal key"""
+        key = moment_to_binary_key(moment)
+        if not self._keys:
+            self._set_sorted([key], [moment])
+            return
+        block = min(bisect_right(self._maxes, key), len(self._maxes) - 1)
+        keys, moments = self._keys[block], self._moments[block]
+        ndx = bisect_right(keys, key)
+        keys.insert(ndx, key)
+        moments.insert(ndx, moment)
+        self._maxes[block] = keys[-1]
+        self._len += 1
+        if len(keys) > 2 * self._load:
+            # Split the block in halves
+            half = len(keys) // 2
+            self._keys[block + 1:block + 1] = [keys[half:]]
+            self._moments[block + 1:block + 1] = [moments[half:]]
+            del keys[half:], moments[half:]
+            self._maxes[block:block + 1] = [keys[-1], self._keys[block + 1][-1]]
+        return
+
+    def update(self, moments: Union[Iterable[UnivMoment], MomentArray]):
+        """Insert many moments, sorted at once and merged with the timeline"""
+        if isinstance(moments, MomentArray):
+            keys, moments = moments.to_binary_keys().tolist(), moments.to_moments()
+        else:
+            moments = list(moments)
+            keys = [moment_to_binary_key(moment) for moment in moments]
+        if not moments:
+            return
+        if len(moments) < self._load // 4 and self._keys:
+            for moment in moments:
+                self.add(moment)
+            return
+        self._merge_sorted(self, *_sorted(keys, moments))
+        return
+
+    def _merge_sorted(self, timeline: "Timeline", keys: list, moments: list):
+        """Set the contents to the merge of timeline and sorted keys and moments, timeline first on ties"""
+        own_keys, own_moments = list(chain.from_iterable(timeline._keys)), list(chain.from_iterable(timeline._moments))
+        # Two sorted runs, which the stable sort merges in linear time
+        self._set_sorted(*_sorted(own_keys + keys, own_moments + moments))
+        return
+
+    def merge(self, other: "Timeline") -> "Timeline":
+        """A new timeline of the moments of both, those of self first among equal keys"""
+        merged = Timeline(load=self._load)
+        merged._merge_sorted(self, list(chain.from_iterable(other._keys)), list(chain.from_iterable(other._moments)))
+        return merged
+
+    # SEQUENCE ###################################################################################################
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[UnivMoment]:
+        return chain.from_iterable(self._moments)
+
+    def __reversed__(self) -> Iterator[UnivMoment]:
+        for block in reversed(self._moments):
+            yield from reversed(block)
+        return
+
+    def __contains__(self, moment: UnivMoment) -> bool:
+        key = moment_to_binary_key(moment)
+        block = bisect_left(self._maxes, key)
+        if block == len(self._maxes):
+            return False
+        keys = self._keys[block]
+        ndx = bisect_left(keys, key)
+        return ndx < len(keys) and keys[ndx] == key
+
+    def __repr__(self) -> str:
+        return f"Timeline({len(self)} moments)"
+
+    # QUERIES ####################################################################################################
+    def _range_keys(self, low: bytes, high: bytes, reverse: bool) -> Iterator[UnivMoment]:
+        """The moments with low <= key < high"""
+        if not reverse:
+            block = bisect_left(self._maxes, low)
+            ndx = bisect_left(self._keys[block], low) if block < len(self._keys) else 0
+            for block in range(block, len(self._keys)):
+                keys, moments = self._keys[block], self._moments[block]
+                end = bisect_left(keys, high, ndx)
+                yield from moments[ndx:end]
+                if end < len(keys):
+                    return
+                ndx = 0
+            return
+        block = min(bisect_left(self._maxes, high), len(self._keys) - 1)
+        end = bisect_left(self._keys[block], high) if block >= 0 else 0
+        for block in range(block, -1, -1):
+            keys, moments = self._keys[block], self._moments[block]
+            ndx = bisect_left(keys, low, 0, end)
+            yield from reversed(moments[ndx:end])
+            if ndx > 0:
+                return
+            if block > 0:
+                end = len(self._keys[block - 1])
+        return
+
+    def range(self, start: Optional[UnivMoment] = None, end: Optional[UnivMoment] = None, reverse: bool = False) -> Iterator[UnivMoment]:
+        """
+        The moments at instants start <= moment < end, whatever their precision, in order or in reverse.
+        Without start or end the range is open on that side.
+        """
+        low = instant_binary_key(start) if start is not None else b""
+        if end is None:
+            if not self._maxes:
+                return iter(())
+            # Above any key
+            high = self._maxes[-1] + b"\x00"
+        else:
+            high = instant_binary_key(end)
+        return self._range_keys(low, high, reverse)
+
+    def during(self, span: Union[MomentInterval, UnivMoment], calendar: Calendar = Calendar.GREGORIAN, reverse: bool = False) -> Iterator[UnivMoment]:
+        """The moments in a span, or in the span a moment denotes at its precision (see UnivMoment.interval)"""
+        if isinstance(span, UnivMoment):
+            span = span.interval(calendar)
+        return self.range(span.start, span.end, reverse)
+
+    def in_calendar(self, calendar: Calendar, *fields: int, reverse: bool = False) -> Iterator[UnivMoment]:
+        """
+        The moments in a calendar year, month or day, e.g. in_calendar(Calendar.HEBREW, 5785).
+        The date is converted to R.D. bounds once (see calendar_span) and the range found by bisection.
+        """
+        return self.during(calendar_span(calendar, *fields), reverse=reverse)
+
+
+def _sorted(keys: list, moments: list) -> tuple[list, list]:
+    """keys and moments in the stable order of the keys"""
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    return [keys[ndx] for ndx in order], [moments[ndx] for ndx in order]
+
+
+def _seconds_key(moment: UnivMoment) -> Decimal:
+    """
+    The instant of a moment in seconds since R.D. 0, -Infinity at the beginning of time.
+    Cheaper to build than a binary key, and compared in one operation.
+    """
+    hour, minute, second = moment.rd_time
+    return moment.rd_day * 86400 + hour * 3600 + minute * 60 + second
+
+
+def merge_sorted(
+    *iterables: Iterable[UnivMoment],
+    dedup_within_precision: bool = False,
+    calendar: Calendar = Calendar.GREGORIAN,
+) -> Iterator[UnivMoment]:
+    """
+    Lazily merge iterables of moments, each sorted, into one sorted stream; equal moments in the order of
+    the iterables.  Each moment is decorated once with its instant as one Decimal, see _seconds_key, so the
+    heap compares numbers instead of calling UnivMoment.__lt__.  Memory is one moment per iterable.
+
+    Args:
+        *iterables (Iterable[UnivMoment]): sorted moments, e.g. generators or MomentArrays
+        dedup_within_precision (bool): drop a moment whose span at its precision (see UnivMoment.interval)
+            is that of a moment of the same precision already kept, e.g. a second 12:00:00 at SECOND
+            precision; moments of other precisions, such as the days of a YEAR moment, are all kept
+        calendar (Calendar): the calendar of the YEAR and MONTH spans
+    Yields:
+        UnivMoment: the merged moments
+    """
+    merged = heapq.merge(*iterables, key=_seconds_key)
+    if not dedup_within_precision:
+        yield from merged
+        return
+    # The end of the last span kept, per precision
+    last_ends = {}
+    for moment in merged:
+        # The spans of a precision partition time and come in order, so a span is the last kept one
+        # of its precision if it starts before its end
+        start, end = MomentInterval.of(moment, calendar).keys()
+        if start < last_ends.get(moment.precision, b""):
+            continue
+        last_ends[moment.precision] = end
+        yield moment
+    return
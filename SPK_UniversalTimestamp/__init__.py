@@ -13,90 +13,200 @@ __author__ = "Roswell C Miller"
 __email__ = "support@sarek.ai"
 __description__ = "Comprehensive multi-scale timestamp system"
 
-from .CC01_Calendar_Basics import (
-    Epoch_rd,
-    jd_from_rd,
-    rd_from_jd,
-)
-from .CC02_Gregorian import (
-    is_gregorian_leap_year,
-    rd_from_gregorian,
-    gregorian_from_rd,
-    gregorian_year_from_rd,
-    gregorian_new_year,
-    gregorian_end_year,
-    gregorian_date_difference
-)
-from .CC03_Julian import (
-    is_julian_leap_year,
-    rd_from_julian,
-    julian_from_rd,
-)
-from .CC08_Hebrew import (
-    is_hebrew_leap_year,
-    last_hebrew_month_of_year,
-    last_day_of_hebrew_month,
-    rd_from_hebrew,
-    hebrew_from_rd,
-)
-from .CC14_Time_and_Astronomy import (
-    degrees_from_dms,
-    dms_from_degrees,
-    hms_from_hours,
-    location,
-    AST,
-    direction,
-    zone_from_longitude,
-    universal_from_local,
-    local_from_universal,
-    standard_from_universal,
-    universal_from_standard,
-    standard_from_local,
-    local_from_standard,
-)
-from .CC19_Chinese_1645 import (
-    current_major_solar_term,
-    chinese_location,
-    chinese_solar_longitude_on_or_after,
-    major_solar_term_on_or_after,   
-    current_minor_solar_term,
-    minor_solar_term_on_or_after,
-    midnight_in_china,
-    chinese_winter_solstice_on_or_before,
-    chinese_new_moon_on_or_after,
-    chinese_new_moon_before,
-    is_chinese_no_major_solar_term,
-    is_chinese_prior_leap_month,
-    chinese_new_year_in_sui,
-    chinese_new_year_on_or_before,
-    chinese_from_rd,
-    rd_from_chinese,
-    chinese_sexagesimal_tuple,
-    chinese_name_difference,
-    chinese_year_tuple,
-    chinese_month_epoch,
-    chinese_month_tuple,
-    chinese_day_epoch,
-    chinese_day_tuple,
-    chinese_day_tuple_on_or_before
-    )
-
-from .Constants_aCommon import *
-from .Constants_Chinese import *
-from .Constants_Gregorian import *
-from .Constants_Julian import *
-from .Constants_Hebrew import *
-
-from .Moment_aUniversal import *
-from .Moment_bPresent_Calendars import *
-from .Moment_bPresent_Geological import *
-from .Moment_cPresent_Chinese import *
-from .Moment_cPresent_Gregorian import *
-from .Moment_cPresent_Julian import *
-from .Moment_cPresent_Hebrew import *
-
-from .CC00_Decimal_library import *
-from .Astro_Space import *
+import importlib
+from decimal import getcontext
+
+# Set high precision Decimal computations at import, as before the submodules were loaded lazily
+getcontext().prec = 50
+
+# The package loads lazily (PEP 562): a submodule is imported when one of its names is first accessed,
+# so that pyproj and shapely (Astro_Space), numpy and the geological tables are loaded only when used.
+# Names imported explicitly from a submodule
+_LAZY_IMPORTS = {
+    "CC01_Calendar_Basics": (
+        "Epoch_rd",
+        "jd_from_rd",
+        "rd_from_jd",
+    ),
+    "CC02_Gregorian": (
+        "is_gregorian_leap_year",
+        "rd_from_gregorian",
+        "gregorian_from_rd",
+        "gregorian_year_from_rd",
+        "gregorian_new_year",
+        "gregorian_end_year",
+        "gregorian_date_difference",
+    ),
+    "CC03_Julian": (
+        "is_julian_leap_year",
+        "rd_from_julian",
+        "julian_from_rd",
+    ),
+    "CC08_Hebrew": (
+        "is_hebrew_leap_year",
+        "last_hebrew_month_of_year",
+        "last_day_of_hebrew_month",
+        "rd_from_hebrew",
+        "hebrew_from_rd",
+    ),
+    "CC14_Time_and_Astronomy": (
+        "degrees_from_dms",
+        "dms_from_degrees",
+        "hms_from_hours",
+        "location",
+        "AST",
+        "direction",
+        "zone_from_longitude",
+        "universal_from_local",
+        "local_from_universal",
+        "standard_from_universal",
+        "universal_from_standard",
+        "standard_from_local",
+        "local_from_standard",
+        "lunar_phase_at_or_after",
+        "lunar_phase_events",
+        "solar_longitude_events",
+    ),
+    "CC19_Chinese_1645": (
+        "current_major_solar_term",
+        "chinese_location",
+        "chinese_solar_longitude_on_or_after",
+        "major_solar_term_on_or_after",
+        "current_minor_solar_term",
+        "minor_solar_term_on_or_after",
+        "midnight_in_china",
+        "chinese_winter_solstice_on_or_before",
+        "chinese_new_moon_on_or_after",
+        "chinese_new_moon_before",
+        "is_chinese_no_major_solar_term",
+        "is_chinese_prior_leap_month",
+        "chinese_new_year_in_sui",
+        "chinese_new_year_on_or_before",
+        "chinese_from_rd",
+        "rd_from_chinese",
+        "chinese_sexagesimal_tuple",
+        "chinese_name_difference",
+        "chinese_year_tuple",
+        "chinese_month_epoch",
+        "chinese_month_tuple",
+        "chinese_day_epoch",
+        "chinese_day_tuple",
+        "chinese_day_tuple_on_or_before",
+    ),
+    "Moment_dMomentArray": (
+        "MomentArray",
+        "moment_to_binary_key",
+        "moment_from_binary_key",
+        "BINARY_KEY_LENGTH",
+    ),
+    "Moment_dAstronomy": (
+        "lunar_events",
+        "LUNAR_PHASE_NAMES",
+        "solar_terms",
+        "SOLAR_TERM_NAMES",
+    ),
+    "Moment_dParsing": (
+        "parse_many",
+        "parse_chunks",
+        "strptime_many",
+        "ParseResult",
+        "PARSE_OK",
+        "PARSE_NO_MATCH",
+        "PARSE_INVALID",
+        "GRAMMAR_PATTERNS",
+    ),
+    "Moment_dJSON": (
+        "MomentJSONEncoder",
+        "moment_object_hook",
+        "moment_to_json",
+        "moment_from_json",
+        "write_ndjson",
+        "read_ndjson",
+        "load_ndjson",
+    ),
+    "Moment_dSQLite": (
+        "register_sqlite",
+        "create_moment_table",
+        "insert_moments",
+        "between",
+    ),
+    "Moment_dLog": (
+        "MomentLog",
+        "LogEntries",
+    ),
+    "Moment_dInterval": (
+        "MomentInterval",
+        "IntervalIndex",
+        "calendar_span",
+    ),
+    "Moment_dTimeline": (
+        "Timeline",
+        "merge_sorted",
+    ),
+}
+# Submodules whose public names are all exported, with those names, so that a lookup of any other name
+# fails without importing anything
+_LAZY_STAR_MODULES = {
+    "Constants_aCommon": ("Calendar", "CalendarAtts", "Precision", "PrecisionAtts"),
+    "Constants_Chinese": ("chinese_MONTHS", "chinese_MONTH_ATTS", "chinese_SEXAGESIMALS"),
+    "Constants_Gregorian": ("gregorian_MONTH_ATTS",),
+    "Constants_Julian": ("julian_MONTH_ATTS",),
+    "Constants_Hebrew": ("hebrew_MONTH_ATTS",),
+    "Moment_aUniversal": ("UnivMoment", "STD_LEXICAL_KEY_LENGTH", "STD_LEXICAL_KEY_DAY_OFFSET"),
+    "Moment_bPresent_Calendars": ("Present_Calendars", "TZ_TABLE_FIRST_YEAR", "TZ_TABLE_LAST_YEAR"),
+    "Moment_bPresent_Geological": (
+        "Present_Geological",
+        "GEOLOGICAL_TIME_STRUCTURE",
+        "GEOLOGICAL_TABLE_NAMES",
+        "GEOLOGICAL_EONS",
+        "GEOLOGICAL_ERAS",
+        "GEOLOGICAL_PERIODS",
+        "GEOLOGICAL_EPOCHSandAGES",
+        "GEOLOGICAL_LEVELS",
+        "geological_tables_compact",
+        "load_geological_tables",
+        "classify",
+        "classify_array",
+    ),
+    "Moment_cPresent_Chinese": ("Present_Chinese",),
+    "Moment_cPresent_Gregorian": ("Present_Gregorian",),
+    "Moment_cPresent_Julian": ("Present_Julian",),
+    "Moment_cPresent_Hebrew": ("Present_Hebrew",),
+    "CC00_Decimal_library": (
+        "sqrt",
+        "sin",
+        "cos",
+        "tan",
+        "sign",
+        "abs",
+        "floor",
+        "ceil",
+        "trunc",
+        "round",
+        "round_at",
+        "mod",
+        "mod_adj",
+        "mod_interval",
+        "MAX",
+        "min",
+        "MIN",
+        "decimal_",
+        "count_decimal_places",
+        "to_roman_numeral",
+        "within_precision",
+    ),
+    "Astro_Space": ("psoEarth",),
+}
+# The explicit imports take precedence
+_LAZY_MODULES = {
+    name: module
+    for module, names in (*_LAZY_STAR_MODULES.items(), *_LAZY_IMPORTS.items())
+    for name in names
+}
+_SUBMODULES = frozenset(_LAZY_IMPORTS) | frozenset(_LAZY_STAR_MODULES) | {
+    "CC00_Polynomial",
+    "CC14_Astronomy_Arrays",
+}
 
 # Make package metadata available
 __all__ = [
@@ -108,6 +218,7 @@ __all__ = [
     
     # Core classes
     "UnivMoment",
+    "MomentArray",
     
     # Enums and attributes
     "Calendar",
@@ -116,18 +227,23 @@ __all__ = [
     "PrecisionAtts",
     
     # Calendar-specific implementations
-    "Present_GEOLOGICAL",
+    "Present_Geological",
     "Present_Calendars",
-    "Present_GREGORIAN",
-    "Present_JULIAN",
-    "Present_HEBREW",
-    "Present_CHINESE",
+    "Present_Gregorian",
+    "Present_Julian",
+    "Present_Hebrew",
+    "Present_Chinese",
     
     # Constants and data
     "GEOLOGICAL_EONS",
     "GEOLOGICAL_ERAS",
     "GEOLOGICAL_PERIODS",
     "GEOLOGICAL_EPOCHSandAGES",
+    "GEOLOGICAL_LEVELS",
+    "classify",
+    "classify_array",
+    "geological_tables_compact",
+    "load_geological_tables",
     "Epoch_rd",
     
     # Base calendar functions
@@ -157,5 +273,74 @@ __all__ = [
     
     # Chinese calendar functions
     "rd_from_chinese",
-    "chinese_from_rd"
-]
\ No newline at end of file
+    "chinese_from_rd",
+
+    # Astronomical events
+    "lunar_phase_at_or_after",
+    "lunar_phase_events",
+    "lunar_events",
+    "LUNAR_PHASE_NAMES",
+    "solar_longitude_events",
+    "solar_terms",
+    "SOLAR_TERM_NAMES",
+
+    # Bulk parsing
+    "parse_many",
+    "parse_chunks",
+    "strptime_many",
+    "ParseResult",
+    "PARSE_OK",
+    "PARSE_NO_MATCH",
+    "PARSE_INVALID",
+    "GRAMMAR_PATTERNS",
+
+    # JSON
+    "MomentJSONEncoder",
+    "moment_object_hook",
+    "moment_to_json",
+    "moment_from_json",
+    "write_ndjson",
+    "read_ndjson",
+    "load_ndjson",
+
+    # Binary keys and SQLite
+    "moment_to_binary_key",
+    "moment_from_binary_key",
+    "BINARY_KEY_LENGTH",
+    "register_sqlite",
+    "create_moment_table",
+    "insert_moments",
+    "between",
+
+    # Moment log
+    "MomentLog",
+    "LogEntries",
+
+    # Precision intervals
+    "MomentInterval",
+    "IntervalIndex",
+    "calendar_span",
+
+    # Timeline
+    "Timeline",
+    "merge_sorted"
+]
+
+
+def _import(module: str):
+    return importlib.import_module(f".{module}", __name__)
+
+
+def __getattr__(name: str):
+    """Import the submodule defining name on first access"""
+    if name in _SUBMODULES:
+        return _import(name)
+    if name not in _LAZY_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_import(_LAZY_MODULES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | set(_LAZY_MODULES) | _SUBMODULES)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the SPK_UniversalTimestamp import time.
+
+Each scenario runs in a fresh interpreter, timing the import statements and
+listing which heavy third-party modules ended up loaded.  The package loads
+its submodules lazily, so the bare import should stay well below the cost of
+touching every public name.
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+HEAVY_MODULES = ("numpy", "pyproj", "shapely", "langcodes", "tzlocal", "mpmath")
+
+SCENARIOS = {
+    "import SPK_UniversalTimestamp": "import SPK_UniversalTimestamp",
+    "from SPK_UniversalTimestamp import UnivMoment": "from SPK_UniversalTimestamp import UnivMoment",
+    "every name of __all__": (
+        "import SPK_UniversalTimestamp\n"
+        "for name in SPK_UniversalTimestamp.__all__:\n"
+        "    getattr(SPK_UniversalTimestamp, name)"
+    ),
+}
+
+TEMPLATE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, ",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+def run(statement: str) -> tuple[float, str]:
+    code = TEMPLATE.format(statement=statement, heavy=HEAVY_MODULES)
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=PACKAGE_DIR, capture_output=True, text=True, check=True
+    )
+    elapsed, _, loaded = result.stdout.strip().partition(" ")
+    return float(elapsed), loaded
+
+
+def main(repeat: int = 5):
+    """Print the median import time of each scenario and the heavy modules it loaded."""
+    print("SPK_UniversalTimestamp import benchmark")
+    print("=" * 50)
+    for name, statement in SCENARIOS.items():
+        timings = []
+        for _ in range(repeat):
+            elapsed, loaded = run(statement)
+            timings.append(elapsed)
+        print(f"   {name}: {statistics.median(timings) * 1000:8.1f} ms  loads [{loaded}]")
+    return
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark of SQLite moment keys: to_StdLexicalKey strings against order preserving binary keys.
+
+Both tables hold the same moments with an index on the key.  The keys are encoded before the
+timing, so the insert and range query figures compare the storage and the index alone; the
+encoding time of each key type is printed separately.
+"""
+import os
+import random
+import sqlite3
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+
+from SPK_UniversalTimestamp.Moment_dMomentArray import MomentArray
+from SPK_UniversalTimestamp.Moment_dSQLite import create_moment_table
+
+
+def random_moments(count: int) -> MomentArray:
+    rng = np.random.default_rng(2025)
+    return MomentArray(
+        rng.integers(600_000, 800_000, count),
+        rng.integers(0, 86400, count),
+        rng.integers(0, 1000, count) * 10**15,
+        np.full(count, 12),
+    )
+
+
+def database_size(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA page_count").fetchone()[0] * conn.execute("PRAGMA page_size").fetchone()[0]
+
+
+def run(name: str, keys: list, bounds: list) -> None:
+    conn = sqlite3.connect(":memory:")
+    if name == "binary":
+        create_moment_table(conn, "events")
+    else:
+        with conn:
+            conn.execute("CREATE TABLE events (moment TEXT NOT NULL, payload TEXT)")
+            conn.execute("CREATE INDEX events_moment ON events (moment)")
+    start = time.perf_counter()
+    with conn:
+        conn.executemany("INSERT INTO events (moment, payload) VALUES (?, NULL)", ((key,) for key in keys))
+    insert = time.perf_counter() - start
+    start = time.perf_counter()
+    rows = 0
+    for low, high in bounds:
+        rows += len(conn.execute(
+            "SELECT moment FROM events WHERE moment >= ? AND moment < ? ORDER BY moment", (low, high)
+        ).fetchall())
+    query = time.perf_counter() - start
+    print(
+        f"   {name:8s} insert {len(keys) / insert:10,.0f} rows/s   range {len(bounds) / query:8,.0f} queries/s"
+        f" ({rows / query:10,.0f} rows/s)   {database_size(conn) / 2**20:6.1f} MiB"
+    )
+    conn.close()
+    return
+
+
+def main(count: int = 200_000, queries: int = 2_000):
+    """Print insert and range query throughput of lexical and binary keys"""
+    print(f"SQLite moment keys, {count:,} moments, {queries:,} range queries")
+    print("=" * 50)
+    moments = random_moments(count)
+    start = time.perf_counter()
+    binary = moments.to_binary_keys().tolist()
+    print(f"   encode binary  {(time.perf_counter() - start) / count * 1e6:6.2f} us/key (MomentArray.to_binary_keys)")
+    start = time.perf_counter()
+    lexical = [moment.to_StdLexicalKey() for moment in moments]
+    print(f"   encode lexical {(time.perf_counter() - start) / count * 1e6:6.2f} us/key (to_StdLexicalKey)")
+    random.seed(2025)
+    order = np.argsort(np.array(binary, dtype=object))
+    # Each range spans about 0.1% of the moments
+    span = max(1, count // 1000)
+    starts = [random.randrange(count - span) for _ in range(queries)]
+    ranges = [(order[i], order[i + span]) for i in starts]
+    run("lexical", lexical, [(lexical[a], lexical[b]) for a, b in ranges])
+    run("binary", binary, [(binary[a], binary[b]) for a, b in ranges])
+    return
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the Decimal trigonometry in CC00_Decimal_library.
+
+Compares the Decimal-native sin/cos against the former implementation which
+round-tripped every call through str -> mpmath.mpf -> str -> Decimal, and
+times solar_longitude, whose series makes dozens of trig calls per evaluation.
+"""
+import os
+import sys
+import timeit
+from decimal import Decimal
+
+import mpmath
+
+# Add the parent directory to Python path so we can import the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from SPK_UniversalTimestamp.CC00_Decimal_library import sin, cos, DEG2RAD
+from SPK_UniversalTimestamp.CC14_Time_and_Astronomy import solar_longitude
+import SPK_UniversalTimestamp.CC14_Time_and_Astronomy as CC14
+
+mpmath.mp.dps = 30
+
+
+def mpmath_sin(x: Decimal) -> Decimal:
+    return Decimal(str(mpmath.sin(mpmath.mpf(str(x)))))
+
+
+def mpmath_cos(x: Decimal) -> Decimal:
+    return Decimal(str(mpmath.cos(mpmath.mpf(str(x)))))
+
+
+def per_call_us(func, args, number: int) -> float:
+    def run():
+        for a in args:
+            func(a)
+    return min(timeit.repeat(run, number=number, repeat=3)) / (number * len(args)) * 1e6
+
+
+def main():
+    """Print per-call timings of both trig implementations and of solar_longitude."""
+    args = [DEG2RAD * Decimal(d) + Decimal("0.123456789") for d in range(-720, 720, 7)]
+    print("Decimal trigonometry benchmark")
+    print("=" * 50)
+    for name, native, legacy in (("sin", sin, mpmath_sin), ("cos", cos, mpmath_cos)):
+        t_native = per_call_us(native, args, 20)
+        t_legacy = per_call_us(legacy, args, 20)
+        print(f"   {name}: Decimal-native {t_native:8.2f} us/call, mpmath round-trip {t_legacy:8.2f} us/call")
+
+    moments = [Decimal(730120) + Decimal(n) * Decimal("36.5") for n in range(50)]
+    t_native = per_call_us(solar_longitude, moments, 2)
+    CC14.sin, CC14.cos = mpmath_sin, mpmath_cos
+    try:
+        t_legacy = per_call_us(solar_longitude, moments, 2)
+    finally:
+        CC14.sin, CC14.cos = sin, cos
+    print(f"   solar_longitude: Decimal-native {t_native:8.1f} us/call, mpmath round-trip {t_legacy:8.1f} us/call")
+    return
+
+
+if __name__ == "__main__":
+    main()
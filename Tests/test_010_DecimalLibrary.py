@@ -99,3 +99,37 @@ class TestDecimalLibrary:
         assert n_r == Decimal('13'), "Round function failed"
         return
     
+
+    def test_polynomial(self):
+        """Horner evaluation matches the expanded power series in Decimal, float and arrays."""
+        from SPK_UniversalTimestamp.CC00_Polynomial import Polynomial, poly
+        import numpy as np
+        p = Polynomial("218.3164477", "481267.88123421", "-0.0015786", 1 / Decimal(538_841))
+        assert p.degree == 3
+        for c in (Decimal('-12.5'), Decimal('0.25'), Decimal('3')):
+            expanded = sum(a * c**i for i, a in enumerate(p.coefficients))
+            assert abs(p(c) - expanded) < Decimal('1e-20'), f"c = {c}"
+            assert abs(p.evaluate_float(float(c)) - float(expanded)) < 1e-6, f"c = {c}"
+        values = p.evaluate_array([-1.0, 0.0, 1.0])
+        assert np.allclose(values, [p.evaluate_float(-1.0), p.evaluate_float(0.0), p.evaluate_float(1.0)])
+        assert poly(Decimal(2), (Decimal(1), Decimal(2), Decimal(3))) == Decimal(17)
+        print(f"✅ SUCCESS: {self.test_polynomial.__doc__}")
+        return
+
+    def test_trig_against_mpmath(self):
+        """Decimal-native sin, cos and tan agree with mpmath across quadrants and large arguments."""
+        import mpmath
+        from decimal import localcontext
+        with mpmath.workdps(60):
+            for prec in (30, 50):
+                with localcontext() as lctx:
+                    lctx.prec = prec
+                    tolerance = Decimal(10) ** -(prec - 2)
+                    for text in ('0', '1e-20', '0.5', '-0.785398', '1.5707963', '3.14159', '-4.7', '100.25', '-98765.4321', '1234567.891'):
+                        x = Decimal(text)
+                        for f, g in ((sin, mpmath.sin), (cos, mpmath.cos), (tan, mpmath.tan)):
+                            expected = Decimal(mpmath.nstr(g(mpmath.mpf(text)), 60))
+                            scale = max(Decimal(1), abs(expected))
+                            assert abs(f(x) - expected) <= tolerance * scale, f"{f.__name__}({text}) at prec {prec}"
+        print(f"✅ SUCCESS: {self.test_trig_against_mpmath.__doc__}")
+        return
@@ -4,7 +4,7 @@ Comprehensive tests for the UnivMoment class.
 from decimal import Decimal
 
 from SPK_UniversalTimestamp.Constants_aCommon import Calendar, Precision
-from SPK_UniversalTimestamp.Moment_aUniversal import UnivMoment
+from SPK_UniversalTimestamp.Moment_aUniversal import UnivMoment, _compile_format, _compile_presentation
 
 class Test_Moment_aUniversal: 
     """Test cases for UnivMoment class."""
@@ -43,6 +43,25 @@ class Test_Moment_aUniversal:
         print(f"✅ SUCCESS: {self.test_json_serialization.__doc__}")
         return
     
+    def test_rd_moment_conversion(self):
+        """Test UnivMoment.from_rd_moment()/to_rd_moment() conversion."""
+        moment = UnivMoment.from_rd_moment(Decimal('730120.75'))
+        assert moment.rd_moment() == (Decimal('730120'), (18, 0, Decimal('0')))
+        assert moment.precision == Precision.SECOND
+        assert moment.to_rd_moment() == Decimal('730120.75')
+
+        moment = UnivMoment.from_rd_moment(Decimal('-10.5000001'), Precision.MILLISECOND)
+        assert moment.rd_moment() == (Decimal('-11'), (11, 59, Decimal('59.991')))
+        # Rounding into the next day carries
+        moment = UnivMoment.from_rd_moment(Decimal('730120.999999999'), Precision.SECOND)
+        assert moment.rd_moment() == (Decimal('730121'), (0, 0, Decimal('0')))
+        moment = UnivMoment.from_rd_moment(Decimal('730120.999999999'), Precision.DAY)
+        assert moment.rd_moment() == (Decimal('730120'), (0, 0, Decimal('0')))
+
+        moment = UnivMoment.from_gregorian(2000, 1, 1, 12, 25, Decimal('34.6'))
+        assert UnivMoment.from_rd_moment(moment.to_rd_moment(), Precision.MILLISECOND) == moment
+        print(f"✅ SUCCESS: {self.test_rd_moment_conversion.__doc__}")
+        return
     
     def test_indexing(self):
         """Test indexing of UnivMoment."""
@@ -93,4 +112,61 @@ class Test_Moment_aUniversal:
         
         
         print(f"✅ SUCCESS: {self.test_subtraction.__doc__}")
-        return
\ No newline at end of file
+        return
+
+    def test_compiled_format_plan(self):
+        """Test format strings compile once into literal and segment ops."""
+        plan = _compile_format(Calendar.JULIAN, "On %Y-%#m-%d %H:%M:%S (%k) %f3", "en")
+        assert plan == (
+            "On ",
+            {'type': 'Y', 'eliminate_leading_zero': False, 'frac_digits': None},
+            "-",
+            {'type': 'm', 'eliminate_leading_zero': True, 'frac_digits': None},
+            "-",
+            {'type': 'd', 'eliminate_leading_zero': False, 'frac_digits': None},
+            " ",
+            {'type': 'H', 'eliminate_leading_zero': False, 'frac_digits': None},
+            ":",
+            {'type': 'M', 'eliminate_leading_zero': False, 'frac_digits': None},
+            ":",
+            {'type': 'S', 'eliminate_leading_zero': False, 'frac_digits': None},
+            " (JC) ",
+            {'type': 'f', 'eliminate_leading_zero': False, 'frac_digits': 3},
+        )
+        assert _compile_format(Calendar.JULIAN, "On %Y-%#m-%d %H:%M:%S (%k) %f3", "en") is plan
+        assert _compile_format(Calendar.GREGORIAN, "no inserts", "en") == ("no inserts",)
+        assert _compile_format(Calendar.GREGORIAN, "", "en") == ()
+
+        # Segments resolve to functions of the presentation once, unknown ones to literal text
+        presentation = UnivMoment.from_gregorian(2024, 3, 5).presentation(Calendar.JULIAN)
+        executable = _compile_presentation(type(presentation), Calendar.JULIAN, "On %Y %Q-%#m", "en")
+        assert [op.__class__ is str for op in executable] == [True, False, True, False]
+        assert executable[2] == " %Q-"
+        assert _compile_presentation(type(presentation), Calendar.JULIAN, "On %Y %Q-%#m", "en") is executable
+        assert presentation._format("On %Y %Q-%#m") == "On 2024 %Q-2"
+
+        moment = UnivMoment.from_gregorian(2024, 3, 5, 7, 8, 9)
+        for _ in range(3):
+            assert moment.present(Calendar.GREGORIAN, "%Y-%m-%d %H:%M:%S %K") == "2024-03-05 07:08:09 Gregorian"
+        print(f"✅ SUCCESS: {self.test_compiled_format_plan.__doc__}")
+        return
+
+    def test_present_many(self):
+        """Test present_many matches present for every spec, as a tuple or a dict."""
+        moment = UnivMoment.from_gregorian(2024, 3, 5, 7, 8, 9)
+        specs = (
+            (Calendar.GREGORIAN, "%Y-%m-%d %H:%M:%S"),
+            (Calendar.GREGORIAN, "%A %d %B %Y", "America/New_York"),
+            (Calendar.HEBREW, "%Y-%m-%d", "UTC", "en"),
+            (Calendar.JULIAN, "%Y-%m-%d %k"),
+        )
+        expected = tuple(moment.present(*spec) for spec in specs)
+        assert moment.present_many(specs) == expected
+        named = moment.present_many({"iso": specs[0], "hebrew": specs[2]})
+        assert named == {"iso": expected[0], "hebrew": expected[2]}
+        # Deep time falls back to the geological presentation as in present()
+        deep = UnivMoment.from_geological(66, precision=Precision.MILLION_YEARS)
+        geological = (Calendar.GEOLOGICAL, "%O %R %P")
+        assert deep.present_many([specs[0], geological]) == (deep.present(*specs[0]), deep.present(*geological))
+        print(f"✅ SUCCESS: {self.test_present_many.__doc__}")
+        return
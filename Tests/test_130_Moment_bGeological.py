@@ -1,9 +1,14 @@
 """
 Comprehensive tests for the Moment_Geological class.
 """
+import json
 from decimal import Decimal
+
+import numpy as np
 from SPK_UniversalTimestamp.Constants_aCommon import Calendar, Precision
 from SPK_UniversalTimestamp.Moment_aUniversal import UnivMoment
+from SPK_UniversalTimestamp.Moment_bPresent_Geological import classify, classify_array
+from SPK_UniversalTimestamp import Moment_bPresent_Geological
 
 class Test_Geological: 
     """Test cases for Moment_Geological class."""
@@ -58,4 +63,59 @@ class Test_Geological:
         ts_formatted = moment.present(Calendar.GEOLOGICAL, format="%Y | %y | %O | %R | %P | %a", language="en")
         assert ts_formatted == '-3700.00 M-yr | -3700.00 M-yr | Archean | Eoarchean | pre-periods | pre-epochs'
         print(f"✅ SUCCESS: {self.test_present_geological.__doc__}")
-        return
\ No newline at end of file
+        return
+
+    def test_classify(self):
+        """Test classify returns the same eon, era, period and epoch as the presentation."""
+        for years_ago in [0, 4200, 500_000, 6_000_000, 66_000_000, 146_000_000, 330_900_000, 2_400_000_000, 3_700_000_000, 4_500_000_000]:
+            moment = UnivMoment.from_geological(years_ago, precision=Precision.YEAR)
+            names = moment.present(Calendar.GEOLOGICAL, format="%O|%R|%P|%a").split("|")
+            chain = classify(years_ago)
+            expected = dict(zip(("eon", "era", "period", "epoch"), names))
+            for level, fallback in (("eon", ""), ("era", "pre-eras"), ("period", "pre-periods"), ("epoch", "pre-epochs")):
+                assert (chain[level] or fallback) == expected[level], f"{years_ago} years ago, {level}"
+        assert classify(Decimal('146_000_000')) == {"eon": "Phanerozoic", "era": "Mesozoic", "period": "Jurassic", "epoch": "late Tithonian"}
+        assert classify(3_700_000_000) == {"eon": "Archean", "era": "Eoarchean", "period": None, "epoch": None}
+        print(f"✅ SUCCESS: {self.test_classify.__doc__}")
+        return
+
+    def test_classify_array(self):
+        """Test classify_array codes agree with classify, including ages on the boundaries."""
+        ages = [0, 0.0042, 0.5, 2.58, 6.0, 23.03, 66.0, 146.0, 330.9, 541.0, 2400.0, 3700.0, 4549.99, 4600.0]
+        codes, names = classify_array(ages, Precision.MILLION_YEARS)
+        for ndx, age in enumerate(ages):
+            chain = classify(Decimal(str(age)) * 1_000_000)
+            for level, name in chain.items():
+                code = int(codes[level][ndx])
+                assert (names[level][code] if code >= 0 else None) == name, f"{age} Ma, {level}"
+        codes, names = classify_array(np.array([330_900_000, float('nan'), float('-inf')]), Precision.YEAR)
+        assert names["period"][codes["period"][0]] == "Carboniferous"
+        assert list(codes["eon"][1:]) == [-1, -1]
+        try:
+            classify_array([1.0], Precision.DAY)
+            assert False, "Expected ValueError for day precision"
+        except ValueError as ve:
+            assert True, str(ve)
+        print(f"✅ SUCCESS: {self.test_classify_array.__doc__}")
+        return
+
+    def test_geological_tables(self):
+        """Test the lazily built geological tables and their compact serialized form."""
+        import SPK_UniversalTimestamp
+        eons = Moment_bPresent_Geological.GEOLOGICAL_EONS
+        assert [eon["name"] for eon in eons] == ["Hadean", "Archean", "Proterozic", "Phanerozoic"]
+        assert SPK_UniversalTimestamp.GEOLOGICAL_EONS is eons
+        assert len(SPK_UniversalTimestamp.GEOLOGICAL_EPOCHSandAGES) == 102
+
+        compact = json.loads(json.dumps(Moment_bPresent_Geological.geological_tables_compact()))
+        tables = Moment_bPresent_Geological._tables_from_compact(compact)
+        for name in Moment_bPresent_Geological.GEOLOGICAL_TABLE_NAMES:
+            assert tables[name] == getattr(Moment_bPresent_Geological, name), name
+        compact["version"] = "0.0"
+        try:
+            Moment_bPresent_Geological._tables_from_compact(compact)
+            assert False, "Expected ValueError for a mismatched version"
+        except ValueError as ve:
+            assert True, str(ve)
+        print(f"✅ SUCCESS: {self.test_geological_tables.__doc__}")
+        return
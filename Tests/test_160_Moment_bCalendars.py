@@ -145,3 +145,67 @@ class Test_Moment_Calendars:
             print("✅ All format tests passed successfully!")
         return
 
+    def test_lazy_calendar_fields(self):
+        """Calendar fields are converted only when the format references them."""
+        from SPK_UniversalTimestamp.CC19_Chinese_1645 import chinese_from_rd
+        moment = UnivMoment.from_gregorian(1996, 2, 25, 14, 35, 23)
+        for calendar in (Calendar.GREGORIAN, Calendar.JULIAN, Calendar.HEBREW, Calendar.CHINESE):
+            presentation = moment.presentation(calendar, 'America/New_York')
+            assert presentation._format("%H:%M:%S") == "09:35:23"
+            assert "year" not in presentation.__dict__ and "month" not in presentation.__dict__, calendar
+            full = presentation._format("%Y-%m-%d")
+            assert full == moment.present(calendar, "%Y-%m-%d", 'America/New_York'), calendar
+        # A year only Chinese format has the year of the full date, also where chinese_from_rd gives month -1
+        for rd in (Decimal(700_160), Decimal(728_714), Decimal(738_000), Decimal(600_000), Decimal(-100_000)):
+            cycle, year, _, _, _ = chinese_from_rd(rd)
+            moment = UnivMoment(rd, (12, 0, 0), Precision.DAY)
+            assert moment.present(Calendar.CHINESE, "%c-%Y") == f"{cycle}-{year}", rd
+            assert moment.present(Calendar.CHINESE, "%Y") == moment.present(Calendar.CHINESE, "%Y-%m-%d").split("-")[0], rd
+        print(f"✅ SUCCESS: {self.test_lazy_calendar_fields.__doc__}")
+        return
+
+    def test_utc_offset_table(self):
+        """UTC offsets from the transition table agree with zoneinfo, also vectorized."""
+        import numpy as np
+        from datetime import date
+        from zoneinfo import ZoneInfo
+        from SPK_UniversalTimestamp.Moment_bPresent_Calendars import Present_Calendars
+        for tz in ('America/New_York', 'Australia/Lord_Howe', 'Asia/Kolkata'):
+            rd_days = list(range(date(1848, 1, 1).toordinal(), date(2150, 1, 1).toordinal(), 11))
+            expected = []
+            for rd in rd_days:
+                offset = datetime.combine(date.fromordinal(rd), datetime.min.time(), ZoneInfo(tz)).utcoffset()
+                hours, remainder = divmod(offset.total_seconds(), 3600)
+                expected.append((int(hours), int(remainder // 60)))
+                assert Present_Calendars.get_utc_offset(tz, Decimal(rd) + Decimal('0.75')) == expected[-1], (tz, rd)
+            hours, minutes = Present_Calendars.get_utc_offset_array(tz, np.array(rd_days + [600_000]) + 0.75)
+            assert list(zip(hours[:-1].tolist(), minutes[:-1].tolist())) == expected, tz
+            assert (hours[-1], minutes[-1]) == (0, 0)
+        # (hours, minutes) before the table years too, see test_time_zone_before_1847
+        assert Present_Calendars.get_utc_offset('America/New_York', Decimal(600_000)) == (0, 0)
+        print(f"✅ SUCCESS: {self.test_utc_offset_table.__doc__}")
+        return
+
+    def test_time_zone_local_date(self):
+        """In a time zone the presented date is that of the local time, not of U.T."""
+        moment = UnivMoment.from_gregorian(2024, 3, 5, 2, 30)
+        assert moment.present(Calendar.GREGORIAN, "%Y-%m-%d %H:%M", tz='America/New_York') == "2024-03-04 21:30"
+        assert moment.present(Calendar.GREGORIAN, "%Y-%m-%d %H:%M", tz='Asia/Tokyo') == "2024-03-05 11:30"
+        print(f"✅ SUCCESS: {self.test_time_zone_local_date.__doc__}")
+        return
+
+    def test_time_zone_offset(self):
+        """%z writes half-hour offsets on either side of U.T."""
+        moment = UnivMoment.from_gregorian(2024, 1, 15, 12, 0)
+        assert moment.present(Calendar.GREGORIAN, "%z", tz='America/St_Johns') == "-03:30"
+        assert moment.present(Calendar.GREGORIAN, "%z", tz='Asia/Kolkata') == "+05:30"
+        assert moment.present(Calendar.GREGORIAN, "%z", tz='America/New_York') == "-05:00"
+        print(f"✅ SUCCESS: {self.test_time_zone_offset.__doc__}")
+        return
+
+    def test_time_zone_before_1847(self):
+        """Dates before the time zone tables are presented in a time zone at offset 0."""
+        moment = UnivMoment.from_gregorian(1700, 1, 1, 12, 30)
+        assert moment.present(Calendar.GREGORIAN, "%Y-%m-%d %H:%M %z", tz='America/New_York') == "1700-01-01 12:30 +00:00"
+        print(f"✅ SUCCESS: {self.test_time_zone_before_1847.__doc__}")
+        return
@@ -0,0 +1,74 @@
+"""
+Tests for strptime, the inverse of the presentation formats.
+"""
+from decimal import Decimal
+
+import pytest
+
+from SPK_UniversalTimestamp.Constants_aCommon import Calendar, Precision
+from SPK_UniversalTimestamp.Moment_aUniversal import UnivMoment
+from SPK_UniversalTimestamp.Moment_dParsing import PARSE_INVALID, PARSE_NO_MATCH, PARSE_OK, strptime_many
+
+FORMATS = (
+    "%Y-%m-%d %H:%M:%S%f",
+    "%A %d %B %Y %I:%M %p",
+    "%a %#d %b %y %H:%M %z",
+    "%d %B %Y %H:%M %Z",
+    "%K %Y-%m-%d",
+    "%y %k",
+    "%B %Y",
+)
+
+
+class TestStrptime:
+
+    def test_round_trip(self):
+        """strptime reads back what present writes, in every calendar, language and time zone."""
+        moments = [
+            UnivMoment.from_gregorian(2024, 2, 29, 23, 45, Decimal('7.125'), precision=Precision.MILLISECOND),
+            UnivMoment.from_gregorian(-44, 3, 15, 0, 5, Decimal('0.5'), precision=Precision.MILLISECOND),
+            UnivMoment.from_gregorian(1752, 9, 14, 12, 0, Decimal('59.001'), precision=Precision.MILLISECOND),
+        ]
+        for calendar in (Calendar.GREGORIAN, Calendar.JULIAN, Calendar.HEBREW):
+            for language in ('en', 'fr', 'de'):
+                for format in FORMATS:
+                    zones = ('UTC', 'America/St_Johns', 'Asia/Kolkata') if '%z' in format or '%Z' in format else ('UTC',)
+                    for tz in zones:
+                        for moment in moments:
+                            text = moment.present(calendar, format, tz, language)
+                            parsed = UnivMoment.strptime(text, calendar, format, language)
+                            assert parsed.present(calendar, format, tz, language) == text, (calendar, format, tz, text)
+        parsed = UnivMoment.strptime("2024-02-29 23:45:07.125", format="%Y-%m-%d %H:%M:%S%f")
+        assert parsed == moments[0] and parsed.precision == Precision.MILLISECOND
+        # The local time of the zone is converted back to U.T.
+        assert UnivMoment.strptime("1 March 2024 05:15 +05:30", format="%d %B %Y %H:%M %z") == UnivMoment.from_gregorian(2024, 2, 29, 23, 45)
+        assert UnivMoment.strptime("Adar II 5784", Calendar.HEBREW, "%B %Y").present(Calendar.HEBREW, "%B") == "Adar II"
+        print(f"✅ SUCCESS: {self.test_round_trip.__doc__}")
+        return
+
+    def test_errors(self):
+        """Texts that do not match, invalid dates, wrong weekdays and unsupported formats raise ValueError."""
+        for text, format in (
+            ("2024/02/03", "%Y-%m-%d"),
+            ("2024-02-30", "%Y-%m-%d"),
+            ("Monday 3 February 2024", "%A %d %B %Y"),
+            ("03 February", "%d %B"),
+            ("2024 03", "%Y %d"),
+        ):
+            with pytest.raises(ValueError):
+                UnivMoment.strptime(text, format=format)
+        with pytest.raises(ValueError):
+            UnivMoment.strptime("4721", Calendar.CHINESE, "%Y")
+        print(f"✅ SUCCESS: {self.test_errors.__doc__}")
+        return
+
+    def test_strptime_many(self):
+        """The bulk mode compiles the format once and reports a status per row."""
+        result = strptime_many(["2024-02-03 04:05:06", "x", "2024-02-30 00:00:00"], format="%Y-%m-%d %H:%M:%S")
+        assert result.status.tolist() == [PARSE_OK, PARSE_NO_MATCH, PARSE_INVALID]
+        assert result.grammar.tolist() == [0, -1, 0]
+        assert result.moments[0] == UnivMoment.from_gregorian(2024, 2, 3, 4, 5, 6)
+        # The rows that did not parse read back as the beginning of time
+        assert result.moments.to_moments()[1:] == [UnivMoment.beginning_of_time()] * 2
+        print(f"✅ SUCCESS: {self.test_strptime_many.__doc__}")
+        return
@@ -0,0 +1,101 @@
+"""
+Tests for the MomentArray columnar container.
+"""
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from SPK_UniversalTimestamp.Constants_aCommon import Calendar, Precision
+from SPK_UniversalTimestamp.Moment_aUniversal import UnivMoment
+from SPK_UniversalTimestamp.Moment_dMomentArray import MomentArray
+
+
+class Test_MomentArray:
+
+    def moments(self) -> list[UnivMoment]:
+        return [
+            UnivMoment.from_gregorian(2000, 1, 1, 12, 25, Decimal('34.6'), description="millennium"),
+            UnivMoment(Decimal('-5'), (23, 59, Decimal('59.123456789012345678')), Precision.ATTOSECOND),
+            UnivMoment.from_gregorian(1492, 10, 12),
+            UnivMoment.beginning_of_time(),
+        ]
+
+    def test_round_trip(self):
+        """UnivMoments survive the conversion to columns and back."""
+        moments = self.moments()
+        array = MomentArray.from_moments(moments)
+        assert len(array) == len(moments)
+        assert array.day.dtype == np.int64 and array.second.dtype == np.int32
+        assert array.attosecond.dtype == np.int64 and array.precision.dtype == np.int8
+        for original, restored in zip(moments, array):
+            assert restored == original
+            assert restored.precision == original.precision
+            assert getattr(restored, 'description', None) == getattr(original, 'description', None)
+        assert array[-1] == moments[-1]
+        assert array.precisions() == [m.precision for m in moments]
+        print(f"✅ SUCCESS: {self.test_round_trip.__doc__}")
+        return
+
+    def test_fractional_day(self):
+        """A fractional rd_day is folded into the time of day."""
+        array = MomentArray.from_moments([UnivMoment(Decimal('730120.75'), (6, 0, Decimal(0)))])
+        assert array[0].rd_moment() == (Decimal('730121'), (0, 0, Decimal(0)))
+        assert array.rd_moments()[0] == 730121.0
+        print(f"✅ SUCCESS: {self.test_fractional_day.__doc__}")
+        return
+
+    def test_slicing_sorting_concatenate(self):
+        """Slices, index arrays, argsort and concatenate return MomentArrays."""
+        moments = self.moments()
+        array = MomentArray.from_moments(moments)
+        ordered = array[array.argsort()]
+        assert isinstance(ordered, MomentArray)
+        assert ordered.to_moments() == sorted(moments)
+        assert array[1:3].to_moments() == moments[1:3]
+        joined = MomentArray.concatenate([array[:2], array[2:]])
+        assert joined.to_moments() == moments
+        assert len(MomentArray.concatenate([])) == 0
+        assert len(MomentArray.from_moments([])) == 0
+        with pytest.raises(IndexError):
+            array[len(array)]
+        with pytest.raises(ValueError):
+            MomentArray([1, 2], [0], [0], [11])
+        with pytest.raises(AttributeError):
+            array.day = np.zeros(4)
+        print(f"✅ SUCCESS: {self.test_slicing_sorting_concatenate.__doc__}")
+        return
+
+    def test_from_StdLexicalKeys(self):
+        """Bulk decoding of lexical keys matches from_StdLexicalKey key by key."""
+        moments = self.moments() + [
+            UnivMoment.from_geological(66.0, precision=Precision.MILLION_YEARS),
+            UnivMoment.from_julian(-44, 3, 15),
+        ]
+        keys = [moment.to_StdLexicalKey() for moment in moments]
+        # Levels between two precisions map to the coarser precision
+        keys.append(keys[0][:-2] + "04")
+        expected = [UnivMoment.from_StdLexicalKey(key) for key in keys]
+        assert expected[-1].precision == Precision.THOUSAND_YEARS
+        for keys_column in (np.array(keys, dtype='S58'), keys):
+            array = MomentArray.from_StdLexicalKeys(keys_column)
+            assert array.to_moments() == expected
+            assert array.precisions() == [moment.precision for moment in expected]
+        assert len(MomentArray.from_StdLexicalKeys(np.array([], dtype='S58'))) == 0
+        for bad_key in (keys[0][:-1], keys[0].replace("H", "X"), keys[0][:-1] + "a", keys[0] + "0"):
+            with pytest.raises(ValueError):
+                UnivMoment.from_StdLexicalKey(bad_key)
+            with pytest.raises(ValueError):
+                MomentArray.from_StdLexicalKeys([keys[1], bad_key])
+        print(f"✅ SUCCESS: {self.test_from_StdLexicalKeys.__doc__}")
+        return
+
+    def test_present_many(self):
+        """present_many over a MomentArray matches UnivMoment.present_many per moment."""
+        moments = [UnivMoment.from_gregorian(2000, 1, 1, 12, 25, 34), UnivMoment.from_gregorian(1492, 10, 12)]
+        specs = {"iso": (Calendar.GREGORIAN, "%Y-%m-%d"), "julian": (Calendar.JULIAN, "%Y-%m-%d", "UTC", "en")}
+        presented = MomentArray.from_moments(moments).present_many(specs)
+        assert presented == [moment.present_many(specs) for moment in moments]
+        assert presented[1]["julian"] == "1492-10-03"
+        print(f"✅ SUCCESS: {self.test_present_many.__doc__}")
+        return
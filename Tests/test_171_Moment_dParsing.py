@@ -0,0 +1,55 @@
+"""
+Tests for the bulk timestamp parser.
+"""
+import numpy as np
+
+from SPK_UniversalTimestamp.Moment_aUniversal import UnivMoment
+from SPK_UniversalTimestamp.Moment_dParsing import (
+    GRAMMAR_PATTERNS, PARSE_INVALID, PARSE_NO_MATCH, PARSE_OK, parse_chunks, parse_many
+)
+
+LINES = [
+    "2024-01-01T12:00:00.123\n", "34.5BYA", "garbage", "12bc-03-15 23:45:01.123456 OS",
+    "2024-13-01", "5784-1-1 05:30:12 AM", "", "1731-02-11 OS",
+]
+
+
+class TestParsing:
+
+    def test_parse_many(self):
+        """Rows parse as from_string does, with a status and the grammar of each row."""
+        moments, status, grammar = parse_many(LINES, chunk_size=3)
+        assert len(moments) == len(status) == len(grammar) == len(LINES)
+        assert status.tolist() == [
+            PARSE_OK, PARSE_OK, PARSE_NO_MATCH, PARSE_OK, PARSE_INVALID, PARSE_OK, PARSE_NO_MATCH, PARSE_OK
+        ]
+        for ndx, line in enumerate(LINES):
+            if status[ndx] == PARSE_OK:
+                expected = UnivMoment.from_string(line)
+                assert moments[ndx] == expected and moments[ndx].precision == expected.precision, line
+            elif status[ndx] == PARSE_NO_MATCH:
+                assert grammar[ndx] == -1
+        # The invalid row names the grammar that matched: year-month-day
+        assert GRAMMAR_PATTERNS[grammar[4]].startswith(r"([+-]?\d{1,4})-(\d{1,2})-(\d{1,2})")
+        assert [len(result.status) for result in parse_chunks(iter(LINES), chunk_size=3)] == [3, 3, 2]
+        assert len(parse_many([]).moments) == 0
+        # The rows that did not parse read back as the beginning of time
+        beginning = UnivMoment.beginning_of_time()
+        for ndx, moment in enumerate(moments):
+            if status[ndx] != PARSE_OK:
+                assert moment == beginning and moment.precision == beginning.precision
+        assert len(moments.precisions()) == len(LINES)
+        print(f"✅ SUCCESS: {self.test_parse_many.__doc__}")
+        return
+
+    def test_parse_many_processes(self):
+        """The process pool preserves the input order."""
+        lines = LINES * 5
+        serial = parse_many(lines, chunk_size=4)
+        pooled = parse_many(lines, chunk_size=4, processes=2)
+        assert np.array_equal(serial.status, pooled.status)
+        assert np.array_equal(serial.grammar, pooled.grammar)
+        assert np.array_equal(serial.moments.day, pooled.moments.day)
+        assert np.array_equal(serial.moments.attosecond, pooled.moments.attosecond)
+        print(f"✅ SUCCESS: {self.test_parse_many_processes.__doc__}")
+        return
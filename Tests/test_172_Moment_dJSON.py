@@ -0,0 +1,57 @@
+"""
+Tests for the compact JSON and JSON Lines streaming of moments.
+"""
+import io
+import json
+from decimal import Decimal
+
+from SPK_UniversalTimestamp.Constants_aCommon import Precision
+from SPK_UniversalTimestamp.Moment_aUniversal import UnivMoment
+from SPK_UniversalTimestamp.Moment_dJSON import (
+    MomentJSONEncoder, load_ndjson, moment_object_hook, read_ndjson, write_ndjson
+)
+from SPK_UniversalTimestamp.Moment_dMomentArray import MomentArray
+
+
+class TestJSON:
+
+    def moments(self) -> list[UnivMoment]:
+        return [
+            UnivMoment.from_gregorian(2000, 1, 1, 12, 25, Decimal('34.6'), description='millennium "2000"\n'),
+            UnivMoment(Decimal('-5'), (23, 59, Decimal('59.123456789012345678')), Precision.ATTOSECOND),
+            UnivMoment.beginning_of_time(),
+            UnivMoment.from_geological(66.0, precision=Precision.MILLION_YEARS),
+        ]
+
+    def test_ndjson_round_trip(self):
+        """Moments and MomentArrays stream to JSON Lines and back, in batches and chunks."""
+        moments = self.moments()
+        written = io.StringIO()
+        assert write_ndjson(moments, written, batch_size=3) == len(moments)
+        assert written.getvalue().splitlines()[2] == '{"t":null,"p":6}'
+        written.seek(0)
+        assert [len(array) for array in read_ndjson(written, chunk_size=3)] == [3, 1]
+        written.seek(0)
+        array = load_ndjson(written)
+        assert array.to_moments() == moments
+        assert array.precisions() == [moment.precision for moment in moments]
+        assert array.description[0] == moments[0].description
+        # A MomentArray writes the same lines
+        from_array = io.StringIO()
+        write_ndjson(MomentArray.from_moments(moments), from_array, batch_size=2)
+        assert from_array.getvalue() == written.getvalue()
+        print(f"✅ SUCCESS: {self.test_ndjson_round_trip.__doc__}")
+        return
+
+    def test_mixed_documents(self):
+        """The encoder and object hook carry moments inside ordinary JSON documents."""
+        moments = self.moments()
+        document = {"event": moments[0], "range": [moments[1], moments[2]], "other": {"t": 1}}
+        text = json.dumps(document, cls=MomentJSONEncoder)
+        restored = json.loads(text, object_hook=moment_object_hook)
+        assert restored["event"] == moments[0] and restored["event"].description == moments[0].description
+        assert restored["range"] == moments[1:3]
+        assert restored["range"][0].precision == Precision.ATTOSECOND
+        assert restored["other"] == {"t": 1}
+        print(f"✅ SUCCESS: {self.test_mixed_documents.__doc__}")
+        return
@@ -0,0 +1,83 @@
+"""
+Tests for the order preserving binary keys and the SQLite persistence of moments.
+"""
+import sqlite3
+from decimal import Decimal
+
+import pytest
+
+from SPK_UniversalTimestamp.Constants_aCommon import Precision
+from SPK_UniversalTimestamp.Moment_aUniversal import UnivMoment
+from SPK_UniversalTimestamp.Moment_dMomentArray import (
+    BINARY_KEY_LENGTH, MomentArray, moment_from_binary_key, moment_to_binary_key
+)
+from SPK_UniversalTimestamp.Moment_dSQLite import between, create_moment_table, insert_moments, register_sqlite
+
+
+class TestSQLite:
+
+    def moments(self) -> list[UnivMoment]:
+        return [
+            UnivMoment.from_gregorian(2000, 1, 1, 12, 25, Decimal('34.6')),
+            UnivMoment.from_gregorian(2000, 1, 1),
+            UnivMoment(Decimal('-5'), (23, 59, Decimal('59.123456789012345678')), Precision.ATTOSECOND),
+            UnivMoment.beginning_of_time(),
+            UnivMoment.from_gregorian(1999, 12, 31, 23, 59, 59),
+            UnivMoment.from_geological(66.0, precision=Precision.MILLION_YEARS),
+        ]
+
+    def test_binary_keys(self):
+        """Binary keys are 21 bytes, sort as the moments and round trip with their precision."""
+        moments = self.moments()
+        keys = [moment_to_binary_key(moment) for moment in moments]
+        assert {len(key) for key in keys} == {BINARY_KEY_LENGTH}
+        assert [moment_from_binary_key(key) for key in sorted(keys)] == sorted(moments)
+        for moment, key in zip(moments, keys):
+            assert moment_from_binary_key(key).precision == moment.precision
+        array = MomentArray.from_moments(moments)
+        assert array.to_binary_keys().tolist() == keys
+        assert MomentArray.from_binary_keys(keys).to_moments() == moments
+        for bad_key in (keys[0][:-1], keys[0] + b"\x01"):
+            with pytest.raises(ValueError):
+                MomentArray.from_binary_keys([keys[1], bad_key])
+        print(f"✅ SUCCESS: {self.test_binary_keys.__doc__}")
+        return
+
+    def test_between(self):
+        """Range scans return the rows of [start, end) in order, whatever the precision, using the index."""
+        register_sqlite()
+        conn = sqlite3.connect(":memory:", detect_types=sqlite3.PARSE_DECLTYPES)
+        create_moment_table(conn, "events")
+        moments = self.moments()
+        assert insert_moments(conn, "events", moments, map(str, range(len(moments))), batch_size=4) == len(moments)
+        assert insert_moments(conn, "events", MomentArray.from_moments(moments[:2])) == 2
+        start, end = UnivMoment.from_gregorian(1999, 12, 31), UnivMoment.from_gregorian(2000, 1, 1, 12, 25, 34)
+        rows = list(between(conn, "events", start, end))
+        assert rows == [(moments[4], "4"), (moments[1], "1"), (moments[1], None)]
+        plan = " ".join(str(row) for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT payload FROM events WHERE moment >= ? AND moment < ?", (b"", b"")
+        ))
+        assert "USING INDEX events_moment" in plan
+        # The declared MOMENT type converts back to UnivMoment
+        assert conn.execute("SELECT moment FROM events WHERE payload = '2'").fetchone()[0] == moments[2]
+        conn.close()
+        print(f"✅ SUCCESS: {self.test_between.__doc__}")
+        return
+
+    def test_validation(self):
+        """Table and payload type names are validated, and moments and payloads must match in number."""
+        conn = sqlite3.connect(":memory:")
+        create_moment_table(conn, "typed", "VARCHAR(20)")
+        for table, payload_type in (("events; DROP TABLE typed", "TEXT"), ("events", "TEXT); DROP TABLE typed; --")):
+            with pytest.raises(ValueError):
+                create_moment_table(conn, table, payload_type)
+        create_moment_table(conn, "events")
+        moments = self.moments()
+        for payloads in (["0"] * (len(moments) - 1), iter(["0"] * (len(moments) + 1))):
+            with pytest.raises(ValueError):
+                insert_moments(conn, "events", moments, payloads)
+        with pytest.raises(ValueError):
+            insert_moments(conn, "events", iter(moments), iter(["0"]), batch_size=1)
+        conn.close()
+        print(f"✅ SUCCESS: {self.test_validation.__doc__}")
+        return
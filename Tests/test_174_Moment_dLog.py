@@ -0,0 +1,102 @@
+"""
+Tests for the append-only memory-mapped moment log.
+"""
+import os
+import tempfile
+
+import numpy as np
+
+from SPK_UniversalTimestamp.Moment_aUniversal import UnivMoment
+from SPK_UniversalTimestamp.Moment_dLog import MomentLog
+from SPK_UniversalTimestamp.Moment_dMomentArray import MomentArray
+
+
+class TestMomentLog:
+
+    def events(self, count: int) -> tuple[MomentArray, list[bytes]]:
+        rng = np.random.default_rng(2025)
+        # Few distinct seconds, so that equal moments occur
+        moments = MomentArray(
+            rng.integers(730000, 730030, count), rng.integers(0, 4, count) * 3600, np.zeros(count, dtype=int),
+            np.full(count, 12),
+        )
+        return moments, [f"event {ndx}".encode() for ndx in range(count)]
+
+    def expected(self, moments: MomentArray, payloads: list, start: UnivMoment, end: UnivMoment) -> list:
+        events = [(moment, payload) for moment, payload in zip(moments.to_moments(), payloads) if start <= moment < end]
+        return sorted(events, key=lambda event: event[0])
+
+    def test_range(self):
+        """Range queries over sealed, compacted and active segments return the events in order, ties by arrival."""
+        moments, payloads = self.events(5000)
+        start, end = UnivMoment.from_gregorian(1999, 12, 20), UnivMoment.from_gregorian(2000, 1, 3, 2)
+        expected = self.expected(moments, payloads, start, end)
+        with tempfile.TemporaryDirectory() as directory:
+            with MomentLog(directory, segment_records=300, fan_in=3) as log:
+                for ndx in range(0, 4900, 700):
+                    log.extend(moments[ndx:ndx + 700], payloads[ndx:ndx + 700])
+                for ndx in range(4900, 5000):
+                    log.append(moments[ndx], payloads[ndx])
+                assert len(log) == 5000
+                entries = log.range(start, end)
+                assert list(zip(entries.moments.to_moments(), entries.payloads)) == expected
+            # Reopened, the active segment continues; after a full compaction one run is left
+            with MomentLog(directory, segment_records=300, fan_in=3) as log:
+                assert len(log) == 5000
+                assert log.range(start, end).payloads == [payload for _, payload in expected]
+                log.compact()
+                assert len([name for name in os.listdir(directory) if name.endswith(".run.index")]) == 1
+                assert log.range(start, end).payloads == [payload for _, payload in expected]
+        print(f"✅ SUCCESS: {self.test_range.__doc__}")
+        return
+
+    def test_recovery(self):
+        """A partial record and the temporary files of an interrupted merge are dropped on open."""
+        moments, payloads = self.events(10)
+        with tempfile.TemporaryDirectory() as directory:
+            with MomentLog(directory) as log:
+                log.extend(moments, payloads)
+            with open(os.path.join(directory, "00000001.log.index"), "ab") as index:
+                index.write(b"partial")
+            open(os.path.join(directory, "00000001-00000001.run.index.tmp"), "wb").close()
+            with MomentLog(directory) as log:
+                assert len(log) == 10
+                assert "00000001-00000001.run.index.tmp" not in os.listdir(directory)
+                everything = log.range(UnivMoment.from_gregorian(1999, 1, 1), UnivMoment.from_gregorian(2001, 1, 1))
+                assert sorted(everything.payloads) == sorted(payloads)
+        print(f"✅ SUCCESS: {self.test_recovery.__doc__}")
+        return
+
+    def test_recovery_index_past_data(self):
+        """Index records whose payloads did not reach the data file before a crash are dropped on open."""
+        moments, payloads = self.events(10)
+        with tempfile.TemporaryDirectory() as directory:
+            with MomentLog(directory) as log:
+                log.extend(moments, payloads)
+            base = os.path.join(directory, "00000001.log")
+            # The index was written, the last three payloads were not
+            lost = sum(len(payload) for payload in payloads[7:])
+            with open(base + ".data", "r+b") as data:
+                data.truncate(os.path.getsize(base + ".data") - lost)
+            with MomentLog(directory) as log:
+                assert len(log) == 7
+                log.extend(moments[7:], payloads[7:])
+                everything = log.range(UnivMoment.from_gregorian(1999, 1, 1), UnivMoment.from_gregorian(2001, 1, 1))
+                assert sorted(everything.payloads) == sorted(payloads)
+        print(f"✅ SUCCESS: {self.test_recovery_index_past_data.__doc__}")
+        return
+
+    def test_reopen_smaller_segments(self):
+        """A log reopened with fewer segment_records than its active segment holds seals it and appends."""
+        moments, payloads = self.events(10)
+        with tempfile.TemporaryDirectory() as directory:
+            with MomentLog(directory) as log:
+                log.extend(moments, payloads)
+            with MomentLog(directory, segment_records=4) as log:
+                assert "00000001-00000001.run.index" in os.listdir(directory)
+                log.extend(moments, payloads)
+                assert len(log) == 20
+                everything = log.range(UnivMoment.from_gregorian(1999, 1, 1), UnivMoment.from_gregorian(2001, 1, 1))
+                assert sorted(everything.payloads) == sorted(payloads * 2)
+        print(f"✅ SUCCESS: {self.test_reopen_smaller_segments.__doc__}")
+        return
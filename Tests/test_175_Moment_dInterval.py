@@ -0,0 +1,59 @@
+"""
+Tests for the spans of moments at their precision and the overlap index.
+"""
+import random
+from decimal import Decimal
+
+from SPK_UniversalTimestamp.Constants_aCommon import Calendar, Precision
+from SPK_UniversalTimestamp.Moment_aUniversal import UnivMoment
+from SPK_UniversalTimestamp.Moment_dInterval import IntervalIndex, MomentInterval
+from SPK_UniversalTimestamp.Moment_dMomentArray import MomentArray
+
+
+class TestMomentInterval:
+
+    def test_interval(self):
+        """A moment denotes the unit of its precision containing it, years and months in the calendar."""
+        def days(moment, calendar=Calendar.GREGORIAN):
+            span = moment.interval(calendar)
+            assert span.contains(moment)
+            return span.start.rd_moment(), span.end.rd_moment()
+        midnight = (0, 0, Decimal(0))
+        assert days(UnivMoment.from_gregorian(2000)) == ((730120, midnight), (730486, midnight))
+        assert days(UnivMoment.from_gregorian(2000, 12)) == ((730455, midnight), (730486, midnight))
+        assert days(UnivMoment.from_gregorian(2000, 2, 29, 13, 25)) == ((730179, (13, 25, 0)), (730179, (13, 26, 0)))
+        assert days(UnivMoment.from_gregorian(2000, 1, 1, 23, 59, Decimal('59.25'))) == (
+            (730120, (23, 59, 59)), (730121, midnight)
+        )
+        # Hebrew year 5785 runs from 1 Tishri, 3 October 2024, although from_hebrew(5785) is on 1 Nisan
+        assert days(UnivMoment.from_hebrew(5785), Calendar.HEBREW) == (
+            (UnivMoment.from_gregorian(2024, 10, 3).rd_day, midnight), (UnivMoment.from_gregorian(2025, 9, 23).rd_day, midnight)
+        )
+        # There is no Julian year 0
+        assert days(UnivMoment.from_julian(-1), Calendar.JULIAN) == ((-367, midnight), (-1, midnight))
+        start, end = UnivMoment.from_geological(66.0).interval()
+        assert (start.rd_day, end.rd_day) == (-66_000_000 * Decimal('365.25'), -65_000_000 * Decimal('365.25'))
+        assert not UnivMoment.beginning_of_time().interval().contains(UnivMoment.beginning_of_time())
+        print(f"✅ SUCCESS: {self.test_interval.__doc__}")
+        return
+
+    def test_overlapping(self):
+        """The index returns the moments whose spans overlap a span, as a full scan does."""
+        random.seed(2025)
+        moments = []
+        for _ in range(2000):
+            fields = [random.randint(1990, 2010), random.randint(1, 12), random.randint(1, 28), random.randint(0, 23)]
+            moments.append(UnivMoment.from_gregorian(*fields[:random.randint(1, 4)]))
+        spans = [moment.interval() for moment in moments]
+        index = IntervalIndex(MomentArray.from_moments(moments))
+        assert len(index) == len(moments)
+        for _ in range(50):
+            start = UnivMoment.from_gregorian(random.randint(1990, 2010), random.randint(1, 12), random.randint(1, 28), 12)
+            span = MomentInterval(start, start + (Decimal(random.randint(0, 40)), 0, 0, Decimal(0)))
+            expected = [ndx for ndx, other in enumerate(spans) if other.overlaps(span)]
+            assert index.overlapping(span).tolist() == expected
+        # A moment as the query is its span
+        year = UnivMoment.from_gregorian(2000, precision=Precision.YEAR)
+        assert index.overlapping(year).tolist() == [ndx for ndx, other in enumerate(spans) if other.overlaps(year.interval())]
+        print(f"✅ SUCCESS: {self.test_overlapping.__doc__}")
+        return
@@ -0,0 +1,107 @@
+"""
+Tests for the sorted Timeline container.
+"""
+import heapq
+import random
+from decimal import Decimal
+from itertools import count, islice
+
+from SPK_UniversalTimestamp.Constants_aCommon import Calendar, Precision
+from SPK_UniversalTimestamp.Moment_aUniversal import UnivMoment
+from SPK_UniversalTimestamp.Moment_dInterval import calendar_span
+from SPK_UniversalTimestamp.Moment_dMomentArray import MomentArray, moment_to_binary_key
+from SPK_UniversalTimestamp.Moment_dTimeline import Timeline, merge_sorted
+
+
+class TestTimeline:
+
+    def moments(self, count: int) -> list[UnivMoment]:
+        random.seed(2025)
+        moments = []
+        for ndx in range(count):
+            fields = [random.randint(2020, 2026), random.randint(1, 12), random.randint(1, 28), random.randint(0, 23)]
+            moments.append(UnivMoment.from_gregorian(*fields[:random.randint(1, 4)], description=str(ndx)))
+        return moments
+
+    def test_order(self):
+        """Adds, bulk updates and merges keep the moments sorted, equal keys in order of insertion, both ways."""
+        moments = self.moments(3000)
+        timeline = Timeline(load=16)
+        for moment in moments[:1000]:
+            timeline.add(moment)
+        timeline.update(moments[1000:2000])
+        merged = timeline.merge(Timeline(MomentArray.from_moments(moments[2000:]), load=16))
+        expected = sorted(moments, key=moment_to_binary_key)
+        assert len(merged) == len(moments)
+        assert [moment.description for moment in merged] == [moment.description for moment in expected]
+        assert [moment.description for moment in reversed(merged)] == [moment.description for moment in expected][::-1]
+        assert moments[7] in merged and UnivMoment.from_gregorian(1900) not in merged
+        print(f"✅ SUCCESS: {self.test_order.__doc__}")
+        return
+
+    def test_range(self):
+        """Range queries by moments and by calendar dates return the moments of the span in either direction."""
+        moments = self.moments(3000)
+        timeline = Timeline(moments, load=16)
+        ordered = list(timeline)
+        start, end = UnivMoment.from_gregorian(2022, 3, 1, 12), UnivMoment.from_gregorian(2023, 7)
+        expected = [moment for moment in ordered if start <= moment < end]
+        assert list(timeline.range(start, end)) == expected
+        assert list(timeline.range(start, end, reverse=True)) == expected[::-1]
+        assert list(timeline.range(end)) == [moment for moment in ordered if moment >= end]
+        # The Hebrew year 5785 runs from 3 October 2024 to 22 September 2025
+        hebrew = list(timeline.in_calendar(Calendar.HEBREW, 5785))
+        assert hebrew == [
+            moment for moment in ordered
+            if UnivMoment.from_gregorian(2024, 10, 3) <= moment < UnivMoment.from_gregorian(2025, 9, 23)
+        ]
+        # The Chinese year 42 of cycle 78 starts on 29 January 2025
+        chinese = calendar_span(Calendar.CHINESE, 78, 42)
+        assert chinese.start == UnivMoment.from_gregorian(2025, 1, 29) and chinese.start.precision == Precision.YEAR
+        assert list(timeline.in_calendar(Calendar.CHINESE, 78, 42, reverse=True)) == [
+            moment for moment in reversed(ordered) if chinese.start <= moment < chinese.end
+        ]
+        assert list(timeline.during(UnivMoment.from_gregorian(2021, 2))) == [
+            moment for moment in ordered if UnivMoment.from_gregorian(2021, 2) <= moment < UnivMoment.from_gregorian(2021, 3)
+        ]
+        print(f"✅ SUCCESS: {self.test_range.__doc__}")
+        return
+
+    def test_merge_sorted(self):
+        """Sorted streams merge lazily as heapq.merge does, optionally dropping the duplicates of a precision."""
+        moments = self.moments(3000)
+        feeds = [sorted(moments[ndx::3]) for ndx in range(3)]
+        merged = list(merge_sorted(*feeds))
+        assert [moment.description for moment in merged] == [moment.description for moment in heapq.merge(*feeds)]
+        # Unbounded generators are consumed lazily
+        def hours(hour):
+            for day in count(1):
+                yield UnivMoment(Decimal(day), (hour, 0, Decimal(0)), Precision.HOUR)
+        first = list(islice(merge_sorted(hours(6), hours(18), iter([UnivMoment.beginning_of_time()])), 5))
+        assert [moment.rd_moment() for moment in first[1:]] == [
+            (1, (6, 0, 0)), (1, (18, 0, 0)), (2, (6, 0, 0)), (2, (18, 0, 0))
+        ]
+        # Only moments of the same precision and span are duplicates, a YEAR moment keeps the days within it
+        feed_a = [
+            UnivMoment.from_gregorian(2020),
+            UnivMoment.from_gregorian(2024, 1, 1, 12, 0, 0),
+            UnivMoment.from_gregorian(2024, 1, 2),
+        ]
+        feed_b = [
+            UnivMoment.from_gregorian(2020, 5, 5),
+            UnivMoment.from_gregorian(2020, 11, 30),
+            UnivMoment.from_gregorian(2024, 1, 1, 12, 0, 0),
+            UnivMoment.from_gregorian(2024, 1, 1, 12, 0, Decimal('0.123'), precision=Precision.MILLISECOND),
+            UnivMoment.from_gregorian(2024, 1, 2),
+            UnivMoment.from_gregorian(2024, 1, 2, 8),
+        ]
+        kept = list(merge_sorted(feed_a, feed_b, dedup_within_precision=True))
+        assert kept == [feed_a[0], feed_b[0], feed_b[1], feed_a[1], feed_b[3], feed_a[2], feed_b[5]]
+        assert kept[3] is feed_a[1] and kept[5] is feed_a[2]
+        # Distinct moments are all kept, whatever their precisions
+        distinct = {(moment.rd_moment(), moment.precision): moment for moment in moments}
+        distinct_feeds = [sorted(list(distinct.values())[ndx::4]) for ndx in range(4)]
+        assert len(list(merge_sorted(*distinct_feeds, dedup_within_precision=True))) == len(distinct)
+        assert len(list(merge_sorted(*distinct_feeds, *distinct_feeds, dedup_within_precision=True))) == len(distinct)
+        print(f"✅ SUCCESS: {self.test_merge_sorted.__doc__}")
+        return
@@ -8,7 +8,7 @@ from decimal import Decimal, ROUND_FLOOR
 
 from SPK_UniversalTimestamp.CC02_Gregorian import gregorian_from_rd
 from SPK_UniversalTimestamp.CC14_Time_and_Astronomy import ephemeris_correction, equation_of_time, dynamical_from_universal
-from SPK_UniversalTimestamp.CC14_Time_and_Astronomy import solar_longitude, solar_longitude_after, dms_from_degrees
+from SPK_UniversalTimestamp.CC14_Time_and_Astronomy import solar_longitude, solar_longitude_after, dms_from_degrees, lunar_longitude
 from SPK_UniversalTimestamp.CC14_Time_and_Astronomy import hms_from_hours, universal_from_local, degrees_from_dms
 from SPK_UniversalTimestamp.CC14_Time_and_Astronomy import AST, standard_from_local, location, direction
 #from .PolynomialRegression import polynomial_regression
@@ -413,3 +413,23 @@ class TestTimeAndAstronomy:
         assert errors==0, f"❌ solar_longitude_after test failed. {errors} errors found."
         return
     
+
+    def test_RandD_Appendix_C_lunar_longitude(self):
+        print("Testing Moon-Longitude-Degree values from Reingold & Dershowitz, 'Calendrical Calculations', 4th Ed., Appendix C Lunisolar Table")
+        errors = 0
+        for entry in self.lunisolar_table:
+            rd = entry['RD']
+            expected = Decimal(entry['Moon-Longitude-Degree'])
+            calculated = lunar_longitude(Decimal(rd))
+            error = abs(calculated - expected)
+            error = min(error, 360 - error)
+            print(f"RD: {rd:9d} calculated: {calculated:.6f}")
+            print(f"    {' ':9} expected:   {expected:.6f}, error: {error:.6f}")
+            if error < Decimal('0.000_01'):
+                print ("    ✅ Test passed")
+            else:
+                print ("    ❌ Test failed")
+                errors += 1
+
+        assert errors==0, f"❌ Lunar Longitude test failed. {errors} errors found."
+        return
@@ -0,0 +1,81 @@
+"""
+Tests for the NumPy vectorized astronomy functions.
+"""
+from decimal import Decimal
+
+import numpy as np
+
+from SPK_UniversalTimestamp.CC02_Gregorian import gregorian_new_year, gregorian_year_from_rd
+from SPK_UniversalTimestamp.CC14_Time_and_Astronomy import (
+    ephemeris_correction, ephemeris_correction_for_year, solar_longitude, lunar_longitude, lunar_phase, nth_new_moon
+)
+from SPK_UniversalTimestamp.CC14_Astronomy_Arrays import (
+    ephemeris_correction_array, gregorian_year_from_rd_array,
+    solar_longitude_array, lunar_longitude_array, lunar_phase_array, nth_new_moon_array
+)
+
+
+def angular_difference(a, b) -> float:
+    d = abs(float(a) - float(b)) % 360
+    return min(d, 360 - d)
+
+
+class TestAstronomyArrays:
+
+    def test_gregorian_year_from_rd_array(self):
+        """Vectorized Gregorian year matches the scalar function."""
+        rds = list(range(-800_000, 900_000, 997)) + [0, 1, 730120, gregorian_new_year(2000) - 1]
+        years = gregorian_year_from_rd_array(rds)
+        for rd, year in zip(rds, years):
+            assert int(year) == gregorian_year_from_rd(rd), f"R.D. {rd}"
+        print(f"✅ SUCCESS: {self.test_gregorian_year_from_rd_array.__doc__}")
+        return
+
+    def test_ephemeris_correction_table(self):
+        """Tabulated ΔT matches the per-year polynomial branches, including the table edges."""
+        for year in [-1000, -501, -500, -499, 0, 499, 500, 1599, 1600, 1799, 1800, 1899, 1900, 1986, 1987, 2005, 2006, 2050, 2051, 2150, 2151, 3000]:
+            for rd in (gregorian_new_year(year), gregorian_new_year(year + 1) - 1, Decimal(gregorian_new_year(year)) + Decimal('0.75')):
+                assert ephemeris_correction(rd) == ephemeris_correction_for_year(year), f"Year {year} R.D. {rd}"
+        print(f"✅ SUCCESS: {self.test_ephemeris_correction_table.__doc__}")
+        return
+
+    def test_ephemeris_correction_array(self):
+        """Vectorized ΔT agrees with the scalar function, stepwise and interpolated."""
+        rds = np.arange(gregorian_new_year(-700), gregorian_new_year(2300), 1234.5)
+        stepwise = ephemeris_correction_array(rds)
+        interpolated = ephemeris_correction_array(rds, interpolate=True)
+        for rd, step, interp in zip(rds, stepwise, interpolated):
+            expected = float(ephemeris_correction(Decimal(str(rd))))
+            assert abs(step - expected) < 1e-12, f"R.D. {rd}"
+            # Interpolation stays within one year's change of the yearly value
+            year = gregorian_year_from_rd(int(np.floor(rd)))
+            bound = max(
+                abs(ephemeris_correction_for_year(year + 1) - ephemeris_correction_for_year(year)),
+                abs(ephemeris_correction_for_year(year) - ephemeris_correction_for_year(year - 1)),
+            )
+            assert abs(interp - expected) <= float(bound) + 1e-12, f"R.D. {rd}"
+        print(f"✅ SUCCESS: {self.test_ephemeris_correction_array.__doc__}")
+        return
+
+    def test_longitudes_and_phase_array(self):
+        """Vectorized solar longitude, lunar longitude and lunar phase agree with the scalar functions."""
+        rds = [-200000, -7140.25, 0, 1, 365242.5, 710347.125, 730120.5, 738000, 740000.75, 900000]
+        solar = solar_longitude_array(rds)
+        lunar = lunar_longitude_array(rds)
+        phase = lunar_phase_array(rds)
+        for ndx, rd in enumerate(rds):
+            moment = Decimal(str(rd))
+            assert angular_difference(solar[ndx], solar_longitude(moment)) < 1e-8, f"solar R.D. {rd}"
+            assert angular_difference(lunar[ndx], lunar_longitude(moment)) < 1e-8, f"lunar R.D. {rd}"
+            assert angular_difference(phase[ndx], lunar_phase(moment)) < 1e-8, f"phase R.D. {rd}"
+        print(f"✅ SUCCESS: {self.test_longitudes_and_phase_array.__doc__}")
+        return
+
+    def test_nth_new_moon_array(self):
+        """Vectorized n-th new moon agrees with the scalar function."""
+        ns = list(range(-20000, 30000, 997)) + [0, 24724]
+        moments = nth_new_moon_array(ns)
+        for n, moment in zip(ns, moments):
+            assert abs(moment - float(nth_new_moon(n))) < 1e-8, f"n = {n}"
+        print(f"✅ SUCCESS: {self.test_nth_new_moon_array.__doc__}")
+        return
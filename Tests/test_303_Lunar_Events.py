@@ -0,0 +1,63 @@
+"""
+Tests for the lunar phase event generator.
+"""
+from decimal import Decimal
+
+from SPK_UniversalTimestamp.CC00_Decimal_library import mod
+from SPK_UniversalTimestamp.CC14_Time_and_Astronomy import (
+    lunar_phase, lunar_phase_at_or_after, lunar_phase_events, new_moon_at_or_after, first_quarter, full
+)
+from SPK_UniversalTimestamp.Constants_aCommon import Calendar, Precision
+from SPK_UniversalTimestamp.Moment_aUniversal import UnivMoment
+from SPK_UniversalTimestamp.Moment_dAstronomy import lunar_events
+
+
+class TestLunarEvents:
+
+    def test_lunar_phase_events(self):
+        """Events are in order, cycle through the phases and sit on the requested phase."""
+        start, end = Decimal(738000), Decimal(738120)
+        events = list(lunar_phase_events(start, end))
+        assert len(events) == 16
+        assert all(start <= t < end for t, _ in events)
+        assert all(a[0] < b[0] for a, b in zip(events, events[1:]))
+        for (_, phi), (_, next_phi) in zip(events, events[1:]):
+            assert mod(next_phi - phi, Decimal(360)) == 90
+        for t, phi in events:
+            if phi == 0:
+                assert t == new_moon_at_or_after(t - Decimal('0.5'))
+            else:
+                assert abs(lunar_phase(t) - phi) < Decimal('1e-4'), f"R.D. {t} phase {phi}"
+        print(f"✅ SUCCESS: {self.test_lunar_phase_events.__doc__}")
+        return
+
+    def test_lunar_phase_at_or_after(self):
+        """The generator and the single search agree."""
+        events = list(lunar_phase_events(Decimal(730120), Decimal(730150), phases=(full(),)))
+        assert len(events) == 1
+        t = lunar_phase_at_or_after(full(), Decimal(730120))
+        assert abs(t - events[0][0]) < Decimal('1e-5')
+        assert lunar_phase_at_or_after(first_quarter(), t) > t
+        print(f"✅ SUCCESS: {self.test_lunar_phase_at_or_after.__doc__}")
+        return
+
+    def test_lunar_events(self):
+        """Lunar events of January 2024 as UnivMoments, within two minutes of the published times."""
+        start = UnivMoment.from_gregorian(2024, 1, 1)
+        end = UnivMoment.from_gregorian(2024, 2, 1)
+        expected = [
+            ((2024, 1, 4, 3, 30), "Last Quarter"),
+            ((2024, 1, 11, 11, 57), "New Moon"),
+            ((2024, 1, 18, 3, 53), "First Quarter"),
+            ((2024, 1, 25, 17, 54), "Full Moon"),
+        ]
+        events = list(lunar_events(start, end))
+        assert len(events) == len(expected)
+        for moment, (ymdhm, description) in zip(events, expected):
+            assert moment.description == description
+            assert moment.precision == Precision.SECOND
+            published = UnivMoment.from_gregorian(*ymdhm)
+            assert abs(moment.to_rd_moment() - published.to_rd_moment()) < Decimal(2) / 1440, \
+                f"{description} {moment.present(Calendar.GREGORIAN, '%Y-%m-%d %H:%M:%S')}"
+        print(f"✅ SUCCESS: {self.test_lunar_events.__doc__}")
+        return
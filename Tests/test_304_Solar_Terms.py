@@ -0,0 +1,51 @@
+"""
+Tests for the solar term generator.
+"""
+from decimal import Decimal
+
+from SPK_UniversalTimestamp.CC00_Decimal_library import mod
+from SPK_UniversalTimestamp.CC14_Time_and_Astronomy import solar_longitude, solar_longitude_events, solar_longitude_after
+from SPK_UniversalTimestamp.Constants_aCommon import Precision
+from SPK_UniversalTimestamp.Moment_aUniversal import UnivMoment
+from SPK_UniversalTimestamp.Moment_dAstronomy import solar_terms
+from SPK_UniversalTimestamp.Moment_dMomentArray import MomentArray
+
+
+class TestSolarTerms:
+
+    def test_solar_longitude_events(self):
+        """Crossings are in order, 15 degrees apart and sit on the requested longitude."""
+        start, end = Decimal(738000), Decimal(738400)
+        events = list(solar_longitude_events(start, end))
+        assert 26 <= len(events) <= 27
+        assert all(start <= t < end for t, _ in events)
+        for (t, _lambda), (next_t, next_lambda) in zip(events, events[1:]):
+            assert t < next_t
+            assert mod(next_lambda - _lambda, Decimal(360)) == 15
+        for t, _lambda in events:
+            error = abs(solar_longitude(t) - _lambda)
+            assert min(error, 360 - error) < Decimal('1e-5'), f"R.D. {t} longitude {_lambda}"
+        # The solver agrees with the existing single search, which stops at a 0.01 day step
+        t, _lambda = events[0]
+        assert abs(solar_longitude_after(_lambda, start) - t) < Decimal('0.01')
+        print(f"✅ SUCCESS: {self.test_solar_longitude_events.__doc__}")
+        return
+
+    def test_solar_terms(self):
+        """24 solar terms per Gregorian year, in order, with names; the process pool gives the same result."""
+        terms = solar_terms(range(2023, 2025), block_size=1)
+        assert isinstance(terms, MomentArray)
+        assert len(terms) == 48
+        moments = terms.to_moments()
+        assert moments == sorted(moments)
+        assert moments[0].description == "Slight Cold"
+        assert moments[-1].description == "Winter Solstice"
+        equinox = [m for m in moments if m.description == "Spring Equinox"][1]
+        published = UnivMoment.from_gregorian(2024, 3, 20, 3, 6)
+        assert abs(equinox.to_rd_moment() - published.to_rd_moment()) < Decimal(5) / 1440
+        assert all(m.precision == Precision.SECOND for m in moments)
+
+        pooled = solar_terms(range(2023, 2025), processes=2, block_size=1)
+        assert pooled.to_moments() == moments
+        print(f"✅ SUCCESS: {self.test_solar_terms.__doc__}")
+        return
@@ -4,6 +4,7 @@ Comprehensive tests for the Moment_Chinese class.
 import os
 import json
 
+from SPK_UniversalTimestamp.CC19_Chinese_1645 import chinese_from_rd, rd_from_chinese
 from SPK_UniversalTimestamp.Constants_aCommon import Calendar, Precision
 from SPK_UniversalTimestamp.Constants_Chinese import chinese_MONTH_ATTS
 from SPK_UniversalTimestamp.Moment_aUniversal import UnivMoment
@@ -152,3 +153,21 @@ class Test_Moment_Chinese:
         else:
             print("✅ All presentation tests in Appendix C passed successfully!")
         return
+
+
+class Test_Chinese_Partial_Dates:
+    """Chinese dates without a month or day."""
+
+    def test_from_chinese_year_and_month(self):
+        """A Chinese year starts on its new year and a month on its first day."""
+        year = UnivMoment.from_chinese(78, 42)
+        assert year.precision == Precision.YEAR
+        assert year.rd_day == UnivMoment.from_chinese(78, 42, 1, 1).rd_day
+        assert chinese_from_rd(year.rd_day) == (78, 42, 1, False, 1)
+        month = UnivMoment.from_chinese(78, 42, 5)
+        assert month.precision == Precision.MONTH
+        assert month.rd_day == UnivMoment.from_chinese(78, 42, 5, 1).rd_day
+        assert chinese_from_rd(month.rd_day) == (78, 42, 5, False, 1)
+        assert rd_from_chinese(78, 42, None, False, None) == year.rd_day
+        print(f"✅ SUCCESS: {self.test_from_chinese_year_and_month.__doc__}")
+        return
@@ -168,3 +168,108 @@ class TestUniversalTimestamp:
         
         print(f"✅ SUCCESS: {inspect.currentframe().f_code.co_name}")
         return
+
+    def test_from_string_dispatch(self):
+        """One combined regex dispatches to the same converter as trying the patterns in order."""
+        import re
+        def parse_in_order(timestamp_str):
+            for pattern, converter in UnivMoment._ALL_PATTERNS:
+                match = re.fullmatch(pattern, timestamp_str.strip())
+                if match:
+                    try:
+                        return converter(match)
+                    except Exception:
+                        continue
+            return None
+        for timestamp_str in (
+            "2024-01-01T12:00:00.123", "2024-01-01 12:00:00.123", "3.25KYA", "12 MYA", "5784 AM", "5784-7 AM",
+            "5784-7-3 AM", "1731-02-11 OS", "1731-02 JC", "12bc-3-4 OS", "44 BCE-3", "44BCE-3-15", "-44-3-15",
+            "+2024-02", "2024", "2024-13-01", "2024-02-30", "2024-1-1 25:00", "  2024-06-30  ", "garbage",
+        ):
+            expected = parse_in_order(timestamp_str)
+            moment = UnivMoment.from_string(timestamp_str)
+            if expected is None:
+                assert moment is None, timestamp_str
+            else:
+                assert moment == expected and moment.precision == expected.precision, timestamp_str
+        print(f"✅ SUCCESS: {inspect.currentframe().f_code.co_name}")
+        return
+
+    def test_iso_8601_fast_path(self):
+        """ISO 8601 calendar, week and ordinal dates with times, fractions and offsets."""
+        cases = {
+            "20240229": UnivMoment.from_gregorian(2024, 2, 29),
+            "2024-060": UnivMoment.from_gregorian(2024, 2, 29),
+            "2020-W53-7": UnivMoment.from_gregorian(2021, 1, 3),
+            "2009W011": UnivMoment.from_gregorian(2008, 12, 29),
+            "2021-W01": UnivMoment.from_gregorian(2021, 1, 4),
+            "2024-01-01T12": UnivMoment.from_gregorian(2024, 1, 1, 12),
+            "20240101T1230": UnivMoment.from_gregorian(2024, 1, 1, 12, 30),
+            "2024-01-01T12:30:45Z": UnivMoment.from_gregorian(2024, 1, 1, 12, 30, 45),
+            "2024-01-01T12:30:45+05:30": UnivMoment.from_gregorian(2024, 1, 1, 7, 0, 45),
+            "2024-01-01T00:30:00+01": UnivMoment.from_gregorian(2023, 12, 31, 23, 30, 0),
+            "2024-01-01T02:30:45,5-0330": UnivMoment.from_gregorian(
+                2024, 1, 1, 6, 0, Decimal("45.5"), precision=Precision.MILLISECOND
+            ),
+            "2024-01-01T12:30:45.123456789012345678Z": UnivMoment.from_gregorian(
+                2024, 1, 1, 12, 30, Decimal("45.123456789012345678"), precision=Precision.ATTOSECOND
+            ),
+        }
+        for timestamp_str, expected in cases.items():
+            moment = UnivMoment.from_string(timestamp_str)
+            assert moment == expected and moment.precision == expected.precision, timestamp_str
+        assert UnivMoment._parse("2024-01-01T12:00:00")[1] == UnivMoment.ISO_8601_GRAMMAR
+        for timestamp_str in ("2023-366", "2021-W53", "2024-W01-8", "2024-01-01T25", "2024-01-01T12:3", "2024-01T12"):
+            assert UnivMoment.from_string(timestamp_str) is None, timestamp_str
+        print(f"✅ SUCCESS: {inspect.currentframe().f_code.co_name}")
+        return
+
+    def test_lazy_package_imports(self):
+        import importlib
+        import subprocess
+        import sys
+        import SPK_UniversalTimestamp
+        # Every public name resolves, and resolves to the object of its defining module
+        for name in SPK_UniversalTimestamp.__all__:
+            assert getattr(SPK_UniversalTimestamp, name) is not None, name
+        assert SPK_UniversalTimestamp.UnivMoment is UnivMoment
+        assert SPK_UniversalTimestamp.Precision is Precision
+        assert "solar_terms" in dir(SPK_UniversalTimestamp)
+        try:
+            SPK_UniversalTimestamp.no_such_name
+            assert False, "Expected AttributeError for an unknown name"
+        except AttributeError:
+            pass
+        # A fresh interpreter importing the package loads none of the heavy dependencies
+        code = (
+            "import sys, SPK_UniversalTimestamp; from SPK_UniversalTimestamp import UnivMoment; "
+            "print(','.join(m for m in ('numpy', 'pyproj', 'shapely', 'langcodes') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == ""
+        # An unknown name fails without importing any submodule
+        code = (
+            "import sys, SPK_UniversalTimestamp; print(hasattr(SPK_UniversalTimestamp, 'no_such_name'), "
+            "','.join(m for m in ('numpy', 'pyproj', 'shapely', 'SPK_UniversalTimestamp.Moment_aUniversal') "
+            "if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
+        # The static table lists the public names defined by the star exported submodules
+        exported = set(SPK_UniversalTimestamp._LAZY_MODULES)
+        for module in SPK_UniversalTimestamp._LAZY_STAR_MODULES:
+            module = importlib.import_module(f"SPK_UniversalTimestamp.{module}")
+            defined = {
+                name for name, value in vars(module).items()
+                if not name.startswith("_") and not inspect.ismodule(value)
+                and getattr(value, "__module__", module.__name__) == module.__name__
+            }
+            defined |= set(getattr(module, "GEOLOGICAL_TABLE_NAMES", ()))
+            # Imported constants and the loop variables of Constants_Chinese are not exported
+            assert defined - exported <= {"ROUND_DOWN", "i", "tu"}, module.__name__
+        # The Decimal precision is set by the package import, before any submodule is loaded
+        code = "import decimal, SPK_UniversalTimestamp; print(decimal.getcontext().prec)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "50"
+        print(f"✅ SUCCESS: {inspect.currentframe().f_code.co_name}")
+        return